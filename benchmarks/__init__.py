@@ -0,0 +1,35 @@
+"""
+Micro-benchmarks for the CDM library.
+
+Each module in this package can be run from the repository root, e.g.,
+
+    python -m benchmarks.codec_loads
+
+Results are printed as a table and are only meaningful relative to each other
+on the same machine.
+"""
+import timeit
+from typing import Callable
+
+
+def best_of(fn: Callable[[], object], number: int = 200, repeat: int = 5):
+    """
+    Return the best mean time per call of fn, in microseconds.
+    """
+    timings = timeit.repeat(fn, number=number, repeat=repeat)
+    return min(timings) / number * 1e6
+
+
+def print_table(header: tuple[str, ...], rows: list[tuple]) -> None:
+    """
+    Print rows as a simple fixed-width table.
+    """
+    widths = [
+        max(len(str(cell)) for cell in column) for column in zip(header, *rows)
+    ]
+    for row in (header, *rows):
+        print(
+            "  ".join(
+                str(cell).rjust(width) for cell, width in zip(row, widths)
+            )
+        )
@@ -0,0 +1,76 @@
+"""
+Compare serialising many PointingConfigurations with FK5 targets, each
+target converted to ICRS as it is serialised, against converting all the
+targets together first with convert_targets(), as Codec.dumps_many does.
+
+Every target has distinct coordinates, and the conversion caches are
+cleared before each run, as for the pointings of a new survey.
+"""
+import warnings
+
+from ska_tmc_cdm.messages.subarray_node.configure import core
+from ska_tmc_cdm.messages.subarray_node.configure.core import (
+    FK5Target,
+    PointingConfiguration,
+    convert_targets,
+)
+
+from . import best_of, print_table
+
+
+def _pointings(count: int) -> list[PointingConfiguration]:
+    return [
+        PointingConfiguration(
+            target=FK5Target(
+                ra=(n * 24.0 / count) % 24.0, dec=-80.0 + n * 160.0 / count
+            )
+        )
+        for n in range(count)
+    ]
+
+
+def _clear(pointings: list[PointingConfiguration]) -> None:
+    core._sky_coord.cache_clear()
+    core._icrs_hmsdms.cache_clear()
+    for pointing in pointings:
+        try:
+            object.__delattr__(pointing.target, "_derived")
+        except AttributeError:
+            pass
+
+
+def main():
+    warnings.simplefilter("ignore")
+    rows = []
+    for count in (10, 100, 1000, 5000):
+        pointings = _pointings(count)
+
+        def one_at_a_time():
+            _clear(pointings)
+            for pointing in pointings:
+                pointing.model_dump_json(exclude_none=True)
+
+        def together():
+            _clear(pointings)
+            convert_targets(pointings)
+            for pointing in pointings:
+                pointing.model_dump_json(exclude_none=True)
+
+        single = best_of(one_at_a_time, number=1, repeat=3) / count
+        batch = best_of(together, number=1, repeat=3) / count
+        rows.append(
+            (count, f"{single:.0f}", f"{batch:.0f}", f"{single / batch:.0f}x")
+        )
+    print_table(
+        (
+            "targets",
+            "one at a time (us/target)",
+            "together (us/target)",
+            "speedup",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
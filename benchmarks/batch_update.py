@@ -0,0 +1,78 @@
+"""
+Compare assigning several fields of a CDM object one at a time, each
+validated on assignment, against assigning them in
+CdmObject.batch_update(), validated once on exit.
+"""
+import warnings
+
+from ska_tmc_cdm.messages.subarray_node.configure.core import ReceiverBand
+from ska_tmc_cdm.messages.subarray_node.configure.csp import (
+    CommonConfiguration,
+)
+
+from . import best_of, print_table
+from .fixtures import VALID_LOW_CONFIGURE_OBJECT_4_0
+
+
+def _assign(obj, changes: dict, batch: bool):
+    if batch:
+        with obj.batch_update():
+            for name, value in changes.items():
+                setattr(obj, name, value)
+    else:
+        for name, value in changes.items():
+            setattr(obj, name, value)
+
+
+def main():
+    warnings.simplefilter("ignore")
+    pst_scan = VALID_LOW_CONFIGURE_OBJECT_4_0.csp.pst_config.beams[0].scan
+    pst_changes = {
+        "activation_time": "2022-01-19T23:07:46Z",
+        "bits_per_sample": 16,
+        "udp_nsamp": 16,
+        "wt_nsamp": 16,
+        "udp_nchan": 12,
+        "num_frequency_channels": 216,
+        "centre_frequency": 100000000.0,
+        "total_bandwidth": 781250.0,
+        "source": "J0437-4715",
+        "pointing_id": "pointing2",
+    }
+    common = CommonConfiguration(
+        config_id="config", frequency_band=ReceiverBand.BAND_1
+    )
+    cases = (
+        ("PSTScanConfiguration", pst_scan, pst_changes),
+        (
+            "CommonConfiguration",
+            common,
+            {"frequency_band": ReceiverBand.BAND_2, "config_id": "changed"},
+        ),
+    )
+
+    rows = []
+    for name, obj, changes in cases:
+        one_at_a_time = best_of(
+            lambda: _assign(obj.model_copy(), changes, batch=False)
+        )
+        batched = best_of(
+            lambda: _assign(obj.model_copy(), changes, batch=True)
+        )
+        rows.append(
+            (
+                name,
+                len(changes),
+                f"{one_at_a_time:.1f}",
+                f"{batched:.1f}",
+                f"{one_at_a_time / batched:.1f}x",
+            )
+        )
+    print_table(
+        ("class", "fields", "one at a time (us)", "batched (us)", "speedup"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Compare the default Codec.loads path, which validates a re-serialised copy of
+the new object, with the single_parse path, which parses the input once and
+validates it as received.
+
+Telescope Model validation is replaced by a no-op so that the numbers show the
+Codec overhead that single_parse removes, not schema validation time.
+"""
+from unittest.mock import patch
+
+from ska_tmc_cdm.schemas import CODEC
+
+from . import best_of, print_table
+from .fixtures import example_messages
+
+
+def main():
+    rows = []
+    with patch.object(type(CODEC), "_telmodel_validation"):
+        for cls, json_str in example_messages():
+            default = best_of(lambda: CODEC.loads(cls, json_str))
+            single = best_of(
+                lambda: CODEC.loads(cls, json_str, single_parse=True)
+            )
+            rows.append(
+                (
+                    cls.__name__,
+                    len(json_str),
+                    f"{default:.1f}",
+                    f"{single:.1f}",
+                    f"{(1 - single / default) * 100:.0f}%",
+                )
+            )
+    print_table(
+        ("class", "bytes", "default (us)", "single_parse (us)", "saving"), rows
+    )
+
+
+if __name__ == "__main__":
+    main()
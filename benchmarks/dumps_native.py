@@ -0,0 +1,67 @@
+"""
+Compare the throughput of Codec.dumps, model_dump_json and the
+pydantic-core fast path (Codec.dumps with native=True) over every CDM
+object defined in the serialisation tests.
+
+Telescope Model validation is disabled so only serialisation is measured.
+"""
+import timeit
+import warnings
+
+from ska_tmc_cdm.messages.serialization import dump_json
+from ska_tmc_cdm.schemas import CODEC
+
+from . import print_table
+from .fixtures import example_objects
+from .serialize_plan import TREES
+
+
+def throughput(fn, objs, repeat=5) -> float:
+    """
+    Return the best throughput of fn over objs, in objects per second.
+    """
+    best = min(
+        timeit.repeat(
+            lambda: [fn(obj) for obj in objs], number=10, repeat=repeat
+        )
+    )
+    return 10 * len(objs) / best
+
+
+def main():
+    warnings.simplefilter("ignore")
+    approaches = {
+        "Codec.dumps": lambda obj: CODEC.dumps(obj, validate=False),
+        "model_dump_json": lambda obj: obj.model_dump_json(
+            exclude_none=True, by_alias=True
+        ),
+        "native": lambda obj: CODEC.dumps(obj, validate=False, native=True),
+        "dump_json": dump_json,
+    }
+    workloads = {"all fixtures": list(example_objects().values())}
+    workloads.update({name: [obj] for name, obj in TREES.items()})
+
+    rows = []
+    for workload, objs in workloads.items():
+        rates = {name: throughput(fn, objs) for name, fn in approaches.items()}
+        rows.append(
+            (
+                workload,
+                len(objs),
+                *(f"{rate:.0f}" for rate in rates.values()),
+                f"{rates['native'] / rates['Codec.dumps']:.1f}x",
+            )
+        )
+    print_table(
+        (
+            "workload",
+            "objects",
+            *(f"{name} (/s)" for name in approaches),
+            "native speedup",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Compare CdmObject.fingerprint() against hashing the serialised JSON, for the
+largest CDM object of each class defined in the serialisation tests.
+
+"cold" fingerprints are computed from scratch on a fresh copy. "warm" ones
+follow a change to one leaf, so only the path from that leaf to the root is
+recomputed. "cached" ones follow no change at all.
+"""
+import hashlib
+import warnings
+
+from ska_tmc_cdm import CdmObject
+from ska_tmc_cdm.messages.base import _forget_fingerprint
+
+from . import best_of, print_table
+from .fixtures import example_objects
+
+
+def _last_leaf(obj: CdmObject) -> CdmObject:
+    for value in reversed(obj.__dict__.values()):
+        if isinstance(value, list) and value:
+            value = value[-1]
+        if isinstance(value, CdmObject):
+            return _last_leaf(value)
+    return obj
+
+
+def main():
+    warnings.simplefilter("ignore")
+    largest = {}
+    for obj in example_objects().values():
+        size = len(obj.model_dump_json())
+        if size > largest.get(type(obj), (0, None))[0]:
+            largest[type(obj)] = (size, obj)
+
+    rows = []
+    for cls, (size, obj) in sorted(
+        largest.items(), key=lambda item: -item[1][0]
+    )[:8]:
+        copies = iter([obj.model_copy(deep=True) for _ in range(1000)])
+        json_hash = best_of(
+            lambda: hashlib.blake2b(
+                obj.model_dump_json(exclude_none=True, by_alias=True).encode(),
+                digest_size=16,
+            ).hexdigest(),
+            number=100,
+        )
+        cold = best_of(
+            lambda: next(copies).fingerprint(), number=100, repeat=5
+        )
+        tree = obj.model_copy(deep=True)
+        leaf = _last_leaf(tree)
+
+        def change_and_fingerprint():
+            # what assigning to a field of leaf does, without validation
+            _forget_fingerprint(leaf)
+            return tree.fingerprint()
+
+        warm = best_of(change_and_fingerprint, number=100)
+        cached = best_of(tree.fingerprint)
+        rows.append(
+            (
+                cls.__name__,
+                size,
+                f"{json_hash:.1f}",
+                f"{cold:.1f}",
+                f"{warm:.1f}",
+                f"{cached:.1f}",
+                f"{json_hash / cold:.1f}x",
+                f"{json_hash / warm:.1f}x",
+            )
+        )
+    print_table(
+        (
+            "class",
+            "bytes",
+            "json hash (us)",
+            "cold (us)",
+            "warm (us)",
+            "cached (us)",
+            "cold speedup",
+            "warm speedup",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Example messages for the benchmarks.
+
+The serialisation test modules define a valid example of every message, as
+objects and as JSON. The benchmarks take them from here, rather than from
+the test modules directly, so that they do not depend on test helpers such
+as pytest parameters, or on how the tests are laid out.
+"""
+import importlib
+import json
+import pkgutil
+from functools import lru_cache
+
+from ska_tmc_cdm import CdmObject
+from ska_tmc_cdm.schemas import CODEC
+from ska_tmc_cdm.schemas.registry import INTERFACE_REGISTRY
+from tests.unit.ska_tmc_cdm import serialisation
+from tests.unit.ska_tmc_cdm.serialisation.central_node import (
+    test_assign_resources,
+)
+from tests.unit.ska_tmc_cdm.serialisation.central_node.test_assign_resources import (  # noqa: E501
+    VALID_LOW_ASSIGNRESOURCESREQUEST_JSON_4_0,
+    VALID_MID_ASSIGNRESOURCESREQUEST_JSON_PI16,
+    VALID_MID_ASSIGNRESOURCESREQUEST_OBJECT,
+)
+from tests.unit.ska_tmc_cdm.serialisation.subarray_node import test_configure
+from tests.unit.ska_tmc_cdm.serialisation.subarray_node.test_configure import (
+    VALID_LOW_CONFIGURE_JSON_4_0,
+    VALID_LOW_CONFIGURE_OBJECT_4_0,
+    VALID_LOW_CONFIGURE_OBJECT_4_1,
+    VALID_MID_CONFIGURE_JSON_2_3,
+    VALID_MID_CONFIGURE_JSON_4_2,
+    VALID_MID_CONFIGURE_OBJECT_4_2,
+)
+
+__all__ = [
+    "VALID_LOW_ASSIGNRESOURCESREQUEST_JSON_4_0",
+    "VALID_LOW_CONFIGURE_JSON_4_0",
+    "VALID_LOW_CONFIGURE_OBJECT_4_0",
+    "VALID_LOW_CONFIGURE_OBJECT_4_1",
+    "VALID_MID_ASSIGNRESOURCESREQUEST_JSON_PI16",
+    "VALID_MID_ASSIGNRESOURCESREQUEST_OBJECT",
+    "VALID_MID_CONFIGURE_JSON_2_3",
+    "VALID_MID_CONFIGURE_JSON_4_2",
+    "VALID_MID_CONFIGURE_OBJECT_4_2",
+    "example_messages",
+    "example_objects",
+    "largest_messages",
+]
+
+
+@lru_cache(maxsize=None)
+def example_objects() -> dict[str, CdmObject]:
+    """
+    Return every example CDM object, of every class, by qualified name,
+    e.g., "tests.unit.[...].test_configure.VALID_MID_CONFIGURE_OBJECT_4_2".
+    """
+    objects = {}
+    for module_info in pkgutil.walk_packages(
+        serialisation.__path__, serialisation.__name__ + "."
+    ):
+        module = importlib.import_module(module_info.name)
+        for name, value in vars(module).items():
+            if isinstance(value, CdmObject):
+                objects[f"{module_info.name}.{name}"] = value
+    return objects
+
+
+def example_messages() -> list[tuple[type[CdmObject], str]]:
+    """
+    Return the class and JSON of every example of a message registered by
+    interface, e.g., AssignResourcesRequest or ConfigureRequest.
+    """
+    messages = {}
+    for obj in example_objects().values():
+        interface = getattr(obj, "interface", None)
+        if INTERFACE_REGISTRY.get(interface) is type(obj):
+            json_str = CODEC.dumps(obj, validate=False)
+            messages[json_str] = type(obj)
+    return [(cls, json_str) for json_str, cls in messages.items()]
+
+
+def largest_messages(count: int = 5) -> list[tuple[str, str]]:
+    """
+    Return the largest decodable example AssignResourcesRequest and
+    ConfigureRequest messages as (name, JSON) pairs.
+    """
+    fixtures = []
+    for name, value in (
+        *vars(test_assign_resources).items(),
+        *vars(test_configure).items(),
+    ):
+        if not name.startswith("VALID_") or not name.endswith(
+            tuple(f"JSON{suffix}" for suffix in ("", "_4_1", "_4_2"))
+        ):
+            continue
+        json_str = value if isinstance(value, str) else json.dumps(value)
+        try:
+            CODEC.loads_any(json_str, validate=False)
+        except ValueError:
+            continue
+        fixtures.append((name, json_str))
+    return sorted(fixtures, key=lambda f: len(f[1]), reverse=True)[:count]
@@ -0,0 +1,62 @@
+"""
+Compare sharing a configuration as a frozen object against defensively
+deep-copying the mutable object, for the largest CDM object of each class
+defined in the serialisation tests.
+
+A frozen object is shared as it is, so the comparison is between one
+freeze() and one model_copy(deep=True) per consumer. thaw() and hashing are
+shown for reference.
+"""
+import warnings
+
+from ska_tmc_cdm.messages.frozen import freeze, thaw
+
+from . import best_of, print_table
+from .fixtures import example_objects
+
+
+def main():
+    warnings.simplefilter("ignore")
+    largest = {}
+    for obj in example_objects().values():
+        size = len(obj.model_dump_json())
+        if size > largest.get(type(obj), (0, None))[0]:
+            largest[type(obj)] = (size, obj)
+
+    rows = []
+    for cls, (size, obj) in sorted(
+        largest.items(), key=lambda item: -item[1][0]
+    )[:8]:
+        frozen = freeze(obj)
+        deep_copy = best_of(lambda: obj.model_copy(deep=True))
+        freezing = best_of(lambda: freeze(obj))
+        thawing = best_of(lambda: thaw(frozen))
+        # a new frozen object each time, so the hash is never cached
+        hashing = best_of(lambda: hash(freeze(obj))) - freezing
+        rows.append(
+            (
+                cls.__name__,
+                size,
+                f"{deep_copy:.1f}",
+                f"{freezing:.1f}",
+                f"{thawing:.1f}",
+                f"{max(hashing, 0.0):.1f}",
+                f"{deep_copy / freezing:.1f}x",
+            )
+        )
+    print_table(
+        (
+            "class",
+            "bytes",
+            "deepcopy (us)",
+            "freeze (us)",
+            "thaw (us)",
+            "hash (us)",
+            "speedup",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Measure the cold-start time of importing ska_tmc_cdm, and using it without
+validation, in fresh interpreters, and which optional heavy dependencies
+each imports.
+"""
+import os
+import subprocess
+import sys
+
+from . import print_table
+
+HEAVY = ("astropy", "numpy", "ska_telmodel", "ska_ost_osd")
+
+STATEMENTS = (
+    ("import ska_tmc_cdm", "import ska_tmc_cdm"),
+    (
+        "dump without validation",
+        "from ska_tmc_cdm.messages.subarray_node.configure import "
+        "ConfigureRequest, TMCConfiguration; "
+        "from ska_tmc_cdm.schemas import CODEC; "
+        "CODEC.dumps(ConfigureRequest(interface='x', "
+        "tmc=TMCConfiguration(partial_configuration=True)), validate=False)",
+    ),
+    (
+        "dump legacy ICRS Target",
+        "from ska_tmc_cdm.messages.subarray_node.configure.core import "
+        "Target; Target(ra='21:08:47.92', dec='-88:57:22.9').model_dump()",
+    ),
+)
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+print(" ".join(name for name in {heavy!r} if name in sys.modules))
+"""
+
+
+def _run(statement: str) -> tuple[float, str]:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-W",
+            "ignore",
+            "-c",
+            SCRIPT.format(statement=statement, heavy=HEAVY),
+        ],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    )
+    seconds, modules = result.stdout.splitlines()
+    return float(seconds), modules
+
+
+def main():
+    rows = []
+    for name, statement in STATEMENTS:
+        runs = [_run(statement) for _ in range(5)]
+        best = min(seconds for seconds, _ in runs)
+        rows.append((name, f"{best * 1000:.0f}", runs[0][1] or "-"))
+    print_table(
+        ("statement", "best of 5 (ms)", "heavy modules imported"), rows
+    )
+
+
+if __name__ == "__main__":
+    main()
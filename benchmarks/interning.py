@@ -0,0 +1,155 @@
+"""
+Measure the memory saved by interning decoded messages, for a synthetic
+workload of Mid messages for 197 dishes and Low messages for 512 stations,
+each decoded once, or repeatedly and kept, as by a long-running process
+keeping a history of the messages it received.
+
+Strings alone save little, as the JSON parser of pydantic-core already
+shares short strings within a message. Most of the saving is from sharing
+frozen sub-objects, e.g., apertures repeated across subarray beams.
+"""
+import gc
+import itertools
+import json
+import tracemalloc
+import warnings
+
+from ska_tmc_cdm.messages.central_node.assign_resources import (
+    AssignResourcesRequest,
+)
+from ska_tmc_cdm.messages.frozen import frozen_class
+from ska_tmc_cdm.messages.interning import InternTable
+from ska_tmc_cdm.messages.subarray_node.configure import ConfigureRequest
+from ska_tmc_cdm.schemas import CODEC
+from ska_tmc_cdm.schemas import codec as codec_module
+
+from . import print_table
+from .fixtures import (
+    VALID_LOW_ASSIGNRESOURCESREQUEST_JSON_4_0,
+    VALID_MID_ASSIGNRESOURCESREQUEST_JSON_PI16,
+    VALID_MID_CONFIGURE_JSON_4_2,
+)
+
+DISHES = [f"SKA{n:03d}" for n in range(1, 134)] + [
+    f"MKT{n:03d}" for n in range(64)
+]
+STATIONS = range(1, 513)
+
+
+def _mid_assign_resources() -> str:
+    request = json.loads(VALID_MID_ASSIGNRESOURCESREQUEST_JSON_PI16)
+    request["dish"]["receptor_ids"] = DISHES
+    execution_block = request["sdp"]["execution_block"]
+    scan_type = execution_block["scan_types"][0]
+    execution_block["scan_types"] = [
+        {**scan_type, "scan_type_id": f"target:{n}"} for n in range(32)
+    ]
+    return json.dumps(request)
+
+
+def _low_assign_resources() -> str:
+    request = json.loads(VALID_LOW_ASSIGNRESOURCESREQUEST_JSON_4_0)
+    request["mccs"]["subarray_beams"] = [
+        {
+            "subarray_beam_id": beam_id,
+            "apertures": [
+                {"station_id": station, "aperture_id": f"AP{station:03d}.01"}
+                for station in STATIONS
+            ],
+            "number_of_channels": 8,
+        }
+        for beam_id in range(1, 5)
+    ]
+    return json.dumps(request)
+
+
+def _mid_configure() -> str:
+    request = json.loads(json.dumps(VALID_MID_CONFIGURE_JSON_4_2))
+    correlation = request["csp"]["midcbf"]["correlation"]
+    region = correlation["processing_regions"][0]
+    correlation["processing_regions"] = [
+        {**region, "receptors": DISHES, "sdp_start_channel_id": n * 20}
+        for n in range(20)
+    ]
+    return json.dumps(request)
+
+
+def _measure(messages, repeats: int, frozen: bool, intern: bool) -> int:
+    """
+    Return the bytes allocated to hold the decoded messages.
+    """
+    codec_module.INTERN_TABLE = InternTable()
+    gc.collect()
+    tracemalloc.start()
+    held = [
+        CODEC.loads(
+            frozen_class(cls) if frozen else cls,
+            json_data,
+            validate=False,
+            intern=intern,
+        )
+        for cls, json_data in messages
+        for _ in range(repeats)
+    ]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size
+
+
+def main():
+    warnings.simplefilter("ignore")
+    workloads = (
+        (
+            "Mid AssignResources",
+            AssignResourcesRequest,
+            _mid_assign_resources(),
+        ),
+        (
+            "Low AssignResources",
+            AssignResourcesRequest,
+            _low_assign_resources(),
+        ),
+        ("Mid Configure", ConfigureRequest, _mid_configure()),
+    )
+    for _, cls, json_data in workloads:
+        # so that classes and caches are not counted
+        _measure([(cls, json_data)], 1, frozen=True, intern=True)
+
+    rows = []
+    for (name, cls, json_data), repeats in itertools.product(
+        workloads, (1, 10)
+    ):
+        messages = [(cls, json_data)]
+        plain = _measure(messages, repeats, frozen=False, intern=False)
+        strings = _measure(messages, repeats, frozen=False, intern=True)
+        frozen = _measure(messages, repeats, frozen=True, intern=False)
+        interned = _measure(messages, repeats, frozen=True, intern=True)
+        rows.append(
+            (
+                name,
+                repeats,
+                f"{plain / 1024:.0f}",
+                f"{strings / 1024:.0f}",
+                f"{frozen / 1024:.0f}",
+                f"{interned / 1024:.0f}",
+                f"{1 - interned / plain:.0%}",
+            )
+        )
+    print_table(
+        (
+            "workload",
+            "messages",
+            "plain (KiB)",
+            "strings interned (KiB)",
+            "frozen (KiB)",
+            "frozen, interned (KiB)",
+            "saved",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Compare reading one subsystem block from a lazily decoded request against a
+full decode, for the largest ConfigureRequest and AssignResourcesRequest
+fixtures in the test suite.
+
+Telescope Model validation is disabled so only decoding is measured.
+"""
+import warnings
+
+from ska_tmc_cdm.schemas import CODEC
+
+from . import best_of, print_table
+from .fixtures import largest_messages
+
+
+def main():
+    warnings.simplefilter("ignore")
+    rows = []
+    for name, json_str in largest_messages():
+        obj = CODEC.loads_any(json_str, validate=False)
+        cls = type(obj)
+        for field in cls.subsystem_fields:
+            if getattr(obj, field) is None:
+                continue
+            full = best_of(
+                lambda: getattr(
+                    CODEC.loads(cls, json_str, validate=False), field
+                )
+            )
+            lazy = best_of(
+                lambda: getattr(
+                    CODEC.loads_lazy(cls, json_str, validate=False), field
+                )
+            )
+            rows.append(
+                (
+                    name,
+                    field,
+                    f"{full:.1f}",
+                    f"{lazy:.1f}",
+                    f"{full / lazy:.1f}x",
+                )
+            )
+    print_table(
+        ("fixture", "field", "loads (us)", "loads_lazy (us)", "speedup"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
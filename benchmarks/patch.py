@@ -0,0 +1,96 @@
+"""
+Compare sending a one-field change as a patch against sending the whole
+object, for the largest CDM object of each class defined in the
+serialisation tests.
+
+"diff" and "apply" make and apply the patch, between frozen objects with
+fingerprints cached as they would be between consecutive configurations. "dump" and "load"
+serialise and validate the whole object instead.
+"""
+import warnings
+
+from ska_tmc_cdm import CdmObject
+from ska_tmc_cdm.messages.frozen import freeze
+from ska_tmc_cdm.messages.patch import apply, diff, dump_patch, load_patch
+
+from . import best_of, print_table
+from .fixtures import example_objects
+
+
+def _change_last_str(obj: CdmObject) -> bool:
+    """
+    Change the last str field found depth first, returning True if found.
+    """
+    for name, value in reversed(obj.__dict__.items()):
+        if isinstance(value, list) and value:
+            value = value[-1]
+        if isinstance(value, CdmObject) and _change_last_str(value):
+            return True
+        if type(value) is str and name in type(obj).model_fields:
+            try:
+                setattr(obj, name, value + "-changed")
+            except ValueError:
+                continue
+            return True
+    return False
+
+
+def main():
+    warnings.simplefilter("ignore")
+    largest = {}
+    for obj in example_objects().values():
+        size = len(obj.model_dump_json())
+        if size > largest.get(type(obj), (0, None))[0]:
+            largest[type(obj)] = (size, obj)
+
+    rows = []
+    for cls, (size, obj) in sorted(
+        largest.items(), key=lambda item: -item[1][0]
+    )[:8]:
+        old = obj.model_copy(deep=True)
+        new = obj.model_copy(deep=True)
+        if not _change_last_str(new):
+            continue
+        target = old.model_copy(deep=True)
+        old, new = freeze(old), freeze(new)
+        old.fingerprint()
+        new.fingerprint()
+        changes = diff(old, new)
+        patch_json = dump_patch(changes, cls)
+        whole_json = new.model_dump_json(exclude_none=True, by_alias=True)
+
+        diffing = best_of(lambda: dump_patch(diff(old, new), cls))
+        applying = best_of(lambda: apply(target, load_patch(patch_json)))
+        dumping = best_of(
+            lambda: new.model_dump_json(exclude_none=True, by_alias=True)
+        )
+        loading = best_of(lambda: cls.model_validate_json(whole_json))
+        rows.append(
+            (
+                cls.__name__,
+                len(whole_json),
+                len(patch_json),
+                f"{diffing:.1f}",
+                f"{applying:.1f}",
+                f"{dumping:.1f}",
+                f"{loading:.1f}",
+                f"{(dumping + loading) / (diffing + applying):.1f}x",
+            )
+        )
+    print_table(
+        (
+            "class",
+            "bytes",
+            "patch bytes",
+            "diff (us)",
+            "apply (us)",
+            "dump (us)",
+            "load (us)",
+            "speedup",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
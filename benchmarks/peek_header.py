@@ -0,0 +1,59 @@
+"""
+Compare extracting message headers with peek_header against a plain JSON
+decode and a full Codec decode, for the largest JSON fixtures in the test
+suite.
+
+peek_header stops early once all header keys are found. A key that is absent
+from the top level but present in nested blocks (e.g., scan_id) means the
+document is scanned up to its last nested occurrence.
+"""
+import json
+import warnings
+
+from ska_tmc_cdm.schemas import CODEC
+from ska_tmc_cdm.schemas.peek import peek, peek_header
+from ska_tmc_cdm.schemas.registry import INTERFACE_REGISTRY
+
+from . import best_of, print_table
+from .fixtures import largest_messages
+
+
+def main():
+    warnings.simplefilter("ignore")
+    rows = []
+    for name, json_str in largest_messages():
+        interface = peek_header(json_str).interface
+        assert interface in INTERFACE_REGISTRY
+        peeked = best_of(lambda: peek_header(json_str), number=2000)
+        interface_only = best_of(
+            lambda: peek(json_str, ["interface"]), number=2000
+        )
+        parsed = best_of(lambda: json.loads(json_str), number=2000)
+        decoded = best_of(lambda: CODEC.loads_any(json_str, validate=False))
+        rows.append(
+            (
+                name,
+                len(json_str),
+                f"{peeked:.1f}",
+                f"{interface_only:.1f}",
+                f"{parsed:.1f}",
+                f"{decoded:.1f}",
+                f"{decoded / peeked:.0f}x",
+            )
+        )
+    print_table(
+        (
+            "fixture",
+            "bytes",
+            "peek_header (us)",
+            "peek interface (us)",
+            "json.loads (us)",
+            "loads_any (us)",
+            "speedup",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
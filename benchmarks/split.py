@@ -0,0 +1,67 @@
+"""
+Compare splitting a request into its subsystem blocks with Codec.split
+against decoding the whole request and re-serialising each block with
+Codec.dumps, for the largest ConfigureRequest and AssignResourcesRequest
+fixtures in the test suite. Bytes input is split as well as str, as it is
+scanned without being decoded.
+
+Telescope Model validation is disabled so only decoding and encoding are
+measured.
+"""
+import warnings
+
+from ska_tmc_cdm.schemas import CODEC
+
+from . import best_of, print_table
+from .fixtures import largest_messages
+
+
+def decode_and_dump(json_str: str) -> dict[str, str]:
+    obj = CODEC.loads_any(json_str, validate=False)
+    return {
+        name: CODEC.dumps(getattr(obj, name), validate=False)
+        for name in type(obj).subsystem_fields
+        if getattr(obj, name) is not None
+    }
+
+
+def main():
+    warnings.simplefilter("ignore")
+    rows = []
+    for name, json_str in largest_messages():
+        if not type(
+            CODEC.loads_any(json_str, validate=False)
+        ).subsystem_fields:
+            continue
+        full = best_of(lambda: decode_and_dump(json_str))
+        split = best_of(lambda: CODEC.split(json_str, validate=False))
+        json_bytes = json_str.encode("utf-8")
+        split_bytes = best_of(lambda: CODEC.split(json_bytes, validate=False))
+        checked = best_of(lambda: CODEC.split(json_str, strictness=0))
+        rows.append(
+            (
+                name,
+                len(json_str),
+                f"{full:.1f}",
+                f"{split:.1f}",
+                f"{split_bytes:.1f}",
+                f"{checked:.1f}",
+                f"{full / split:.0f}x",
+            )
+        )
+    print_table(
+        (
+            "fixture",
+            "bytes",
+            "loads+dumps (us)",
+            "split (us)",
+            "split bytes (us)",
+            "split+validate (us)",
+            "speedup",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Time decoding, encoding and comparing a Mid ConfigureRequest with a legacy
+ICRS Target, with the target coordinate caches cleared before each call, as
+if every target were new, or kept, as for targets repeated across requests.
+"""
+import warnings
+
+from ska_tmc_cdm.messages.subarray_node.configure import ConfigureRequest, core
+from ska_tmc_cdm.schemas import CODEC
+
+from . import best_of, print_table
+from .fixtures import VALID_MID_CONFIGURE_JSON_2_3
+
+
+def _clear(*requests: ConfigureRequest) -> None:
+    core._sky_coord.cache_clear()
+    core._icrs_hmsdms.cache_clear()
+    for request in requests:
+        try:
+            object.__delattr__(request.pointing.target, "_derived")
+        except AttributeError:
+            pass
+
+
+def main():
+    warnings.simplefilter("ignore")
+    request = CODEC.loads(
+        ConfigureRequest, VALID_MID_CONFIGURE_JSON_2_3, validate=False
+    )
+    other = request.model_copy(deep=True)
+
+    cases = (
+        (
+            "decode",
+            lambda: ConfigureRequest.model_validate_json(
+                VALID_MID_CONFIGURE_JSON_2_3
+            ),
+        ),
+        ("encode", lambda: CODEC.dumps(request, validate=False)),
+        ("==", lambda: request == other),
+    )
+    rows = []
+    for name, fn in cases:
+
+        def uncached():
+            _clear(request, other)
+            fn()
+
+        cold = best_of(uncached, number=50)
+        warm = best_of(fn, number=50)
+        rows.append(
+            (name, f"{cold:.0f}", f"{warm:.0f}", f"{cold / warm:.1f}x")
+        )
+    print_table(("operation", "uncached (us)", "cached (us)", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Compare loading dumped CDM objects with full Pydantic validation against the
+trusted path, for every CDM object defined in the serialisation tests.
+
+Telescope Model validation is disabled so only Pydantic is measured.
+"""
+import os
+import warnings
+
+from ska_tmc_cdm.messages.trusted import KEY_ENV_VAR, seal
+from ska_tmc_cdm.schemas import CODEC
+
+from . import best_of, print_table
+from .fixtures import example_objects
+
+
+def main():
+    warnings.simplefilter("ignore")
+    os.environ.setdefault(KEY_ENV_VAR, "benchmark")
+    rows = []
+    totals = [0.0, 0.0]
+    seen = set()
+    for qualified_name, obj in example_objects().items():
+        cls = type(obj)
+        json_str = CODEC.dumps(obj, validate=False)
+        try:
+            CODEC.loads(cls, json_str, validate=False)
+        except ValueError:
+            continue
+        json_seal = seal(json_str)
+        validated = best_of(lambda: CODEC.loads(cls, json_str, validate=False))
+        trusted = best_of(
+            lambda: CODEC.loads(cls, json_str, trusted=json_seal)
+        )
+        totals[0] += validated
+        totals[1] += trusted
+        name = qualified_name.rpartition(".")[2]
+        if len(json_str) > 1000 and name not in seen:
+            seen.add(name)
+            rows.append(
+                (
+                    name,
+                    len(json_str),
+                    f"{validated:.1f}",
+                    f"{trusted:.1f}",
+                    f"{validated / trusted:.1f}x",
+                )
+            )
+    rows.append(
+        (
+            "all fixtures",
+            "",
+            f"{totals[0]:.1f}",
+            f"{totals[1]:.1f}",
+            f"{totals[0] / totals[1]:.1f}x",
+        )
+    )
+    print_table(
+        ("fixture", "bytes", "loads (us)", "trusted (us)", "speedup"), rows
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Measure the memory held by long lists of ProcessingRegionConfigurations and
+PSTBeamConfigurations, decoded from JSON and kept as CDM objects or as the
+read-only views of ska_tmc_cdm.messages.views.
+"""
+import gc
+import json
+import tracemalloc
+import warnings
+
+from pydantic import TypeAdapter
+
+from ska_tmc_cdm.messages.subarray_node.configure.csp import (
+    ProcessingRegionConfiguration,
+)
+from ska_tmc_cdm.messages.subarray_node.configure.pst import (
+    PSTBeamConfiguration,
+)
+from ska_tmc_cdm.messages.views import view
+
+from . import best_of, print_table
+from .fixtures import (
+    VALID_LOW_CONFIGURE_JSON_4_0,
+    VALID_MID_CONFIGURE_JSON_4_2,
+)
+
+COUNT = 1000
+
+
+def _regions() -> str:
+    correlation = VALID_MID_CONFIGURE_JSON_4_2["csp"]["midcbf"]["correlation"]
+    region = correlation["processing_regions"][0]
+    return json.dumps(
+        [{**region, "sdp_start_channel_id": n * 20} for n in range(COUNT)]
+    )
+
+
+def _pst_beams() -> str:
+    beam = json.loads(VALID_LOW_CONFIGURE_JSON_4_0)["csp"]["pst"]["beams"][0]
+    return json.dumps([{**beam, "beam_id": n} for n in range(1, COUNT + 1)])
+
+
+def _measure(load) -> int:
+    """
+    Return the bytes allocated to hold what load() returns.
+    """
+    gc.collect()
+    tracemalloc.start()
+    held = load()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size
+
+
+def main():
+    warnings.simplefilter("ignore")
+    rows = []
+    for cls, json_data in (
+        (ProcessingRegionConfiguration, _regions()),
+        (PSTBeamConfiguration, _pst_beams()),
+    ):
+        adapter = TypeAdapter(list[cls])
+
+        def load_models():
+            return adapter.validate_json(json_data)
+
+        def load_views():
+            return [view(obj) for obj in adapter.validate_json(json_data)]
+
+        # so that classes and caches are not counted
+        load_views()
+        models = _measure(load_models)
+        views = _measure(load_views)
+        rows.append(
+            (
+                cls.__name__,
+                COUNT,
+                f"{models / COUNT:.0f}",
+                f"{views / COUNT:.0f}",
+                f"{1 - views / models:.0%}",
+                f"{best_of(load_models, number=10) / COUNT:.1f}",
+                f"{best_of(load_views, number=10) / COUNT:.1f}",
+            )
+        )
+    print_table(
+        (
+            "class",
+            "objects",
+            "model (bytes/object)",
+            "view (bytes/object)",
+            "saved",
+            "load model (us/object)",
+            "load view (us/object)",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
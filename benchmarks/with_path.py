@@ -0,0 +1,54 @@
+"""
+Compare CdmObject.with_path() against deep copying a template and assigning
+to the copy, for changes typical of building a scan sequence from a
+ConfigureRequest template.
+"""
+import warnings
+
+from . import best_of, print_table
+from .fixtures import VALID_MID_CONFIGURE_OBJECT_4_2
+
+CHANGES = (
+    ("csp.common.config_id", "sbi-mvp01-20200325-00001-science_B"),
+    ("sdp.scan_type", "science_B"),
+    ("pointing.groups[0].field.target_name", "Cen-B"),
+)
+
+
+def _deep_copy_and_assign(template, path: str, value):
+    copy = template.model_copy(deep=True)
+    *parents, name = path.replace("[0]", ".0").split(".")
+    obj = copy
+    for parent in parents:
+        obj = obj[int(parent)] if parent.isdigit() else getattr(obj, parent)
+    setattr(obj, name, value)
+    return copy
+
+
+def main():
+    warnings.simplefilter("ignore")
+    template = VALID_MID_CONFIGURE_OBJECT_4_2
+    rows = []
+    for path, value in CHANGES:
+        assert _deep_copy_and_assign(
+            template, path, value
+        ) == template.with_path(path, value)
+        deep_copy = best_of(
+            lambda: _deep_copy_and_assign(template, path, value)
+        )
+        with_path = best_of(lambda: template.with_path(path, value))
+        rows.append(
+            (
+                path,
+                f"{deep_copy:.1f}",
+                f"{with_path:.1f}",
+                f"{deep_copy / with_path:.1f}x",
+            )
+        )
+    print_table(
+        ("path", "deepcopy+assign (us)", "with_path (us)", "speedup"), rows
+    )
+
+
+if __name__ == "__main__":
+    main()
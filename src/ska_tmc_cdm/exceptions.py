@@ -2,11 +2,14 @@
 The exceptions module contains all custom exceptions that are
 part of the CDM library.
 """
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from ska_ost_osd.telvalidation.semantic_validator import (
-    SchematicValidationError,
-)
+if TYPE_CHECKING:
+    # only for annotations, so that ska_ost_osd is not needed to import
+    # the exceptions
+    from ska_ost_osd.telvalidation.semantic_validator import (
+        SchematicValidationError,
+    )
 
 
 class JsonValidationError(ValueError):
@@ -17,7 +20,7 @@ class JsonValidationError(ValueError):
 
     def __init__(
         self,
-        exc: ValueError | SchematicValidationError,
+        exc: "ValueError | SchematicValidationError",
         uri: str,
         json_dict: Optional[dict] = None,
     ):
@@ -27,6 +30,11 @@ class JsonValidationError(ValueError):
         self.uri = uri
         self.json_dict = json_dict
 
+    def __reduce__(self):
+        # pickle with the constructor arguments so that errors can be
+        # returned from worker processes
+        return self.__class__, (self.exc, self.uri, self.json_dict)
+
     def __str__(self):
         return f"{self._msg}"
 
@@ -41,5 +49,43 @@ class SchemaNotFound(ValueError):
         super().__init__(self._msg)
         self.uri = uri
 
+    def __reduce__(self):
+        return self.__class__, (self.uri,)
+
+    def __str__(self):
+        return f"{self._msg}"
+
+
+class UnknownInterface(ValueError):
+    """
+    Error raised when no CDM class is registered for an interface.
+    """
+
+    def __init__(self, uri: Optional[str]):
+        self._msg = f"No CDM class registered for interface: {uri}"
+        super().__init__(self._msg)
+        self.uri = uri
+
+    def __reduce__(self):
+        return self.__class__, (self.uri,)
+
+    def __str__(self):
+        return f"{self._msg}"
+
+
+class UntrustedInput(ValueError):
+    """
+    Error raised when input passed to the trusted construction path does
+    not carry a valid seal.
+    """
+
+    def __init__(self, reason: str):
+        self._msg = f"Input is not trusted: {reason}"
+        super().__init__(self._msg)
+        self.reason = reason
+
+    def __reduce__(self):
+        return self.__class__, (self.reason,)
+
     def __str__(self):
         return f"{self._msg}"
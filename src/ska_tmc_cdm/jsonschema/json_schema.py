@@ -2,22 +2,38 @@
 The JSON Schema module contains methods for fetching version-specific JSON schemas
 using interface uri and validating the structure of JSON against these schemas.
 """
+import sys
+from functools import lru_cache
 from importlib.metadata import version
 from os import environ
-
-from ska_ost_osd.telvalidation import (
-    semantic_validator as televalidation_schema,
-)
-from ska_ost_osd.telvalidation.semantic_validator import (
-    SchematicValidationError,
-)
-from ska_telmodel import schema
-from ska_telmodel.data import TMData
+from typing import TYPE_CHECKING, Optional
 
 from ska_tmc_cdm.exceptions import JsonValidationError, SchemaNotFound
 
+from .lazy_import import lazy_getattr
+from .tmdata_cache import TMDATA_CACHE
+
+if TYPE_CHECKING:
+    from ska_telmodel import schema
+
 __all__ = ["JsonSchema"]
 
+# ska_telmodel and ska_ost_osd are imported on first validation, see
+# lazy_import. Only names used in annotations are imported for the type
+# checker; the rest are reached through _MODULE.
+_SEMANTIC_VALIDATOR = "ska_ost_osd.telvalidation.semantic_validator"
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "schema": "ska_telmodel.schema",
+        "televalidation_schema": _SEMANTIC_VALIDATOR,
+        "SchematicValidationError": (
+            f"{_SEMANTIC_VALIDATOR}:SchematicValidationError"
+        ),
+    },
+)
+_MODULE = sys.modules[__name__]
+
 # SKA OSD data is not packaged with the client library, and by default the library will fetch the "latest"
 # version in git, which may contain unreleased, breaking changes. We want to explicitly pin to the same data
 # version as the library version:
@@ -26,13 +42,59 @@ OSD_LIB_VERSION = version("ska_ost_osd")
 CAR_OSD_SOURCE = (f"car:ost/ska-ost-osd?{OSD_LIB_VERSION}#tmdata",)
 
 
+def get_data_sources() -> tuple[str, ...]:
+    """
+    Return the telescope model data sources used for semantic validation.
+
+    Sources listed in the SKA_TELMODEL_SOURCES environment variable take
+    precedence over the pinned OSD source.
+    """
+    if env_var_sources := environ.get("SKA_TELMODEL_SOURCES"):
+        return tuple(env_var_sources.split(","))
+    return CAR_OSD_SOURCE
+
+
+# Maximum number of (uri, strictness) combinations to hold resolved schemas for
+SCHEMA_CACHE_SIZE = int(environ.get("SCHEMA_CACHE_SIZE", 256))
+
+
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _resolve_schema(
+    uri: str, strictness: Optional[int]
+) -> Optional["schema.Schema"]:
+    """
+    Resolve and cache the Telescope Model schema for a URI and strictness.
+
+    URIs without a schema resolve to None, which is cached too so that
+    messages for unknown interfaces do not repeat the failed lookup.
+    """
+    extra_kwargs = {}
+    if strictness is not None:
+        extra_kwargs["strictness"] = strictness
+    try:
+        return _MODULE.schema.schema_by_uri(uri, **extra_kwargs)
+    except ValueError:
+        return None
+
+
+def _passes(resolved: "schema.Schema", instance: dict) -> bool:
+    """
+    Return True if an instance is valid under a resolved schema.
+    """
+    try:
+        resolved.validate(instance)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return False
+    return True
+
+
 class JsonSchema:
     """
     JSON Schema use for validating the structure of JSON data
     """
 
     @staticmethod
-    def get_schema_by_uri(uri: str) -> schema.Schema:
+    def get_schema_by_uri(uri: str) -> "schema.Schema":
         """
         Retrieve JSON Schemas from remote server.
 
@@ -41,7 +103,7 @@ class JsonSchema:
         :raises: SchemaNotFound if URI does not resolve to a schema
         """
         try:
-            return schema.schema_by_uri(uri)
+            return _MODULE.schema.schema_by_uri(uri)
         except ValueError as exc:
             raise SchemaNotFound(uri) from exc
 
@@ -56,28 +118,48 @@ class JsonSchema:
           1: permissive errors and strict warnings
           2: strict errors
 
+        Resolved schemas are cached per (uri, strictness), as are URIs that
+        do not resolve to a schema. Use clear_cache() to discard them.
+
         :param uri:  The schema to validate with
         :param instance: The instance to validate
         :param strictness: strictness level
         :return: None, in case of valid data otherwise, it raises an exception.
         """
+        resolved = _resolve_schema(uri, strictness)
+        if resolved is None:
+            if strictness is not None and strictness > 1:
+                raise SchemaNotFound(uri)
+            return None
+
+        schemas = [resolved]
+        if strictness is None or strictness == 1:
+            # strict errors are warned about, so return early only if the
+            # instance passes the strict schema too
+            strict = _resolve_schema(uri, 2)
+            # without one, the Telescope Model decides what to warn about
+            schemas = [resolved, strict] if strict is not None else []
+        # Otherwise, fall through to the Telescope Model so that its rules
+        # on whether to warn or raise for this strictness apply.
+        if schemas and all(_passes(each, instance) for each in schemas):
+            return None
+
         # use default strictness defined by Telescope Model unless overridden
         extra_kwargs = {}
         if strictness is not None:
             extra_kwargs["strictness"] = strictness
 
         try:
-            return schema.validate(uri, instance, **extra_kwargs)
+            return _MODULE.schema.validate(uri, instance, **extra_kwargs)
         except ValueError as exc:
-            # Distinguish ValueErrors caused by schema not found from
-            # ValueErrors caused by invalid JSON.
-            try:
-                schema.schema_by_uri(uri)
-            except ValueError:
-                if strictness is not None and strictness > 1:
-                    raise SchemaNotFound(uri) from exc
-            else:
-                raise JsonValidationError(exc, uri, instance) from exc
+            raise JsonValidationError(exc, uri, instance) from exc
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Discard all cached schemas, including cached schema lookup failures.
+        """
+        _resolve_schema.cache_clear()
 
     @staticmethod
     def semantic_validate_schema(instance: dict, uri: str) -> None:
@@ -89,22 +171,18 @@ class JsonSchema:
         :return: None, in case of valid data otherwise, it raises an exception.
         """
 
-        if env_var_sources := environ.get("SKA_TELMODEL_SOURCES"):
-            data_sources = env_var_sources.split(",")
-        else:
-            data_sources = CAR_OSD_SOURCE
-
-        tm_data = TMData(source_uris=list(data_sources), update=True)
+        # TMData is shared between validations, see tmdata_cache.
+        tm_data = TMDATA_CACHE.get(get_data_sources())
         try:
-            return televalidation_schema.semantic_validate(
+            return _MODULE.televalidation_schema.semantic_validate(
                 observing_command_input=instance,
                 tm_data=tm_data,
                 interface=uri,
             )
 
-        except SchematicValidationError as exc:
+        except _MODULE.SchematicValidationError as exc:
             try:
-                schema.schema_by_uri(uri)
+                _MODULE.schema.schema_by_uri(uri)
             except ValueError:
                 raise SchemaNotFound(uri) from exc
             else:
@@ -0,0 +1,45 @@
+"""
+The lazy_import module defers importing the Telescope Model (ska_telmodel)
+and OSD (ska_ost_osd) libraries, which are slow to import, until they are
+first used, i.e., on first validation, so that processes which only
+construct and serialise messages without validation never import them.
+
+lazy_getattr() returns a module __getattr__ (PEP 562) that imports a name
+on first access and keeps it in the module. Functions read lazily imported
+names as attributes of their module, rather than as globals, so that the
+names can still be patched, e.g., with unittest.mock.patch().
+"""
+import sys
+from importlib import import_module
+from typing import Any, Callable
+
+__all__ = ["lazy_getattr"]
+
+
+def lazy_getattr(
+    module_name: str, imports: dict[str, str]
+) -> Callable[[str], Any]:
+    """
+    Return a module __getattr__ that imports names on first access.
+
+    :param module_name: the __name__ of the module
+    :param imports: the import of each name, as "module" or
+        "module:attribute"
+    :return: the __getattr__ function
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            target = imports[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {module_name!r} has no attribute {name!r}"
+            ) from None
+        path, _, attribute = target.partition(":")
+        value = import_module(path)
+        if attribute:
+            value = getattr(value, attribute)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
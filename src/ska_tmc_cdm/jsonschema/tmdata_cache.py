@@ -0,0 +1,157 @@
+"""
+The tmdata_cache module holds a process-wide cache of Telescope Model data
+(TMData) instances used for semantic validation.
+
+Resolving the CAR/OSD data sources is expensive, so rather than building a new
+TMData for every validated message, instances are shared between validations
+and keyed by the list of data sources they were built from.
+"""
+import sys
+import threading
+import time
+from os import environ
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
+
+from .lazy_import import lazy_getattr
+
+if TYPE_CHECKING:
+    from ska_telmodel.data import TMData
+
+__all__ = ["TMDataCache", "TMDATA_CACHE"]
+
+# ska_telmodel is imported when TMData is first loaded, see lazy_import
+__getattr__ = lazy_getattr(__name__, {"TMData": "ska_telmodel.data:TMData"})
+_MODULE = sys.modules[__name__]
+
+# Optional TTL, in seconds, for cached TMData. If unset, cached data is held
+# until explicitly invalidated or refreshed.
+TMDATA_CACHE_TTL = environ.get("TMDATA_CACHE_TTL")
+
+Sources = tuple[str, ...]
+
+
+class TMDataCache:
+    """
+    Thread-safe cache of TMData instances keyed by their data sources.
+
+    Cached entries are replaced atomically: readers either see the old TMData
+    or the new one, never a partially loaded instance.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        loader: Optional[Callable[[Sources], "TMData"]] = None,
+    ):
+        """
+        :param ttl: optional lifetime of a cached entry in seconds. None
+            means entries never expire.
+        :param loader: optional function used to build TMData for a source
+            list. Defaults to loading TMData with update=True.
+        """
+        self.ttl = ttl
+        self._loader = loader or self._load
+        self._entries: dict[Sources, tuple["TMData", float]] = {}
+        self._lock = threading.Lock()
+        # Incremented whenever cached data may have changed, so that results
+        # derived from cached data can be recognised as stale.
+        self.generation = 0
+        self._refresher: Optional[threading.Thread] = None
+        self._stop_refresh = threading.Event()
+
+    @staticmethod
+    def _load(sources: Sources) -> "TMData":
+        return _MODULE.TMData(source_uris=list(sources), update=True)
+
+    def _expired(self, loaded_at: float) -> bool:
+        return (
+            self.ttl is not None and time.monotonic() - loaded_at >= self.ttl
+        )
+
+    def get(self, sources: Iterable[str]) -> "TMData":
+        """
+        Return TMData for the given sources, loading it if it is not cached
+        or if the cached entry has expired.
+
+        :param sources: telescope model data source URIs
+        :return: TMData for the sources
+        """
+        key = tuple(sources)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and not self._expired(entry[1]):
+            return entry[0]
+        return self.refresh(key)
+
+    def refresh(self, sources: Iterable[str]) -> "TMData":
+        """
+        Reload TMData for the given sources and swap it into the cache.
+
+        :param sources: telescope model data source URIs
+        :return: the freshly loaded TMData
+        """
+        key = tuple(sources)
+        # Load outside the lock so concurrent readers continue to be served
+        # the previous data while the new data is fetched.
+        tm_data = self._loader(key)
+        with self._lock:
+            if key in self._entries:
+                self.generation += 1
+            self._entries[key] = (tm_data, time.monotonic())
+        return tm_data
+
+    def invalidate(self, sources: Optional[Iterable[str]] = None) -> None:
+        """
+        Drop cached TMData for the given sources, or all cached TMData if
+        sources is None.
+
+        :param sources: optional telescope model data source URIs
+        """
+        with self._lock:
+            self.generation += 1
+            if sources is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(tuple(sources), None)
+
+    def start_background_refresh(self, interval: float) -> None:
+        """
+        Start a daemon thread that refreshes every cached entry each interval
+        seconds.
+
+        :param interval: seconds between refreshes
+        """
+        self.stop_background_refresh()
+        self._stop_refresh.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop,
+            args=(interval,),
+            name="TMDataCacheRefresher",
+            daemon=True,
+        )
+        self._refresher.start()
+
+    def stop_background_refresh(self) -> None:
+        """
+        Stop the background refresh thread, if one is running.
+        """
+        if self._refresher is not None:
+            self._stop_refresh.set()
+            self._refresher.join()
+            self._refresher = None
+
+    def _refresh_loop(self, interval: float) -> None:
+        while not self._stop_refresh.wait(interval):
+            with self._lock:
+                keys = list(self._entries)
+            for key in keys:
+                try:
+                    self.refresh(key)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    # Keep serving the previous data if a refresh fails.
+                    continue
+
+
+TMDATA_CACHE = TMDataCache(
+    ttl=float(TMDATA_CACHE_TTL) if TMDATA_CACHE_TTL else None
+)
@@ -1,15 +1,22 @@
+import re
+import weakref
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
+from functools import lru_cache
+from hashlib import blake2b
 from os import environ
-from typing import Any, Tuple, Union, cast
+from typing import Any, ClassVar, Iterator, NamedTuple, Union, cast, get_args
 
 from pydantic import (
+    AliasChoices,
     BaseModel,
     ConfigDict,
     SerializerFunctionWrapHandler,
     model_serializer,
 )
 from pydantic.config import ExtraValues
-from pydantic.fields import FieldInfo
-from pydantic_core import PydanticUndefined
+from typing_extensions import Self
 
 # Defaults to 'ignore' (silently accept), it can be helpful to set 'forbid'
 # to catch errors during development:
@@ -29,6 +36,137 @@ class CdmObject(BaseModel):
         validate_default=True,
     )
 
+    # Fields holding per-subsystem blocks, which LazyMessage validates on
+    # first access rather than up front.
+    subsystem_fields: ClassVar[tuple[str, ...]] = ()
+
+    # Fields that __eq__ compares within a tolerance rather than exactly.
+    # Structural hashes leave these out so that equal objects hash equal.
+    approximate_fields: ClassVar[frozenset[str]] = frozenset()
+
+    # The cached fingerprint, weak references to the objects whose cached
+    # fingerprints were computed from it, the state of the object on entry
+    # to batch_update(), and a value subclasses derive from their fields,
+    # e.g., the coordinate of a target. Slots rather than private attributes,
+    # so that they are not compared, copied or pickled. Declared here, as
+    # subclasses declaring slots could not be mirrored by frozen_class().
+    __slots__ = (
+        "__weakref__",
+        "_fingerprint",
+        "_fingerprint_dependents",
+        "_batch",
+        "_derived",
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in type(self).model_fields:
+            super().__setattr__(name, value)
+            return
+        if (batch := _batch_of(self)) is not None:
+            _field_values(self)[name] = value
+            batch.assigned.add(name)
+        else:
+            super().__setattr__(name, value)
+        _forget_fingerprint(self)
+
+    def __eq__(self, other: Any) -> bool:
+        # Differing fingerprints prove inequality without comparing the trees,
+        # but are only worth using if already computed, and only trusted for
+        # frozen objects, as the cached fingerprint of a mutable object does
+        # not see changes made in place.
+        if (
+            isinstance(other, CdmObject)
+            and self.model_config.get("frozen")
+            and other.model_config.get("frozen")
+            and (mine := _cached_digest(self)) is not None
+            and (theirs := _cached_digest(other)) is not None
+            and mine != theirs
+        ):
+            return False
+        return super().__eq__(other)
+
+    def fingerprint(self) -> str:
+        """
+        Return a stable hash of the content of this object and the objects it
+        holds, computed from field values rather than from JSON.
+
+        Objects that compare equal have the same fingerprint, so fields in
+        approximate_fields, which __eq__ compares within a tolerance, are
+        left out. Objects differing only in those fields therefore have the
+        same fingerprint too.
+
+        The fingerprint is cached, and forgotten when a field of this object
+        or of any object it holds is assigned. Changes made in place, e.g.,
+        appending to a list field, are not seen.
+
+        :return: 32 hex digits, the same in every process
+        """
+        return _digest(self).hex()
+
+    @contextmanager
+    def batch_update(self) -> Iterator[Self]:
+        """
+        Return a context in which assignments to fields of this object are
+        validated together, once, on exit, rather than one at a time. Fields
+        may then be changed through states that validators would reject.
+
+        In the context, fields hold the values assigned, unvalidated. If the
+        block raises, or validation on exit fails, every field is restored
+        to its value on entry. Assignments to fields of the objects this
+        object holds are not batched.
+
+        :return: a context that gives this object
+        :raises: a pydantic ValidationError on exit if the fields are not
+            valid together, or TypeError if this object is frozen
+        """
+        if _batch_of(self) is not None:
+            # nested, so the outermost context validates
+            yield self
+            return
+        if self.model_config.get("frozen"):
+            raise TypeError(f"{type(self).__name__} is frozen")
+        batch = _Batch(
+            dict(self.__dict__),
+            set(self.__pydantic_fields_set__),
+            self.__pydantic_extra__,
+            set(),
+        )
+        object.__setattr__(self, "_batch", batch)
+        try:
+            yield self
+            if batch.assigned:
+                _validate_batch(self, batch)
+        except BaseException:
+            values = _field_values(self)
+            values.clear()
+            values.update(batch.values)
+            object.__setattr__(
+                self, "__pydantic_fields_set__", batch.fields_set
+            )
+            object.__setattr__(self, "__pydantic_extra__", batch.extra)
+            raise
+        finally:
+            object.__delattr__(self, "_batch")
+            _forget_fingerprint(self)
+
+    def with_path(self, path: str, value: Any) -> Self:
+        """
+        Return a copy of this object with the field at path set to value.
+
+        Only the objects and containers along the path are copied, and only
+        the copied objects are validated. Everything else is shared with
+        this object, so should not be changed in place.
+
+        :param path: field names separated by dots, with list indices and
+            dict keys in brackets, e.g., "pointing.groups[0].field"
+        :param value: the new value, validated as if assigned
+        :return: the copy
+        :raises: ValueError if path does not exist in this object, or a
+            pydantic ValidationError if value or a copied object is not
+            valid
+        """
+        return _replaced(self, _parse_path(path), value)
+
     @model_serializer(mode="wrap")
     def _serialize(
         self, default_serializer: SerializerFunctionWrapHandler
@@ -44,41 +182,423 @@ class CdmObject(BaseModel):
         that are present by default, but preserve any 'empty' values that were deliberately
         set by callers or where the field is explicitly set exclude=False - requiring that it
         be included in serialised output."""
-        filtered = {
-            key: val
-            for key, val in dumped.items()
-            if self._must_include(key)
-            or not (self._is_empty(val) and self._is_default(key))
-        }
+        plan = _serialization_plan(type(self))
+        filtered = {}
+        for key, val in dumped.items():
+            try:
+                field_name = plan.field_names[key]
+            except KeyError:
+                raise ValueError(f"Unknown field name/alias: {key}") from None
+            if (
+                key not in plan.must_include
+                and self._is_empty(val)
+                and getattr(self, field_name) == plan.defaults[field_name]
+            ):
+                continue
+            filtered[key] = val
         return filtered
 
-    def _get_field_info(self, key: str) -> Tuple[str, FieldInfo]:
-        try:
-            return key, self.model_fields[key]
-        except KeyError:
-            for name, info in self.model_fields.items():
-                if key == info.serialization_alias:
-                    return name, info
-        raise ValueError(f"Unknown field name/alias: {key}")
+    @staticmethod
+    def _is_empty(value: Any) -> bool:
+        return value in (None, [], {})
+
+
+class _SerializationPlan(NamedTuple):
+    """
+    What CdmObject._exclude_default_nulls_and_empty needs to know about the
+    fields of a class.
+
+    :param field_names: field name for each key that can appear in a dump,
+        i.e., field names and serialization aliases
+    :param must_include: keys of fields with exclude=False
+    :param defaults: default value of each field, or PydanticUndefined
+    """
 
-    def _is_default(self, key: str) -> bool:
-        field_name, field_info = self._get_field_info(key)
+    field_names: dict[str, str]
+    must_include: frozenset[str]
+    defaults: dict[str, Any]
+
+
+@lru_cache(maxsize=None)
+def _serialization_plan(cls: type[CdmObject]) -> _SerializationPlan:
+    field_names = {}
+    must_include = set()
+    defaults = {}
+    for name, field_info in cls.model_fields.items():
+        keys = {name}
+        if field_info.serialization_alias:
+            keys.add(field_info.serialization_alias)
+            # field names take precedence over aliases
+            field_names.setdefault(field_info.serialization_alias, name)
+        if field_info.exclude is False:
+            must_include.update(keys)
         if field_info.default_factory is not None:
-            # adding a pyright ignore as it seems to be confused by both no posn args and the presence of args
-            default = field_info.default_factory()  # type: ignore
-        elif field_info.default is not PydanticUndefined:
-            default = field_info.default
+            # The factory is called once per class. Defaults are only
+            # compared against, never handed out, so sharing is safe.
+            defaults[name] = field_info.default_factory()  # type: ignore
         else:
-            default = PydanticUndefined
-        return getattr(self, field_name) == default
+            defaults[name] = field_info.default
+    for name in cls.model_fields:
+        field_names[name] = name
+    return _SerializationPlan(field_names, frozenset(must_include), defaults)
 
-    def _must_include(self, key: str) -> bool:
-        _, field_info = self._get_field_info(key)
-        if field_info.exclude is False:
-            return True
+
+@lru_cache(maxsize=None)
+def _validation_keys(cls: type[CdmObject]) -> dict[str, str]:
+    """
+    Return the key that validation accepts for each field of cls.
+    """
+    keys = {}
+    for name, field_info in cls.model_fields.items():
+        alias = field_info.validation_alias
+        if isinstance(alias, AliasChoices):
+            alias = alias.choices[0]
+        if not isinstance(alias, str):
+            alias = field_info.alias
+        keys[name] = alias or name
+    return keys
+
+
+class _Batch(NamedTuple):
+    """
+    :param values: field values on entry to CdmObject.batch_update()
+    :param fields_set: names of the fields set on entry
+    :param extra: extra fields on entry
+    :param assigned: names of the fields assigned since
+    """
+
+    values: dict[str, Any]
+    fields_set: set[str]
+    extra: Union[dict[str, Any], None]
+    assigned: set[str]
+
+
+def _field_values(obj: CdmObject) -> dict[str, Any]:
+    """
+    Return the dict of the field values of obj, which pydantic declares as
+    a read-only mapping.
+    """
+    return cast(dict[str, Any], obj.__dict__)
+
+
+def _batch_of(obj: CdmObject) -> Union[_Batch, None]:
+    try:
+        return object.__getattribute__(obj, "_batch")
+    except AttributeError:
+        return None
+
+
+def _validate_batch(obj: CdmObject, batch: _Batch) -> None:
+    """
+    Validate the fields of obj together, replacing their values with the
+    validated ones.
+    """
+    cls = type(obj)
+    if not cls.__pydantic_decorators__.model_validators:
+        # Nothing checks fields against each other, so validating those
+        # assigned, one at a time, is enough.
+        validate_assignment = cls.__pydantic_validator__.validate_assignment
+        for name in batch.assigned:
+            validate_assignment(obj, name, obj.__dict__[name])
+        return
+    keys = _validation_keys(cls)
+    values = {keys[name]: value for name, value in obj.__dict__.items()}
+    values.update(obj.__pydantic_extra__ or {})
+    validated = cls.model_validate(values)
+    _field_values(obj).update(validated.__dict__)
+    object.__setattr__(
+        obj, "__pydantic_fields_set__", batch.fields_set | batch.assigned
+    )
+    object.__setattr__(obj, "__pydantic_extra__", validated.__pydantic_extra__)
+
+
+class _FingerprintPlan(NamedTuple):
+    """
+    :param tag: identifies the class in the fingerprint
+    :param fields: (name, encoded name, encoding of the field when None)
+        of the fields that are hashed
+    """
+
+    tag: bytes
+    fields: tuple[tuple[str, bytes, bytes], ...]
+
+
+@lru_cache(maxsize=None)
+def _fingerprint_plan(cls: type[CdmObject]) -> _FingerprintPlan:
+    # frozen mirrors fingerprint as the class they mirror
+    named = getattr(cls, "mutable_class", cls)
+    tag = f"{named.__module__}.{named.__qualname__}".encode("utf-8")
+    fields = tuple(
+        (name, _encode_str(name), _encode_str(name) + b"n")
+        for name in cls.model_fields
+        if name not in cls.approximate_fields
+    )
+    return _FingerprintPlan(tag, fields)
+
+
+def _model_classes(annotation: Any) -> Iterator[type[CdmObject]]:
+    """
+    Return the CDM classes named by a field annotation, however nested.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, CdmObject):
+        yield annotation
+    for arg in get_args(annotation):
+        yield from _model_classes(arg)
+
+
+_EXACT_IN_PROGRESS: set[type[CdmObject]] = set()
+
+
+@lru_cache(maxsize=None)
+def _is_exact(cls: type[CdmObject]) -> bool:
+    """
+    Return True if no object that instances of cls can hold compares a
+    field within a tolerance, so that equal fingerprints mean equal objects.
+    """
+    if cls in _EXACT_IN_PROGRESS:
+        # recursive model, the other classes decide
+        return True
+    if cls.approximate_fields:
+        return False
+    _EXACT_IN_PROGRESS.add(cls)
+    try:
+        return all(
+            _is_exact(model_class)
+            for field_info in cls.model_fields.values()
+            for model_class in _model_classes(field_info.annotation)
+        )
+    finally:
+        _EXACT_IN_PROGRESS.discard(cls)
+
+
+def _cached_digest(obj: CdmObject) -> Union[bytes, None]:
+    try:
+        return object.__getattribute__(obj, "_fingerprint")
+    except AttributeError:
+        return None
+
+
+def _digest(obj: CdmObject) -> bytes:
+    """
+    Return the fingerprint of obj as bytes, computing and caching it, and
+    those of the objects it holds, if needed.
+    """
+    if (digest := _cached_digest(obj)) is not None:
+        return digest
+    plan = _fingerprint_plan(type(obj))
+    parts = [plan.tag]
+    values = obj.__dict__
+    for name, encoded_name, encoded_none in plan.fields:
+        # most fields are None or str, so these are handled inline
+        value = values[name]
+        if value is None:
+            parts.append(encoded_none)
+            continue
+        parts.append(encoded_name)
+        if type(value) is str:
+            parts.append(_encode_str(value))
         else:
-            return False
+            _encode(value, parts, obj)
+    if obj.__pydantic_extra__:
+        parts.append(b"x")
+        _encode(obj.__pydantic_extra__, parts, obj)
+    digest = blake2b(b"".join(parts), digest_size=16).digest()
+    object.__setattr__(obj, "_fingerprint", digest)
+    return digest
 
-    @staticmethod
-    def _is_empty(value: Any) -> bool:
-        return value in (None, [], {})
+
+def _encode_str(value: str) -> bytes:
+    encoded = value.encode("utf-8")
+    return b"s%d:%s" % (len(encoded), encoded)
+
+
+def _encode(value: Any, parts: list[bytes], owner: CdmObject) -> None:
+    """
+    Append an unambiguous encoding of a field value to parts. Values that
+    compare equal, e.g., 1 and 1.0 or a str enum and its value, are encoded
+    the same way.
+    """
+    kind = type(value)
+    if kind is str:
+        parts.append(_encode_str(value))
+    elif value is None:
+        parts.append(b"n")
+    elif kind is bool:
+        parts.append(b"t" if value else b"f")
+    elif kind is int:
+        parts.append(b"i%d;" % value)
+    elif kind is float:
+        if value.is_integer():
+            parts.append(b"i%d;" % value)
+        else:
+            parts.append(b"f%s;" % value.hex().encode("ascii"))
+    elif issubclass(kind, CdmObject):
+        parts.append(b"o")
+        parts.append(_digest(value))
+        if not value.model_config.get("frozen"):
+            # frozen objects never change, so need not say who depends on them
+            _add_dependent(value, owner)
+    elif kind is list or kind is tuple or isinstance(value, (list, tuple)):
+        parts.append(b"l%d:" % len(value))
+        for item in value:
+            if type(item) is int:
+                parts.append(b"i%d;" % item)
+            else:
+                _encode(item, parts, owner)
+    elif isinstance(value, (set, frozenset)):
+        parts.append(b"e%d:" % len(value))
+        parts.extend(sorted(_encoded(item, owner) for item in value))
+    elif isinstance(value, dict):
+        parts.append(b"d%d:" % len(value))
+        for key, item in sorted(
+            (_encoded(key, owner), _encoded(item, owner))
+            for key, item in value.items()
+        ):
+            parts.append(key)
+            parts.append(item)
+    elif isinstance(value, Enum):
+        _encode(value.value, parts, owner)
+    elif isinstance(value, str):
+        _encode(str(value), parts, owner)
+    elif isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        parts.append(_encode_str(value.isoformat()))
+    elif isinstance(value, (date, timedelta)):
+        parts.append(_encode_str(repr(value)))
+    else:
+        parts.append(b"r")
+        parts.append(_encode_str(f"{kind.__qualname__}:{value}"))
+
+
+def _encoded(value: Any, owner: CdmObject) -> bytes:
+    parts: list[bytes] = []
+    _encode(value, parts, owner)
+    return b"".join(parts)
+
+
+def _add_dependent(obj: CdmObject, dependent: CdmObject) -> None:
+    try:
+        dependents = object.__getattribute__(obj, "_fingerprint_dependents")
+    except AttributeError:
+        dependents = {}
+        object.__setattr__(obj, "_fingerprint_dependents", dependents)
+    dependents[id(dependent)] = weakref.ref(dependent)
+
+
+def _forget_fingerprint(obj: CdmObject) -> None:
+    """
+    Forget the cached fingerprint of obj and of every object whose cached
+    fingerprint depends on it.
+    """
+    pending = [obj]
+    while pending:
+        obj = pending.pop()
+        try:
+            object.__delattr__(obj, "_fingerprint")
+        except AttributeError:
+            # Nothing cached here, so nothing cached depends on it either
+            continue
+        try:
+            dependents = object.__getattribute__(
+                obj, "_fingerprint_dependents"
+            )
+        except AttributeError:
+            continue
+        object.__delattr__(obj, "_fingerprint_dependents")
+        for ref in dependents.values():
+            if (dependent := ref()) is not None:
+                pending.append(dependent)
+
+
+def _forget_fingerprints_within(obj: CdmObject) -> None:
+    """
+    Forget the cached fingerprints of obj and of the mutable objects it
+    holds, which changes made in place since they were computed would have
+    made stale. Frozen objects cannot change, so keep theirs.
+    """
+    pending: list[Any] = [obj]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, CdmObject):
+            if value.model_config.get("frozen"):
+                continue
+            try:
+                object.__delattr__(value, "_fingerprint")
+            except AttributeError:
+                pass
+            pending.extend(value.__dict__.values())
+            if value.__pydantic_extra__:
+                pending.extend(value.__pydantic_extra__.values())
+        elif isinstance(value, dict):
+            pending.extend(value.values())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            pending.extend(value)
+
+
+_PATH_STEP = re.compile(r"\.?([^.\[\]]+)|\[([^\]]*)\]")
+
+
+def _parse_path(path: str) -> list[str]:
+    """
+    Split a path as taken by CdmObject.with_path into field names, dict
+    keys and list indices. Whether a step is a key or an index is decided
+    by the container it is taken into, see _replaced.
+    """
+    steps: list[str] = []
+    position = 0
+    while position < len(path):
+        match = _PATH_STEP.match(path, position)
+        if match is None:
+            raise ValueError(f"Invalid path: {path!r}")
+        name, key = match.group(1), match.group(2)
+        # field names follow a dot, except the first
+        if name is not None and (path[position] == ".") == (position == 0):
+            raise ValueError(f"Invalid path: {path!r}")
+        # either a field name or a bracketed key matched
+        steps.append(name if name is not None else key)
+        position = match.end()
+    if not steps:
+        raise ValueError(f"Invalid path: {path!r}")
+    return steps
+
+
+def _replaced(node: Any, steps: list[str], value: Any) -> Any:
+    """
+    Return a copy of node with the value at steps replaced, copying the
+    objects and containers along the way.
+    """
+    if not steps:
+        return value
+    step, rest = steps[0], steps[1:]
+    if isinstance(node, CdmObject):
+        try:
+            name = _serialization_plan(type(node)).field_names[step]
+        except KeyError:
+            raise ValueError(
+                f"{type(node).__name__} has no field {step!r}"
+            ) from None
+        copy = node.model_copy()
+        # Not setattr, so that frozen objects can be copied the same way
+        type(node).__pydantic_validator__.validate_assignment(
+            copy, name, _replaced(node.__dict__[name], rest, value)
+        )
+        return copy
+    if isinstance(node, (list, tuple)):
+        if not step.isdigit() or int(step) >= len(node):
+            raise ValueError(f"No item {step!r} in list")
+        items = list(node)
+        index = int(step)
+        items[index] = _replaced(items[index], rest, value)
+        return type(node)(items)
+    if isinstance(node, dict):
+        # keys of dicts with int keys are written as digits too
+        key: Any = step
+        if key not in node and step.isdigit():
+            key = int(step)
+        if key not in node:
+            raise ValueError(f"No entry {step!r} in dict")
+        entries = dict(node)
+        entries[key] = _replaced(entries[key], rest, value)
+        return type(node)(entries)
+    raise ValueError(f"Cannot follow {step!r} into {node!r}")
@@ -2,7 +2,7 @@
 The messages module provides simple Python representations of the structured
 request and response for the TMC CentralNode.AssignResources command.
 """
-from typing import Callable, Optional
+from typing import Callable, ClassVar, Optional
 
 from pydantic import AliasChoices, Field, field_serializer, model_validator
 from typing_extensions import Self
@@ -59,6 +59,13 @@ class AssignResourcesRequest(CdmObject):
     interface: Optional[str] = None
     transaction_id: Optional[str] = None
 
+    subsystem_fields: ClassVar[tuple[str, ...]] = (
+        "dish",
+        "csp_config",
+        "sdp_config",
+        "mccs",
+    )
+
     @model_validator(mode="after")
     def validate_exclusive_fields(self) -> Self:
         if self.mccs is not None and self.subarray_id is None:
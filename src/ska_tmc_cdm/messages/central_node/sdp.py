@@ -3,7 +3,7 @@ The messages module provides simple Python representations of the structured
 request and response for the TMC CentralNode.AssignResources command.
 """
 import math
-from typing import Optional
+from typing import ClassVar, Optional
 
 from pydantic import Field
 
@@ -197,6 +197,8 @@ class PhaseDir(CdmObject):
     reference_time: Optional[str] = None
     reference_frame: Optional[str] = None
 
+    approximate_fields: ClassVar[frozenset[str]] = frozenset({"ra", "dec"})
+
     @staticmethod
     def _floatlist_eq(list_a: list[float], list_b: list[float]) -> bool:
         tol = 1e-15
@@ -0,0 +1,480 @@
+"""
+The frozen module contains immutable, hashable mirrors of the CDM classes,
+for objects that are shared between threads or used as dict and cache keys,
+e.g., one CSPConfiguration reused for many scans.
+
+frozen_class() generates, on first use, a subclass of a CDM class in which:
+
+* instances are frozen: assigning to a field raises a ValidationError.
+* list fields hold tuples, set fields frozensets and dict fields
+  FrozenDicts. Fields holding CDM objects hold their frozen mirrors.
+* __hash__ is structural and agrees with __eq__. Fields listed in
+  approximate_fields, which __eq__ compares within a tolerance, are left
+  out of the hash.
+
+As the mirror is a subclass of the mutable class, a frozen object can be
+used wherever the mutable class is expected, e.g., one frozen
+CSPConfiguration can be held by many mutable ConfigureRequests without
+being copied. Frozen objects serialise exactly as their mutable form.
+
+freeze() and thaw() convert between the two forms without validation,
+sharing every value that is already immutable.
+
+Validators that assign to fields, e.g., those that set a default interface,
+cannot run on a frozen class, so frozen objects are best made with freeze()
+from a validated mutable object.
+"""
+import copy
+import types
+import typing
+from functools import lru_cache
+from threading import RLock
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    NoReturn,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from pydantic import (
+    AfterValidator,
+    BeforeValidator,
+    ConfigDict,
+    GetCoreSchemaHandler,
+    PlainSerializer,
+    WrapSerializer,
+)
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined, core_schema
+
+from ska_tmc_cdm.messages.base import CdmObject
+
+__all__ = ["FrozenCdmObject", "FrozenDict", "freeze", "frozen_class", "thaw"]
+
+T = TypeVar("T", bound=CdmObject)
+K = TypeVar("K")
+V = TypeVar("V")
+
+Converter = Optional[Callable[[Any], Any]]
+
+
+class FrozenDict(dict[K, V]):
+    """
+    A dict that cannot be changed after it is created, and so is hashable.
+    """
+
+    __slots__ = ("_hash",)
+
+    def _immutable(self) -> TypeError:
+        return TypeError(f"{type(self).__name__} is immutable")
+
+    def __setitem__(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise self._immutable()
+
+    def __delitem__(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise self._immutable()
+
+    def __ior__(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise self._immutable()
+
+    def clear(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise self._immutable()
+
+    def pop(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise self._immutable()
+
+    def popitem(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise self._immutable()
+
+    def setdefault(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise self._immutable()
+
+    def update(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise self._immutable()
+
+    # dict declares __hash__ as None, as dicts are not hashable
+    def __hash__(self) -> int:  # type: ignore[override]
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self.items()))
+            return self._hash
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict.__repr__(self)})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        args = typing.get_args(source)
+        if args:
+            return core_schema.no_info_after_validator_function(
+                _freeze_value, handler.generate_schema(Dict[args[0], args[1]])
+            )
+        # untyped dicts hold JSON, which is dumped in its mutable form
+        return core_schema.no_info_after_validator_function(
+            _freeze_value,
+            handler.generate_schema(dict),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                _thaw_value
+            ),
+        )
+
+
+# Types of values that are immutable as they are, checked first as they are
+# the most common
+_IMMUTABLE = frozenset({str, int, float, bool, type(None), frozenset})
+
+
+def _freeze_value(value: Any) -> Any:
+    """
+    Return an immutable equivalent of a field value.
+    """
+    kind = type(value)
+    if kind in _IMMUTABLE or kind is FrozenDict:
+        return value
+    if kind is list or kind is tuple:
+        return tuple([_freeze_value(item) for item in value])
+    if kind in _MIRRORS:
+        return freeze(value)
+    if isinstance(value, CdmObject):
+        return freeze(value)
+    if isinstance(value, (list, tuple)):
+        return tuple([_freeze_value(item) for item in value])
+    if isinstance(value, set):
+        # set items are hashable already, and copying keeps their order
+        return frozenset(value)
+    if isinstance(value, dict) and not isinstance(value, FrozenDict):
+        return FrozenDict(
+            (key, _freeze_value(item)) for key, item in value.items()
+        )
+    return value
+
+
+def _thaw_value(value: Any) -> Any:
+    """
+    Return a mutable equivalent of a value of unknown type.
+    """
+    if isinstance(value, FrozenCdmObject):
+        return thaw(value)
+    if isinstance(value, tuple):
+        return [_thaw_value(item) for item in value]
+    if isinstance(value, frozenset):
+        return {_thaw_value(item) for item in value}
+    if isinstance(value, dict):
+        return {key: _thaw_value(item) for key, item in value.items()}
+    return value
+
+
+def _as_list(value: tuple, handler: Callable) -> Any:
+    # Fields that are lists in the mutable class dump as lists, so model_dump
+    # output is the same for both forms.
+    return list(handler(value))
+
+
+class FrozenCdmObject(CdmObject):
+    """
+    Base class of the frozen mirrors made by frozen_class().
+    """
+
+    __slots__ = ("_structural_hash",)
+
+    model_config = ConfigDict(frozen=True)
+
+    mutable_class: ClassVar[type[CdmObject]] = CdmObject
+
+    def __hash__(self) -> int:
+        # Cached, as nothing that goes into it can change
+        try:
+            return self._structural_hash
+        except AttributeError:
+            pass
+        value = hash(
+            (
+                type(self),
+                *(self.__dict__[name] for name in _hashed(type(self))),
+            )
+        )
+        object.__setattr__(self, "_structural_hash", value)
+        return value
+
+    def __reduce__(self):
+        # Generated classes can't be found by name, so pickle the mutable
+        # form instead
+        return freeze, (thaw(self),)
+
+
+@lru_cache(maxsize=None)
+def _hashed(cls: type[CdmObject]) -> tuple[str, ...]:
+    return tuple(
+        name for name in cls.model_fields if name not in cls.approximate_fields
+    )
+
+
+def _is_cdm_class(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, CdmObject)
+
+
+def _frozen_annotation(annotation: Any) -> Any:
+    """
+    Return the frozen equivalent of a field annotation.
+    """
+    if _is_cdm_class(annotation):
+        return frozen_class(annotation)
+    if annotation is list:
+        return Annotated[
+            tuple, AfterValidator(_freeze_value), PlainSerializer(_thaw_value)
+        ]
+    if annotation is set:
+        return frozenset
+    if annotation is dict:
+        return FrozenDict
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is Annotated:
+        return Annotated[
+            (_frozen_annotation(args[0]), *annotation.__metadata__)
+        ]
+    if origin is list:
+        return Annotated[
+            tuple[_frozen_annotation(args[0]), ...],
+            WrapSerializer(_as_list),
+        ]
+    if origin is set or origin is frozenset:
+        return frozenset[_frozen_annotation(args[0])]
+    if origin is dict:
+        return FrozenDict[args[0], _frozen_annotation(args[1])]
+
+    frozen_args = tuple(
+        arg if arg is Ellipsis else _frozen_annotation(arg) for arg in args
+    )
+    if frozen_args == args:
+        return annotation
+    if origin is Union or origin is types.UnionType:
+        return Union[frozen_args]
+    if origin is tuple:
+        return tuple[frozen_args]
+    raise TypeError(f"Cannot make a frozen equivalent of {annotation}")
+
+
+def _frozen_factory(
+    field_info: FieldInfo,
+) -> Union[Callable[[], Any], Callable[[dict[str, Any]], Any]]:
+    """
+    Return a default factory making the frozen form of the defaults made by
+    the default factory of a field.
+    """
+    if field_info.default_factory_takes_validated_data:
+        factory_of_data = cast(
+            Callable[[dict[str, Any]], Any], field_info.default_factory
+        )
+        return lambda data: _freeze_value(factory_of_data(data))
+    factory = cast(Callable[[], Any], field_info.default_factory)
+    if factory is list or factory is tuple:
+        return tuple
+    if factory is set or factory is frozenset:
+        return frozenset
+    if factory is dict:
+        return FrozenDict
+    return lambda: _freeze_value(factory())
+
+
+# Frozen mirror of each class, and of each mirror itself
+_MIRRORS: dict[type, type] = {}
+_LOCK = RLock()
+
+
+def frozen_class(cls: type[T]) -> type[T]:
+    """
+    Return the frozen mirror of a CDM class, generating it on first use.
+
+    :param cls: the mutable CDM class
+    :return: a frozen, hashable subclass of cls
+    """
+    if (mirror := _MIRRORS.get(cls)) is not None:
+        return mirror  # type: ignore
+    if issubclass(cls, FrozenCdmObject):
+        return cls
+    # One mirror per class, even when first used by several threads at once
+    with _LOCK:
+        if cls not in _MIRRORS:
+            mirror = _frozen_class(cls)
+            _MIRRORS[cls] = _MIRRORS[mirror] = mirror
+        return _MIRRORS[cls]  # type: ignore
+
+
+def _frozen_class(cls: type[T]) -> type[T]:
+
+    # Fields whose input is converted by a validator of cls, which may build
+    # mutable objects, e.g., a DishAllocation from a list of IDs
+    converted = {
+        name
+        for decorator in cls.__pydantic_decorators__.field_validators.values()
+        if decorator.info.mode != "after"
+        for name in decorator.info.fields
+    }
+    annotations = {}
+    namespace: dict[str, Any] = {}
+    for name, field_info in cls.model_fields.items():
+        annotation = _frozen_annotation(field_info.annotation)
+        if name in converted:
+            annotation = Annotated[annotation, BeforeValidator(_freeze_value)]
+        default = field_info.default
+        if field_info.default_factory is None:
+            frozen_default = _freeze_value(default)
+        else:
+            frozen_default = default
+        if annotation is field_info.annotation and frozen_default is default:
+            continue
+        overrides: dict[str, Any] = {"annotation": annotation}
+        if field_info.default_factory is not None:
+            overrides["default_factory"] = _frozen_factory(field_info)
+        elif default is not PydanticUndefined:
+            overrides["default"] = frozen_default
+        # from a deep copy, as pydantic merges the annotation into the
+        # metadata of the FieldInfo in place, and merge_field_infos() only
+        # copies the FieldInfo shallowly, either of which would change the
+        # mutable class'
+        annotations[name] = annotation
+        namespace[name] = FieldInfo.merge_field_infos(
+            copy.deepcopy(field_info), **overrides
+        )
+
+    return type(  # type: ignore
+        f"Frozen{cls.__name__}",
+        (FrozenCdmObject, cls),
+        {
+            "__module__": cls.__module__,
+            "__qualname__": f"Frozen{cls.__qualname__}",
+            "__annotations__": annotations,
+            "mutable_class": cls,
+            **namespace,
+        },
+    )
+
+
+def _construct(cls: type[T], values: dict[str, Any], source: CdmObject) -> T:
+    """
+    Create an instance of cls from already valid values, keeping the fields
+    set, extra fields and private attributes of source.
+    """
+    obj = cls.__new__(cls)
+    object.__setattr__(obj, "__dict__", values)
+    object.__setattr__(
+        obj, "__pydantic_fields_set__", set(source.__pydantic_fields_set__)
+    )
+    object.__setattr__(obj, "__pydantic_extra__", source.__pydantic_extra__)
+    object.__setattr__(
+        obj, "__pydantic_private__", source.__pydantic_private__
+    )
+    return obj
+
+
+def freeze(obj: T) -> T:
+    """
+    Return the frozen equivalent of a CDM object, without validation.
+
+    Frozen objects, and frozen objects nested inside obj, are returned as
+    they are rather than copied.
+
+    :param obj: the object to freeze. Other values are returned unchanged.
+    :return: an instance of frozen_class(type(obj))
+    """
+    cls = _MIRRORS.get(type(obj))
+    if cls is None:
+        if isinstance(obj, FrozenCdmObject) or not isinstance(obj, CdmObject):
+            return obj
+        cls = frozen_class(type(obj))
+    elif cls is type(obj):
+        return obj
+    values = {
+        name: _freeze_value(value) for name, value in obj.__dict__.items()
+    }
+    return cast(T, _construct(cls, values, obj))
+
+
+def _thaw_converter(annotation: Any) -> Converter:
+    """
+    Return the function that converts a frozen value back to the type of a
+    mutable field annotation, or None if the frozen value can be used as it
+    is.
+    """
+    if _is_cdm_class(annotation):
+        return thaw
+    if annotation is list or annotation is set or annotation is dict:
+        return _thaw_value
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is Annotated:
+        return _thaw_converter(args[0])
+    if origin is Union or origin is types.UnionType:
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) == 1:
+            convert = _thaw_converter(members[0])
+            if convert is None:
+                return None
+            return lambda value: None if value is None else convert(value)
+        if all(_thaw_converter(member) is None for member in members):
+            return None
+        if any(typing.get_origin(member) is tuple for member in members):
+            # a tuple could be either member, so only thaw CDM objects
+            return lambda value: (
+                thaw(value) if isinstance(value, FrozenCdmObject) else value
+            )
+        return _thaw_value
+    if origin is list or origin is set:
+        item = _thaw_converter(args[0]) or (lambda value: value)
+        return lambda value: origin(item(element) for element in value)
+    if origin is dict:
+        item = _thaw_converter(args[1])
+        if item is None:
+            return dict
+        return lambda value: {key: item(val) for key, val in value.items()}
+    if origin is tuple or origin is frozenset:
+        items = [_thaw_converter(arg) for arg in args if arg is not Ellipsis]
+        if all(item is None for item in items):
+            return None
+        return _thaw_value
+    return None
+
+
+@lru_cache(maxsize=None)
+def _thaw_plan(cls: type[CdmObject]) -> dict[str, Converter]:
+    return {
+        name: _thaw_converter(field_info.annotation)
+        for name, field_info in cls.model_fields.items()
+    }
+
+
+def thaw(obj: T) -> T:
+    """
+    Return the mutable equivalent of a frozen CDM object, without
+    validation.
+
+    Only lists, sets, dicts and CDM objects are copied. Mutable objects are
+    returned as they are.
+
+    :param obj: the object to thaw
+    :return: an instance of the mutable class obj mirrors
+    """
+    if not isinstance(obj, FrozenCdmObject):
+        return obj
+    cls = obj.mutable_class
+    plan = _thaw_plan(cls)
+    values = {}
+    for name, value in obj.__dict__.items():
+        convert = plan.get(name)
+        values[name] = value if convert is None else convert(value)
+    return cast(T, _construct(cls, values, obj))
@@ -0,0 +1,193 @@
+"""
+The interning module deduplicates values repeated within and across decoded
+CDM objects, e.g., receptor IDs, interface URIs and sub-objects such as
+channel blocks and beam entries, so that a long-running process holds one
+copy of each.
+
+Strings are interned with sys.intern(), so are released when no longer
+used. Frozen sub-objects (see ska_tmc_cdm.messages.frozen) are shared
+through a bounded table of weak references, keyed by fingerprint. Mutable
+objects are never shared, as changing one would change the others, but the
+strings they hold are.
+
+Interning is opt-in, e.g., Codec.loads(cls, json_data, intern=True).
+"""
+__all__ = ["InternTable", "InternTableInfo", "INTERN_TABLE"]
+
+import sys
+import threading
+import weakref
+from os import environ
+from typing import Any, Hashable, NamedTuple, TypeVar
+
+from ska_tmc_cdm.messages.base import (
+    CdmObject,
+    _digest,
+    _field_values,
+    _is_exact,
+)
+from ska_tmc_cdm.messages.frozen import FrozenCdmObject, FrozenDict
+
+# Maximum number of frozen objects to hold. When full, objects not already
+# held are no longer shared.
+INTERN_TABLE_SIZE = int(environ.get("INTERN_TABLE_SIZE", 65536))
+
+# Longer strings are rarely repeated, so are not interned.
+INTERN_MAX_STR_LENGTH = int(environ.get("INTERN_MAX_STR_LENGTH", 128))
+
+T = TypeVar("T")
+
+
+class InternTableInfo(NamedTuple):
+    """
+    Intern table statistics, counting frozen objects only.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class InternTable:
+    """
+    Thread-safe, bounded table of weak references to frozen CDM objects.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = INTERN_TABLE_SIZE,
+        max_str_length: int = INTERN_MAX_STR_LENGTH,
+    ):
+        """
+        :param maxsize: maximum number of frozen objects to hold
+        :param max_str_length: length of the longest string to intern
+        """
+        self.maxsize = maxsize
+        self.max_str_length = max_str_length
+        self._objects: weakref.WeakValueDictionary[
+            Hashable, FrozenCdmObject
+        ] = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self._hits = self._misses = 0
+
+    def intern(self, value: T) -> T:
+        """
+        Return value with the strings and frozen objects it holds replaced
+        by equal ones already in use.
+
+        Mutable objects, lists, dicts and sets are changed in place, so
+        should not be in use elsewhere, e.g., should be freshly decoded.
+
+        :param value: a CDM object, or a value held by one
+        :return: value, or an equal value already in use
+        """
+        kind = type(value)
+        if kind is str:
+            if len(value) <= self.max_str_length:  # type: ignore
+                return sys.intern(value)  # type: ignore
+            return value
+        if issubclass(kind, CdmObject):
+            return self._intern_object(value)  # type: ignore
+        if kind is list:
+            value[:] = [self.intern(item) for item in value]  # type: ignore
+            return value
+        if kind is tuple:
+            return tuple(self.intern(item) for item in value)  # type: ignore
+        if kind is dict:
+            entries = [
+                (self.intern(key), self.intern(item))
+                for key, item in value.items()  # type: ignore
+            ]
+            value.clear()  # type: ignore
+            value.update(entries)  # type: ignore
+            return value
+        if kind is FrozenDict:
+            return FrozenDict(  # type: ignore
+                (self.intern(key), self.intern(item))
+                for key, item in value.items()  # type: ignore
+            )
+        if kind is set:
+            items = [self.intern(item) for item in value]  # type: ignore
+            value.clear()  # type: ignore
+            value.update(items)  # type: ignore
+            return value
+        if kind is frozenset:
+            return frozenset(  # type: ignore
+                self.intern(item) for item in value  # type: ignore
+            )
+        return value
+
+    def _intern_object(self, obj: CdmObject) -> CdmObject:
+        values = _field_values(obj)
+        for name, value in values.items():
+            interned = self.intern(value)
+            if interned is not value:
+                # equal, so neither validation nor fingerprints are affected
+                values[name] = interned
+        if obj.__pydantic_extra__:
+            self.intern(obj.__pydantic_extra__)
+        cls = type(obj)
+        if not isinstance(obj, FrozenCdmObject) or not _is_exact(cls):
+            # Mutable objects cannot be shared, and objects whose equality
+            # allows a tolerance may hold values differing in detail.
+            return obj
+
+        # Equal values of different types, e.g., 1 and 1.0, or a str enum
+        # and its str, have the same fingerprint but are not the same.
+        key = (
+            cls,
+            _digest(obj),
+            frozenset(obj.model_fields_set),
+            _types(tuple(values.values())),
+        )
+        with self._lock:
+            held = self._objects.get(key)
+            if held is not None:
+                self._hits += 1
+                return held
+            self._misses += 1
+            if len(self._objects) < self.maxsize:
+                self._objects[key] = obj
+        return obj
+
+    def clear(self) -> None:
+        """
+        Forget every frozen object held and reset the statistics.
+        """
+        with self._lock:
+            self._objects.clear()
+            self._hits = self._misses = 0
+
+    def info(self) -> InternTableInfo:
+        """
+        Return statistics about the use of the table.
+        """
+        with self._lock:
+            return InternTableInfo(
+                self._hits, self._misses, self.maxsize, len(self._objects)
+            )
+
+
+def _types(value: Any) -> Hashable:
+    """
+    Return the types of a value and of the values it holds.
+
+    CDM objects held have already been interned, so stand for themselves:
+    equal objects of the same types are then the same object, and objects
+    not shared differ from every object held in the table.
+    """
+    kind = type(value)
+    if issubclass(kind, CdmObject):
+        return id(value)
+    if kind in (list, tuple, set, frozenset):
+        return (kind, tuple(_types(item) for item in value))
+    if kind in (dict, FrozenDict):
+        return (
+            kind,
+            tuple((_types(k), _types(item)) for k, item in value.items()),
+        )
+    return kind
+
+
+INTERN_TABLE = InternTable()
@@ -0,0 +1,259 @@
+"""
+The lazy module contains a read-only wrapper for CDM requests whose subsystem
+blocks are only validated when first accessed.
+
+A consumer that only needs its own slice of a large request, e.g., a CSP leaf
+node reading ``ConfigureRequest.csp``, then does not pay to validate the SDP,
+MCCS and Dish blocks it never touches.
+"""
+import inspect
+from functools import lru_cache
+from typing import Any, Generic, TypeVar, Union
+
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    ConfigDict,
+    create_model,
+    field_serializer,
+    field_validator,
+)
+
+from ska_tmc_cdm.messages.base import CdmObject
+
+__all__ = ["FieldAdapter", "LazyMessage", "field_adapter", "input_names"]
+
+T = TypeVar("T", bound=CdmObject)
+
+
+@lru_cache(maxsize=None)
+def input_names(cdm_class: type[CdmObject]) -> dict[str, str]:
+    """
+    Return a map of each accepted input key to its field name.
+    """
+    names = {}
+    for name, field_info in cdm_class.model_fields.items():
+        names[name] = name
+        alias = field_info.validation_alias
+        if isinstance(alias, AliasChoices):
+            names.update({choice: name for choice in alias.choices})
+        elif isinstance(alias, str):
+            names[alias] = name
+        elif field_info.alias:
+            names[field_info.alias] = name
+    return names
+
+
+class FieldAdapter:
+    """
+    Validator and serialiser for one field of a CDM class, used as a pydantic
+    TypeAdapter for the field's type would be.
+
+    As well as the field's type and constraints, the field validators and
+    field serialisers the class defines for the field are applied, so that a
+    value validates and serialises as it would as part of an instance.
+    Model validators, which may span several fields, are not applied.
+
+    The validators and serialisers are run on a model holding only this
+    field, so only see this field's value.
+    """
+
+    __slots__ = ("name", "_model")
+
+    def __init__(self, cdm_class: type[CdmObject], name: str):
+        """
+        :param cdm_class: the CDM class
+        :param name: the name of the field
+        """
+        self.name = name
+        decorators = cdm_class.__pydantic_decorators__
+        namespace: dict[str, Any] = {}
+        for attribute, decorator in decorators.field_validators.items():
+            if _applies_to(decorator.info.fields, name):
+                func = decorator.func
+                if inspect.ismethod(func):
+                    # a classmethod, already bound to cdm_class
+                    func = staticmethod(func)
+                namespace[attribute] = field_validator(
+                    name, mode=decorator.info.mode
+                )(func)
+        for attribute, decorator in decorators.field_serializers.items():
+            if _applies_to(decorator.info.fields, name):
+                namespace[attribute] = field_serializer(
+                    name,
+                    mode=decorator.info.mode,
+                    when_used=decorator.info.when_used,
+                    return_type=decorator.info.return_type,
+                )(decorator.func)
+        field_info = cdm_class.model_fields[name]
+        config = ConfigDict(**cdm_class.model_config)
+        config["populate_by_name"] = True
+        fields: dict[str, Any] = {name: (field_info.annotation, field_info)}
+        self._model: type[BaseModel] = create_model(
+            f"{cdm_class.__name__}_{name}",
+            __config__=config,
+            __validators__=namespace,
+            **fields,
+        )
+
+    def validate_python(self, value: Any) -> Any:
+        """
+        Return a field value validated from a Python object.
+
+        :param value: the value, e.g., as parsed from JSON
+        :raises: a pydantic ValidationError if value is not valid
+        """
+        return self._model.model_validate({self.name: value}).__dict__[
+            self.name
+        ]
+
+    def validate_json(
+        self, json_data: Union[str, bytes, bytearray, memoryview]
+    ) -> Any:
+        """
+        Return a field value validated from JSON, as it would be as part of
+        the JSON of an instance.
+
+        :param json_data: JSON text of the value, as str or UTF-8 bytes
+        :raises: a pydantic ValidationError if value is not valid
+        """
+        if isinstance(json_data, str):
+            wrapped: Union[str, bytes] = f'{{"{self.name}":{json_data}}}'
+        else:
+            wrapped = b'{"%s":%s}' % (self.name.encode(), json_data)
+        return self._model.model_validate_json(wrapped).__dict__[self.name]
+
+    def dump_python(self, value: Any, **kwargs: Any) -> Any:
+        """
+        Return a field value serialised as it would be as part of an
+        instance, or None if it would be left out.
+
+        :param value: the value
+        :param kwargs: options of BaseModel.model_dump(), e.g., mode="json"
+        """
+        dumped = self._model.model_construct(**{self.name: value}).model_dump(
+            include={self.name}, **kwargs
+        )
+        field_info = self._model.model_fields[self.name]
+        if kwargs.get("by_alias") and field_info.serialization_alias:
+            return dumped.get(field_info.serialization_alias)
+        return dumped.get(self.name)
+
+
+def _applies_to(fields: tuple[str, ...], name: str) -> bool:
+    return name in fields or "*" in fields
+
+
+@lru_cache(maxsize=None)
+def field_adapter(cdm_class: type[CdmObject], name: str) -> FieldAdapter:
+    """
+    Return a validator and serialiser for one field of a CDM class, applying
+    the field's type and constraints and the class's field validators and
+    serialisers.
+    """
+    return FieldAdapter(cdm_class, name)
+
+
+class LazyMessage(Generic[T]):
+    """
+    Read-only view of a CDM request that validates top-level fields eagerly
+    and each subsystem block on first access.
+
+    The subsystem blocks of a class are named by its subsystem_fields class
+    variable. Validated blocks are cached. Model-level validators that span
+    several blocks are only run by to_model(), which returns the complete,
+    fully validated object.
+
+    Values given as JSON text are validated in JSON mode, as by
+    Codec.loads, rather than in Python mode.
+    """
+
+    __slots__ = ("_cdm_class", "_values", "_raw", "_from_json")
+
+    def __init__(
+        self,
+        cdm_class: type[T],
+        data: dict[str, Any],
+        from_json: bool = False,
+    ):
+        """
+        :param cdm_class: the class to create from the data
+        :param data: the not yet validated JSON object, parsed or, with
+            from_json=True, as the JSON text of each value
+        :param from_json: True if the values of data are JSON text
+        """
+        self._cdm_class = cdm_class
+        self._values: dict[str, Any] = {}
+        self._raw: dict[str, Any] = {}
+        self._from_json = from_json
+
+        names = input_names(cdm_class)
+        for key, value in data.items():
+            if (name := names.get(key)) is None:
+                continue
+            if name in cdm_class.subsystem_fields:
+                self._raw[name] = value
+            else:
+                self._values[name] = self._validate(name, value)
+
+        for name, field_info in cdm_class.model_fields.items():
+            if name not in self._values and name not in self._raw:
+                if field_info.is_required():
+                    raise ValueError(f"{cdm_class.__name__}.{name} required")
+
+    def __getattr__(self, name: str) -> Any:
+        model_fields = self._cdm_class.model_fields
+        if name not in model_fields:
+            raise AttributeError(name)
+        if name in self._values:
+            return self._values[name]
+        if name in self._raw:
+            value = self._validate(name, self._raw[name])
+            self._values[name] = value
+            del self._raw[name]
+            return value
+        return model_fields[name].get_default(call_default_factory=True)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in LazyMessage.__slots__:
+            super().__setattr__(name, value)
+        else:
+            raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def _validate(self, name: str, value: Any) -> Any:
+        adapter = field_adapter(self._cdm_class, name)
+        if self._from_json:
+            return adapter.validate_json(value)
+        return adapter.validate_python(value)
+
+    def is_decoded(self, name: str) -> bool:
+        """
+        Return True if the named field has been validated.
+
+        :param name: field name
+        """
+        return name not in self._raw
+
+    def to_model(self) -> T:
+        """
+        Return the complete CDM object, validating any blocks that have not
+        been accessed and running all model validators.
+        """
+        # Blocks that were already validated are passed through unchanged,
+        # so they are not validated a second time.
+        raw = self._raw
+        if self._from_json:
+            raw = {
+                name: self._validate(name, value)
+                for name, value in raw.items()
+            }
+        return self._cdm_class.model_validate({**raw, **self._values})
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}=<not decoded>"
+            if name in self._raw
+            else f"{name}={value!r}"
+            for name, value in {**self._values, **self._raw}.items()
+        )
+        return f"LazyMessage[{self._cdm_class.__name__}]({fields})"
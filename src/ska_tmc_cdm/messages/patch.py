@@ -0,0 +1,537 @@
+"""
+The patch module contains a structural diff between two CDM objects and a
+way to apply it, e.g., to send only what changed between the
+ConfigureRequests of consecutive scans, or to log configuration changes
+compactly.
+
+A patch is a list of PatchOperations in the style of JSON Patch (RFC 6902).
+Paths are JSON Pointers (RFC 6901) into the serialised form of the object,
+so use serialisation aliases, e.g., ``/csp/common/config_id`` or
+``/pointing/groups/0/field``. Values are CDM values, e.g., CDM objects and
+enums, and dump_patch() converts them to JSON.
+
+diff() only descends into objects whose fingerprints differ, so once
+fingerprints are cached it takes time proportional to the changed subtrees.
+Assigning a field forgets the cached fingerprints it affects, but, as for
+CdmObject.fingerprint(), changes made in place, e.g., appending to a list
+field, are not seen unless diff() is told about them. Fields serialised by
+a field serialiser of their class are compared and replaced whole, as their
+serialised form need not follow their structure. Dict keys that are not
+strings, e.g., ints, are written to paths as strings and matched by their
+string form.
+apply() assigns each value to the object that holds it, so values are
+validated by the field's validators, converted from JSON if need be, and
+cached fingerprints are forgotten.
+"""
+import json
+import types
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Any,
+    Literal,
+    NamedTuple,
+    Optional,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic_core import PydanticUndefined, to_jsonable_python
+
+from ska_tmc_cdm.messages.base import (
+    CdmObject,
+    _digest,
+    _forget_fingerprints_within,
+    _is_exact,
+    _model_classes,
+    _serialization_plan,
+)
+from ska_tmc_cdm.messages.lazy import field_adapter
+
+__all__ = [
+    "PatchOperation",
+    "apply",
+    "diff",
+    "dump_patch",
+    "load_patch",
+]
+
+Path = tuple[Union[str, int], ...]
+
+
+class PatchOperation(NamedTuple):
+    """
+    One change made by a patch.
+
+    :param op: "add" or "remove" for a value that is set or cleared, i.e.,
+        changed from or to None or, for list items and dict entries, added
+        or removed; "replace" otherwise
+    :param path: JSON Pointer to the value
+    :param value: the new value, None for "remove"
+    """
+
+    op: Literal["add", "remove", "replace"]
+    path: str
+    value: Any = None
+
+
+def _escape(segment: Union[str, int]) -> str:
+    return str(segment).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(segment: str) -> str:
+    return segment.replace("~1", "/").replace("~0", "~")
+
+
+def _pointer(path: Path) -> str:
+    return "".join("/" + _escape(segment) for segment in path)
+
+
+def _split(pointer: str) -> list[str]:
+    if not pointer.startswith("/"):
+        raise ValueError(f"Not a JSON Pointer to a field: {pointer!r}")
+    return [_unescape(segment) for segment in pointer[1:].split("/")]
+
+
+@lru_cache(maxsize=None)
+def _keys(cls: type[CdmObject]) -> tuple[tuple[str, str, Any], ...]:
+    """
+    Return (field name, serialised key, default) of each field of cls.
+    """
+    defaults = _serialization_plan(cls).defaults
+    return tuple(
+        (name, field_info.serialization_alias or name, defaults[name])
+        for name, field_info in cls.model_fields.items()
+    )
+
+
+@lru_cache(maxsize=None)
+def _whole_fields(cls: type[CdmObject]) -> frozenset[str]:
+    """
+    Return the names of the fields of cls that a field serialiser of cls
+    serialises, which diff() replaces whole.
+    """
+    return frozenset(
+        name
+        for decorator in cls.__pydantic_decorators__.field_serializers.values()
+        for name in (
+            cls.model_fields
+            if "*" in decorator.info.fields
+            else decorator.info.fields
+        )
+    )
+
+
+@lru_cache(maxsize=None)
+def _inexact_keys(cls: type[CdmObject]) -> tuple[tuple[str, str, Any], ...]:
+    """
+    Return the entries of _keys(cls) for fields that can hold objects whose
+    classes are not exact, the only fields that can differ between
+    instances of cls with equal fingerprints.
+    """
+    return tuple(
+        entry
+        for entry in _keys(cls)
+        if not all(
+            _is_exact(model_class)
+            for model_class in _model_classes(
+                cls.model_fields[entry[0]].annotation
+            )
+        )
+    )
+
+
+def diff(
+    old: CdmObject, new: CdmObject, changed_in_place: bool = False
+) -> list[PatchOperation]:
+    """
+    Return the patch that changes old into new.
+
+    :param old: the object to change
+    :param new: the object to change it into, of the same class
+    :param changed_in_place: True if either object may have been changed
+        in place since its fingerprint was computed, to compute the
+        fingerprints of the mutable objects they hold afresh
+    :return: operations that apply() can apply to old, or to an object
+        equal to it
+    :raises: TypeError if old and new are of different classes
+    """
+    if type(old) is not type(new):
+        raise TypeError(
+            f"Cannot diff {type(old).__name__} against {type(new).__name__}"
+        )
+    if changed_in_place:
+        for obj in (old, new):
+            _forget_fingerprints_within(obj)
+    patch: list[PatchOperation] = []
+    _diff_objects(old, new, (), patch)
+    return patch
+
+
+def _diff_objects(
+    old: CdmObject, new: CdmObject, path: Path, patch: list[PatchOperation]
+) -> None:
+    if old is new:
+        return
+    cls = type(old)
+    keys = _keys(cls)
+    if _digest(old) == _digest(new):
+        # Equal fingerprints leave only fields compared within a tolerance
+        # to check, in this object or in the objects it holds.
+        if cls.approximate_fields:
+            if old == new:
+                return
+        else:
+            keys = _inexact_keys(cls)
+    old_values, new_values = old.__dict__, new.__dict__
+    whole = _whole_fields(cls)
+    for name, key, default in keys:
+        old_value, new_value = old_values[name], new_values[name]
+        if old_value is new_value:
+            continue
+        field_path = path + (key,)
+        if new_value is None and default is None:
+            if old_value is not None:
+                patch.append(PatchOperation("remove", _pointer(field_path)))
+        elif old_value is None and default is None:
+            patch.append(
+                PatchOperation("add", _pointer(field_path), new_value)
+            )
+        elif name in whole:
+            if old_value != new_value:
+                patch.append(
+                    PatchOperation("replace", _pointer(field_path), new_value)
+                )
+        else:
+            _diff_values(old_value, new_value, field_path, patch)
+
+
+def _diff_values(
+    old: Any, new: Any, path: Path, patch: list[PatchOperation]
+) -> None:
+    kind = type(old)
+    if kind is not type(new):
+        if old != new:
+            patch.append(PatchOperation("replace", _pointer(path), new))
+    elif issubclass(kind, CdmObject):
+        _diff_objects(old, new, path, patch)
+    elif issubclass(kind, (list, tuple)):
+        _diff_lists(old, new, path, patch)
+    elif issubclass(kind, dict):
+        _diff_dicts(old, new, path, patch)
+    elif old != new:
+        patch.append(PatchOperation("replace", _pointer(path), new))
+
+
+def _diff_lists(
+    old: Union[list, tuple],
+    new: Union[list, tuple],
+    path: Path,
+    patch: list[PatchOperation],
+) -> None:
+    changes: list[PatchOperation] = []
+    common = min(len(old), len(new))
+    for index in range(common):
+        _diff_values(old[index], new[index], path + (index,), changes)
+    for index in range(common, len(new)):
+        changes.append(
+            PatchOperation("add", _pointer(path + ("-",)), new[index])
+        )
+    # from the end, so that each index is still valid when removed
+    for index in reversed(range(common, len(old))):
+        changes.append(PatchOperation("remove", _pointer(path + (index,))))
+    if len(changes) > max(1, len(new) // 2):
+        # replacing the whole list is shorter
+        patch.append(PatchOperation("replace", _pointer(path), new))
+    else:
+        patch.extend(changes)
+
+
+def _diff_dicts(
+    old: dict, new: dict, path: Path, patch: list[PatchOperation]
+) -> None:
+    for key, old_value in old.items():
+        if key not in new:
+            patch.append(PatchOperation("remove", _pointer(path + (key,))))
+        else:
+            _diff_values(old_value, new[key], path + (key,), patch)
+    for key, new_value in new.items():
+        if key not in old:
+            patch.append(
+                PatchOperation("add", _pointer(path + (key,)), new_value)
+            )
+
+
+def apply(obj: CdmObject, patch: list[PatchOperation]) -> CdmObject:
+    """
+    Apply a patch to a CDM object, in place.
+
+    The changes to each object are validated together, once every operation
+    has been followed, so a patch may change fields that validators check
+    against each other. If validation fails, objects validated before the
+    failure keep their changes.
+
+    :param obj: the object to change
+    :param patch: operations made by diff() or load_patch()
+    :return: obj
+    :raises: ValueError if a path does not exist in obj, or a pydantic
+        ValidationError if a value is not valid where it is put
+    """
+    pending: dict[int, tuple[CdmObject, dict[str, Any]]] = {}
+    for operation in patch:
+        _apply(obj, PatchOperation(*operation), pending)
+    for owner, changes in pending.values():
+        _assign(owner, changes)
+    return obj
+
+
+def _field_name(obj: CdmObject, key: str) -> str:
+    try:
+        return _serialization_plan(type(obj)).field_names[key]
+    except KeyError:
+        raise ValueError(
+            f"{type(obj).__name__} has no field {key!r}"
+        ) from None
+
+
+def _apply(
+    obj: CdmObject,
+    operation: PatchOperation,
+    pending: dict[int, tuple[CdmObject, dict[str, Any]]],
+) -> None:
+    """
+    Add the field assignment that makes a change to pending, keyed by the
+    id of the object assigned to.
+    """
+    segments = _split(operation.path)
+    # Follow the path through CDM objects for as long as possible, so that
+    # assignment is to the object nearest the change.
+    while True:
+        name = _field_name(obj, segments[0])
+        rest = segments[1:]
+        changes = pending.get(id(obj), (obj, {}))[1]
+        value = changes[name] if name in changes else obj.__dict__[name]
+        if rest and isinstance(value, CdmObject):
+            obj, segments = value, rest
+            continue
+        if (
+            len(rest) > 1
+            and isinstance(value, (list, tuple))
+            and rest[0] != "-"
+            and isinstance(item := _item(value, rest[0]), CdmObject)
+        ):
+            obj, segments = item, rest[1:]
+            continue
+        if (
+            len(rest) > 1
+            and isinstance(value, dict)
+            and isinstance(value.get(key := _key(value, rest[0])), CdmObject)
+        ):
+            obj, segments = value[key], rest[1:]
+            continue
+        break
+
+    if rest:
+        value = _changed(value, rest, operation)
+    elif operation.op == "remove":
+        value = _default(obj, name)
+    else:
+        value = operation.value
+    pending.setdefault(id(obj), (obj, {}))[1][name] = value
+
+
+def _assign(obj: CdmObject, changes: dict[str, Any]) -> None:
+    """
+    Assign new values to fields of obj, validating them together.
+    """
+    if len(changes) == 1:
+        [(name, value)] = changes.items()
+        setattr(obj, name, value)
+        return
+    with obj.batch_update():
+        for name, value in changes.items():
+            setattr(obj, name, value)
+
+
+def _default(obj: CdmObject, name: str) -> Any:
+    field_info = type(obj).model_fields[name]
+    if field_info.default_factory is not None:
+        return field_info.default_factory()  # type: ignore
+    if field_info.default is PydanticUndefined:
+        raise ValueError(f"Cannot remove required field {name!r}")
+    return field_info.default
+
+
+def _item(container: Union[list, tuple], segment: str) -> Any:
+    try:
+        return container[int(segment)]
+    except (ValueError, IndexError):
+        raise ValueError(f"No item {segment!r} in list") from None
+
+
+def _key(container: dict, segment: str) -> Any:
+    """
+    Return the key of a dict that a path segment names. Segments are
+    strings, so a key of another type is matched by its string form, as
+    _pointer() writes it.
+    """
+    if segment in container:
+        return segment
+    for key in container:
+        if not isinstance(key, str) and str(key) == segment:
+            return key
+    return segment
+
+
+def _changed(container: Any, segments: list[str], operation: PatchOperation):
+    """
+    Return a copy of a list or dict field value with an operation applied,
+    copying only the containers along the path.
+    """
+    segment, rest = segments[0], segments[1:]
+    if isinstance(container, dict):
+        changed = dict(container)
+        key = _key(changed, segment)
+        if rest:
+            if key not in changed:
+                raise ValueError(f"No entry {segment!r} in dict")
+            changed[key] = _changed(changed[key], rest, operation)
+        elif operation.op == "remove":
+            if key not in changed:
+                raise ValueError(f"No entry {segment!r} in dict")
+            del changed[key]
+        else:
+            changed[key] = operation.value
+        return changed
+
+    if not isinstance(container, (list, tuple)):
+        raise ValueError(f"Cannot follow {segment!r} into {container!r}")
+    changed_list = list(container)
+    if rest:
+        index = _index(changed_list, segment)
+        changed_list[index] = _changed(changed_list[index], rest, operation)
+    elif operation.op == "add":
+        if segment == "-":
+            changed_list.append(operation.value)
+        else:
+            changed_list.insert(
+                _index(changed_list, segment, 1), operation.value
+            )
+    elif operation.op == "remove":
+        del changed_list[_index(changed_list, segment)]
+    else:
+        changed_list[_index(changed_list, segment)] = operation.value
+    return type(container)(changed_list)
+
+
+def _index(items: list, segment: str, extra: int = 0) -> int:
+    try:
+        index = int(segment)
+    except ValueError:
+        raise ValueError(f"Not a list index: {segment!r}") from None
+    if not 0 <= index < len(items) + extra:
+        raise ValueError(f"List index out of range: {index}")
+    return index
+
+
+def dump_patch(patch: list[PatchOperation], cls: type[CdmObject]) -> str:
+    """
+    Return the JSON Patch representation of a patch.
+
+    :param patch: operations made by diff()
+    :param cls: the class of the objects diffed
+    :return: JSON array of operations, with values serialised as they are
+        in the serialised form of cls, as by Codec.dumps
+    """
+    return json.dumps(
+        [
+            {"op": op, "path": path}
+            if op == "remove"
+            else {"op": op, "path": path, "value": _dump(cls, path, value)}
+            for op, path, value in patch
+        ]
+    )
+
+
+def _dump(cls: type[CdmObject], path: str, value: Any) -> Any:
+    """
+    Return the serialised form of a value at a path into an object of cls.
+    """
+    field = _field_at(cls, _split(path))
+    if field is not None and field[1] in _whole_fields(field[0]):
+        return field_adapter(*field).dump_python(
+            value, mode="json", by_alias=True, exclude_none=True
+        )
+    return to_jsonable_python(value, by_alias=True, exclude_none=True)
+
+
+def _field_at(
+    cls: type[CdmObject], segments: list[str]
+) -> Optional[tuple[type[CdmObject], str]]:
+    """
+    Return the class and name of the field that a path into an object of
+    cls points to, or None if it points into a list or dict, or the class
+    cannot be told from the annotations.
+    """
+    annotation: Any = cls
+    field = None
+    for segment in segments:
+        annotation = _value_type(annotation)
+        if isinstance(annotation, type) and issubclass(annotation, CdmObject):
+            name = _serialization_plan(annotation).field_names.get(segment)
+            if name is None:
+                return None
+            field = (annotation, name)
+            annotation = annotation.model_fields[name].annotation
+            continue
+        field = None
+        origin, args = get_origin(annotation), get_args(annotation)
+        if origin in (list, tuple, set, frozenset) and args:
+            annotation = args[0]
+        elif isinstance(origin, type) and issubclass(origin, dict) and args:
+            annotation = args[1]
+        else:
+            return None
+    return field
+
+
+def _value_type(annotation: Any) -> Any:
+    """
+    Return an annotation without Annotated metadata or Optional.
+    """
+    while True:
+        origin = get_origin(annotation)
+        if origin is Annotated:
+            annotation = get_args(annotation)[0]
+        elif origin in (Union, types.UnionType):
+            args = [
+                arg for arg in get_args(annotation) if arg is not type(None)
+            ]
+            if len(args) != 1:
+                return annotation
+            annotation = args[0]
+        else:
+            return annotation
+
+
+def load_patch(json_data: Union[str, bytes]) -> list[PatchOperation]:
+    """
+    Return the patch represented by JSON Patch text.
+
+    Values are left as JSON. apply() validates them as it assigns them.
+
+    :param json_data: JSON array of add, remove and replace operations
+    :return: the operations
+    :raises: ValueError if an operation is not add, remove or replace
+    """
+    patch = []
+    for operation in json.loads(json_data):
+        if operation.get("op") not in ("add", "remove", "replace"):
+            raise ValueError(f"Unsupported patch operation: {operation}")
+        patch.append(
+            PatchOperation(
+                operation["op"], operation["path"], operation.get("value")
+            )
+        )
+    return patch
@@ -0,0 +1,199 @@
+"""
+The serialization module contains a fast path for serialising CDM objects to
+JSON that runs in pydantic-core without calling back into Python for every
+nested object.
+
+CdmObject omits fields whose value is empty and equal to the default using a
+wrap serializer. That serializer runs in Python for every node of the tree.
+Here the same rule is applied declaratively instead:
+
+* a copy of each class' core schema is made without the CdmObject wrap
+  serializer. Custom serializers of specific classes, e.g., _TargetBase, are
+  kept.
+* a pass over the object tree, visiting only those fields that can hold a
+  default empty value, builds the nested ``exclude`` argument.
+* pydantic-core serialises the whole tree to JSON in one call.
+
+The output is identical to ``obj.model_dump_json(exclude_none=True,
+by_alias=True)``.
+"""
+import copy
+import typing
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
+
+from pydantic_core import PydanticUndefined, SchemaSerializer
+
+from ska_tmc_cdm.messages.base import (
+    CdmObject,
+    _model_classes,
+    _serialization_plan,
+)
+
+__all__ = ["dump_json", "dump_jsonable"]
+
+_COLLECTIONS = (list, tuple, set, frozenset, dict)
+
+Exclude = Optional[dict[Any, Any]]
+
+
+def _strip_cdm_serializer(schema: Any) -> Any:
+    """
+    Remove the CdmObject wrap serializer from every model in a core schema.
+    """
+    if isinstance(schema, dict):
+        serialization = schema.get("serialization")
+        if (
+            serialization
+            and serialization.get("function") is CdmObject._serialize
+        ):
+            del schema["serialization"]
+        for value in schema.values():
+            _strip_cdm_serializer(value)
+    elif isinstance(schema, list):
+        for value in schema:
+            _strip_cdm_serializer(value)
+    return schema
+
+
+@lru_cache(maxsize=None)
+def _serializer(cls: type[CdmObject]) -> SchemaSerializer:
+    schema = copy.deepcopy(cls.__pydantic_core_schema__)
+    return SchemaSerializer(_strip_cdm_serializer(schema))
+
+
+class _WalkPlan(NamedTuple):
+    """
+    :param candidates: (name, default) of fields that may need excluding,
+        i.e., those with a default other than None
+    :param containers: names of fields that may hold CDM objects whose own
+        fields may need excluding
+    """
+
+    candidates: tuple[tuple[str, Any], ...]
+    containers: tuple[str, ...]
+
+
+@lru_cache(maxsize=None)
+def _walk_plan(cls: type[CdmObject]) -> _WalkPlan:
+    plan = _serialization_plan(cls)
+    # None values are dropped by exclude_none, so only fields with other
+    # defaults need checking
+    candidates = tuple(
+        (name, plan.defaults[name])
+        for name in cls.model_fields
+        if name not in plan.must_include
+        and plan.defaults[name] is not None
+        and plan.defaults[name] is not PydanticUndefined
+    )
+    containers = tuple(
+        name
+        for name, field_info in cls.model_fields.items()
+        if any(
+            _needs_walk(model_class)
+            for model_class in _model_classes(field_info.annotation)
+        )
+    )
+    return _WalkPlan(candidates, containers)
+
+
+_IN_PROGRESS: set[type[CdmObject]] = set()
+
+
+@lru_cache(maxsize=None)
+def _needs_walk(cls: type[CdmObject]) -> bool:
+    """
+    Return True if instances of cls may contain a field that needs
+    excluding.
+    """
+    if cls in _IN_PROGRESS:
+        # recursive model, assume the worst
+        return True
+    _IN_PROGRESS.add(cls)
+    try:
+        plan = _walk_plan(cls)
+        return bool(plan.candidates or plan.containers)
+    finally:
+        _IN_PROGRESS.discard(cls)
+
+
+def _dumps_empty(value: Any) -> bool:
+    if isinstance(value, _COLLECTIONS):
+        return not value
+    if isinstance(value, CdmObject):
+        return not dump_jsonable(value)
+    return False
+
+
+def _exclude(obj: CdmObject) -> Exclude:
+    """
+    Return the exclude argument that omits default empty values from obj
+    and the CDM objects it holds, or None if nothing needs excluding.
+    """
+    candidates, containers = _walk_plan(type(obj))
+    exclude: Exclude = None
+    for name, default in candidates:
+        value = getattr(obj, name)
+        if value == default and _dumps_empty(value):
+            exclude = exclude or {}
+            exclude[name] = True
+    for name in containers:
+        if exclude and name in exclude:
+            continue
+        value = getattr(obj, name)
+        if isinstance(value, CdmObject):
+            nested = _exclude(value)
+        elif isinstance(value, (list, tuple)):
+            nested = _exclude_items(enumerate(value))
+        elif isinstance(value, dict):
+            nested = _exclude_items(value.items())
+        else:
+            continue
+        if nested:
+            exclude = exclude or {}
+            exclude[name] = nested
+    return exclude
+
+
+def _exclude_items(items: typing.Iterable[tuple[Any, Any]]) -> Exclude:
+    exclude: Exclude = None
+    for key, value in items:
+        if isinstance(value, CdmObject) and (nested := _exclude(value)):
+            exclude = exclude or {}
+            exclude[key] = nested
+    return exclude
+
+
+def dump_json(obj: CdmObject, indent: Optional[int] = None) -> bytes:
+    """
+    Return the JSON representation of a CDM object, as UTF-8 bytes.
+
+    :param obj: the object to serialise
+    :param indent: optional indentation, as for json.dumps
+    :return: same output as obj.model_dump_json(exclude_none=True,
+        by_alias=True), encoded
+    """
+    return _serializer(type(obj)).to_json(
+        obj,
+        indent=indent,
+        exclude=_exclude(obj),
+        exclude_none=True,
+        by_alias=True,
+    )
+
+
+def dump_jsonable(obj: CdmObject) -> dict[str, Any]:
+    """
+    Return a JSON-compatible dict representation of a CDM object.
+
+    :param obj: the object to serialise
+    :return: same output as obj.model_dump(mode="json", exclude_none=True,
+        by_alias=True)
+    """
+    return _serializer(type(obj)).to_python(
+        obj,
+        mode="json",
+        exclude=_exclude(obj),
+        exclude_none=True,
+        by_alias=True,
+    )
@@ -5,7 +5,7 @@ the permissible arguments for a SubArrayNode.configure() call.
 
 __all__ = ["ConfigureRequest"]
 
-from typing import Optional
+from typing import ClassVar, Optional
 
 from pydantic import model_validator
 from typing_extensions import Self
@@ -50,6 +50,15 @@ class ConfigureRequest(CdmObject):
     interface: Optional[str] = None
     transaction_id: Optional[str] = None
 
+    subsystem_fields: ClassVar[tuple[str, ...]] = (
+        "pointing",
+        "dish",
+        "sdp",
+        "csp",
+        "mccs",
+        "tmc",
+    )
+
     @model_validator(mode="after")
     def partial_configuration_validation(self) -> Self:
         if self.dish and self.tmc and not self.tmc.partial_configuration:
@@ -57,7 +66,11 @@ class ConfigureRequest(CdmObject):
                 self.pointing
                 and self.pointing.target
                 and not isinstance(self.pointing.target, SpecialTarget)
-                and self.pointing.target.coord is None
+                # as coord is None, without building the coordinate
+                and (
+                    self.pointing.target.ra is None
+                    or self.pointing.target.dec is None
+                )
             ):
                 raise ValueError(
                     "ra and dec for a Target() should be defined for non-partial or sidereal configuration"
@@ -6,12 +6,24 @@ As configurations become more complex, they may be rehomed in a submodule of
 this package.
 """
 import math
+import sys
 from enum import Enum
-from typing import Callable, ClassVar, Literal, Optional, Union, cast
+from functools import lru_cache
+from os import environ
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Iterable,
+    Literal,
+    NamedTuple,
+    Optional,
+    Union,
+    cast,
+)
 
 import typing_extensions
-from astropy import units as u
-from astropy.coordinates import SkyCoord
 from pydantic import (
     BeforeValidator,
     ConfigDict,
@@ -19,6 +31,7 @@ from pydantic import (
     model_serializer,
     model_validator,
 )
+from pydantic_core import core_schema
 from typing_extensions import Annotated, Self
 
 from ska_tmc_cdm.messages.base import CdmObject
@@ -27,10 +40,16 @@ from ska_tmc_cdm.messages.skydirection import (
     SolarSystemObject,
     _normalise_enum_case,
 )
+from ska_tmc_cdm.messages.subarray_node.configure import sexagesimal
 from ska_tmc_cdm.messages.subarray_node.configure.receptorgroup import (
     ReceptorGroup,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+    from astropy import units as u
+    from astropy.coordinates import Angle, SkyCoord
+
 __all__ = [
     "PointingConfiguration",
     "Target",
@@ -40,12 +59,107 @@ __all__ = [
     "PointingCorrection",
     "ReceiverBand",
     "DishConfiguration",
+    "convert_targets",
 ]
 
 
-UnitStr = str | u.Unit
+class _AstropyUnit:
+    """
+    Pydantic type accepting astropy Units, without importing astropy, which
+    is slow to import and only needed once a Target's coordinate is.
+    """
+
+    @staticmethod
+    def _validate(value: Any) -> Any:
+        # A Unit can only have been made if astropy.units has been imported
+        units = sys.modules.get("astropy.units")
+        if units is None or not isinstance(value, units.Unit):
+            raise ValueError(f"Input should be an astropy Unit: {value!r}")
+        return value
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any):
+        return core_schema.no_info_plain_validator_function(cls._validate)
+
+
+if TYPE_CHECKING:
+    UnitStr = str | u.Unit
+else:
+    UnitStr = str | _AstropyUnit
 UnitInput = UnitStr | tuple[UnitStr, UnitStr]
 
+# Maximum number of distinct target coordinates, and of their ICRS forms,
+# held by the process-wide caches shared by all targets.
+TARGET_COORD_CACHE_SIZE = int(environ.get("TARGET_COORD_CACHE_SIZE", 1024))
+
+# ra, dec, unit and astropy frame name of a target
+_CoordKey = tuple[Union[str, float], Union[str, float], UnitInput, str]
+
+# ra, dec, unit names and astropy frame name of a coordinate, as shown by
+# repr()
+_CoordRepr = tuple[Any, Any, tuple[str, str], str]
+
+
+@lru_cache(maxsize=TARGET_COORD_CACHE_SIZE)
+def _sky_coord(
+    ra: Union[str, float], dec: Union[str, float], unit: UnitInput, frame: str
+) -> "SkyCoord":
+    from astropy.coordinates import SkyCoord
+
+    return SkyCoord(ra=ra, dec=dec, unit=unit, frame=frame)
+
+
+def _ra_dec(coord: "SkyCoord") -> tuple["Angle", "Angle"]:
+    """
+    Return the RA and Dec of a coordinate, which astropy looks up
+    dynamically, so the type checker cannot tell their type.
+    """
+    return cast("Angle", coord.ra), cast("Angle", coord.dec)
+
+
+def _coord_repr_of(coord: "SkyCoord") -> _CoordRepr:
+    """
+    Return the raw RA and Dec, their unit names and the frame name of a
+    coordinate, as shown by Target.__repr__.
+    """
+    ra, dec = _ra_dec(coord)
+    # an Angle always has a unit
+    ra_unit = cast("u.NamedUnit", ra.unit)
+    dec_unit = cast("u.NamedUnit", dec.unit)
+    return ra.value, dec.value, (ra_unit.name, dec_unit.name), coord.frame.name
+
+
+@lru_cache(maxsize=TARGET_COORD_CACHE_SIZE)
+def _icrs_hmsdms(
+    ra: Union[str, float], dec: Union[str, float], unit: UnitInput, frame: str
+) -> tuple[str, str, str]:
+    """
+    Return the frame name, RA and Dec of a coordinate converted to ICRS, as
+    serialised. Coordinates already in ICRS are formatted without astropy
+    where possible.
+    """
+    if frame == "icrs" and (
+        formatted := sexagesimal.icrs_hmsdms(ra, dec, unit)
+    ):
+        return (frame, *formatted)
+    icrs_coord = _sky_coord(ra, dec, unit, frame).transform_to("icrs")
+    coord_str = cast(str, icrs_coord.to_string("hmsdms", sep=":"))
+    icrs_ra, icrs_dec = coord_str.split(" ")
+    return icrs_coord.frame.name, icrs_ra, icrs_dec
+
+
+class _DerivedCoord(NamedTuple):
+    """
+    The coordinate of a target and its ICRS form as serialised, each made
+    when first needed, with the key they were made from.
+    """
+
+    key: _CoordKey
+    coord: Optional["SkyCoord"] = None
+    icrs_hmsdms: Optional[tuple[str, str, str]] = None
+    # the ra, dec, units and frame name shown by repr()
+    coord_repr: Optional[_CoordRepr] = None
+
 
 class LegacyTargetReferenceFrame(CaseInsensitiveEnum):
     """
@@ -94,6 +208,18 @@ class _TargetBase(CdmObject):
 
     OFFSET_MARGIN_IN_RAD: ClassVar[float] = 6e-17  # Arbitrary small number
 
+    # __eq__ compares the coordinates these give within OFFSET_MARGIN_IN_RAD
+    approximate_fields: ClassVar[frozenset[str]] = frozenset(
+        {
+            "ra",
+            "dec",
+            "unit",
+            "reference_frame",
+            "ca_offset_arcsec",
+            "ie_offset_arcsec",
+        }
+    )
+
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         validate_assignment=True,
@@ -112,16 +238,41 @@ class _TargetBase(CdmObject):
     # the type class
     reference_frame: str
 
+    def _coord_key(self) -> Optional[_CoordKey]:
+        values = self.__dict__
+        ra, dec = values["ra"], values["dec"]
+        if ra is None or dec is None:
+            return None
+        # astropy ref frames are all lower case
+        return ra, dec, values["unit"], values["reference_frame"].lower()
+
     @property
-    def coord(self) -> Optional[SkyCoord]:
-        if self.ra is not None and self.dec is not None:
-            return SkyCoord(
-                ra=self.ra,
-                dec=self.dec,
-                unit=self.unit,
-                # astropy ref frames are all lower case
-                frame=self.reference_frame.lower(),
-            )
+    def coord(self) -> Optional["SkyCoord"]:
+        """
+        The coordinate of the target, or None if ra or dec is not set.
+
+        The coordinate is cached, and shared with other targets with the same
+        ra, dec, unit and reference_frame, so must not be changed.
+        """
+        if (key := self._coord_key()) is None:
+            return None
+        derived = self._derived_coord(key)
+        if (coord := derived.coord) is None:
+            coord = _sky_coord(*key)
+            object.__setattr__(self, "_derived", derived._replace(coord=coord))
+        return coord
+
+    def _derived_coord(self, key: _CoordKey) -> _DerivedCoord:
+        # What was derived is kept with the key it was derived from, rather
+        # than forgotten on assignment, so that it cannot go stale however
+        # the fields change, e.g., on rollback of batch_update().
+        try:
+            derived = object.__getattribute__(self, "_derived")
+            if derived.key == key:
+                return derived
+        except AttributeError:
+            pass
+        return _DerivedCoord(key)
 
     @model_serializer(mode="wrap")
     def omit_defaults(self, handler: Callable):
@@ -139,20 +290,23 @@ class _TargetBase(CdmObject):
             data.pop("dec", None)
             del data["reference_frame"]
         else:
-            # For the type checker. We know coord is not-none here.
-            assert self.coord is not None
+            key = self._coord_key()
+            # For the type checker. We know key is not-none here.
+            assert key is not None
             # TODO: IMHO doing this conversion here is janky. If we only want to
             # work with ICRS coordinates, we should enforce that as part of
             # validation, not convert to it at the end when we dump()
             # Preseved directly from Marshmallow...
             #     Process Target co-ordinates by converting them to ICRS frame before
             #     the JSON marshalling process begins.
-            icrs_coord = self.coord.transform_to("icrs")
-            data["reference_frame"] = LegacyTargetReferenceFrame(
-                icrs_coord.frame.name
-            )
-            coord_str = cast(str, icrs_coord.to_string("hmsdms", sep=":"))
-            data["ra"], data["dec"] = coord_str.split(" ")
+            derived = self._derived_coord(key)
+            if (icrs := derived.icrs_hmsdms) is None:
+                icrs = _icrs_hmsdms(*key)
+                object.__setattr__(
+                    self, "_derived", derived._replace(icrs_hmsdms=icrs)
+                )
+            frame_name, data["ra"], data["dec"] = icrs
+            data["reference_frame"] = LegacyTargetReferenceFrame(frame_name)
 
         # If offset values are zero, omit them:
         for field_name in ("ca_offset_arcsec", "ie_offset_arcsec"):
@@ -167,17 +321,22 @@ class _TargetBase(CdmObject):
     @model_validator(mode="after")
     def ra_dec_or_offsets_required(self) -> Self:
         offsets = self.ca_offset_arcsec or self.ie_offset_arcsec
-        if self.coord is None and not offsets:
-            raise ValueError(
-                "A Target() must specify either ra/dec or one nonzero ca_offset_arcsec or ie_offset_arcsec"
-            )
+        if (key := self._coord_key()) is None:
+            if not offsets:
+                raise ValueError(
+                    "A Target() must specify either ra/dec or one nonzero ca_offset_arcsec or ie_offset_arcsec"
+                )
+        elif sexagesimal.parse_ra_dec(*key[:3]) is None:
+            # astropy checks ra and dec are valid as it builds the coordinate
+            _sky_coord(*key)
         return self
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, self.__class__):
             return False
+        self_key, other_key = self._coord_key(), other._coord_key()
         # Either both are None or both defined...
-        if bool(self.coord) != bool(other.coord):
+        if (self_key is None) != (other_key is None):
             return False
 
         # Common checks:
@@ -197,6 +356,9 @@ class _TargetBase(CdmObject):
         if not name_and_offsets_matching:
             return False
 
+        if self_key == other_key:
+            # the same coordinates, or both None
+            return True
         # Please replace this with a more elegant way of dealing with differences
         # comparing targets with different properties...
         self_coord, other_coord = self.coord, other.coord
@@ -208,18 +370,22 @@ class _TargetBase(CdmObject):
             )
         return True
 
+    def _coord_repr(self, key: _CoordKey) -> _CoordRepr:
+        # Cached, as pydantic calls repr() on targets serialised as a
+        # union member other than the first, e.g., every FK5Target.
+        derived = self._derived_coord(key)
+        if (coord_repr := derived.coord_repr) is None:
+            self_coord = self.coord
+            # For the type checker. We know this is not None:
+            assert self_coord is not None
+            coord_repr = _coord_repr_of(self_coord)
+            derived = self._derived_coord(key)._replace(coord_repr=coord_repr)
+            object.__setattr__(self, "_derived", derived)
+        return coord_repr
+
     def __repr__(self):
-        self_coord = self.coord
-        if self_coord is not None:
-            # For the type checker. We know these are not-None:
-            assert self_coord.ra is not None
-            assert self_coord.dec is not None
-            raw_ra = self_coord.ra.value
-            raw_dec = self_coord.dec.value
-            assert self_coord.ra.unit is not None
-            assert self_coord.dec.unit is not None
-            units = (self_coord.ra.unit.name, self_coord.dec.unit.name)
-            reference_frame = self_coord.frame.name
+        if (key := self._coord_key()) is not None:
+            raw_ra, raw_dec, units, reference_frame = self._coord_repr(key)
             target_name = self.target_name
             cls = self.__class__.__name__
             return "{!s}(ra={!r}, dec={!r}, target_name={!r}, reference_frame={!r}, unit={!r}, ca_offset_arcsec={!r}, ie_offset_arcsec={!r})".format(
@@ -238,9 +404,9 @@ class _TargetBase(CdmObject):
             )
 
     def __str__(self):
-        if self.coord is not None:
-            reference_frame = self.coord.frame.name
-            hmsdms = self.coord.to_string(style="hmsdms")
+        if (self_coord := self.coord) is not None:
+            reference_frame = self_coord.frame.name
+            hmsdms = self_coord.to_string(style="hmsdms")
         else:
             hmsdms = ""
             reference_frame = ""
@@ -250,6 +416,110 @@ class _TargetBase(CdmObject):
         )
 
 
+def _walk_targets(value: Any) -> Iterable[_TargetBase]:
+    if isinstance(value, _TargetBase):
+        yield value
+    elif isinstance(value, CdmObject):
+        for item in value.__dict__.values():
+            yield from _walk_targets(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _walk_targets(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _walk_targets(item)
+
+
+def _angles(
+    values: list[Union[str, float]], unit: UnitStr
+) -> Optional[list[Union[str, float]]]:
+    """
+    Return angles in a form astropy takes as one array: parsed to floats
+    where possible, as astropy would parse them, as this is much faster than
+    astropy parsing strings one at a time, or else as given if all of one
+    type.
+    """
+    if unit == "hourangle" or unit in ("deg", "degree"):
+        hours = unit == "hourangle"
+        parsed = [sexagesimal.parse_angle(value, hours) for value in values]
+        if None not in parsed:
+            return parsed  # type: ignore
+    if len({type(value) for value in values}) == 1:
+        return values
+    return None
+
+
+def convert_targets(objects: Iterable[Any]) -> None:
+    """
+    Convert the coordinates of the legacy targets held by many objects to
+    ICRS together, ready for serialisation.
+
+    Targets are otherwise converted one at a time as they are serialised,
+    e.g., by CODEC.dumps. Converting the targets of, say, every
+    ConfigureRequest or PointingConfiguration of a survey together
+    transforms each group of targets with the same frame and unit as a
+    single array-valued SkyCoord, so that serialising thousands of targets
+    costs little more than serialising one. Targets already in ICRS that
+    need no astropy (see configure.sexagesimal) are left as they are.
+
+    :param objects: CDM objects, or lists or dicts of them
+    """
+    groups: dict[tuple, dict[_CoordKey, list[_TargetBase]]] = {}
+    for target in _walk_targets(list(objects)):
+        if (key := target._coord_key()) is None:
+            continue
+        ra, dec, unit, frame = key
+        if target._derived_coord(key).icrs_hmsdms is not None or (
+            frame == "icrs" and sexagesimal.parse_ra_dec(ra, dec, unit)
+        ):
+            continue
+        groups.setdefault((unit, frame), {}).setdefault(key, []).append(target)
+
+    for (unit, frame), targets_by_key in groups.items():
+        keys = list(targets_by_key)
+        ra_unit, dec_unit = unit if isinstance(unit, tuple) else (unit, unit)
+        ra_values = _angles([key[0] for key in keys], ra_unit)
+        dec_values = _angles([key[1] for key in keys], dec_unit)
+        if ra_values is None or dec_values is None:
+            continue
+        # not SkyCoord, which names the type checker's import
+        from astropy import coordinates
+
+        try:
+            coords = coordinates.SkyCoord(
+                ra=ra_values, dec=dec_values, unit=unit, frame=frame
+            )
+            icrs_coords = coords.transform_to("icrs")
+        except ValueError:
+            # left to fail as each target is serialised
+            continue
+
+        raw_ras, raw_decs, units, frame_name = _coord_repr_of(coords)
+        icrs_ra, icrs_dec = _ra_dec(icrs_coords)
+        icrs_frame = icrs_coords.frame.name
+        # formatted as by SkyCoord.to_string("hmsdms", sep=":"), which
+        # would format each element in turn with astropy
+        for key, raw_ra, raw_dec, hours, degrees in zip(
+            keys,
+            raw_ras,
+            raw_decs,
+            # arrays, as the coordinates are
+            cast("np.ndarray", icrs_ra.hour).tolist(),
+            cast("np.ndarray", icrs_dec.degree).tolist(),
+        ):
+            coord_repr = (raw_ra, raw_dec, units, frame_name)
+            icrs = (
+                icrs_frame,
+                sexagesimal.format_hms(hours),
+                sexagesimal.format_dms(degrees),
+            )
+            for target in targets_by_key[key]:
+                derived = target._derived_coord(key)._replace(
+                    icrs_hmsdms=icrs, coord_repr=coord_repr
+                )
+                object.__setattr__(target, "_derived", derived)
+
+
 class ICRSTarget(_TargetBase):
     reference_frame: _ICRS = LegacyTargetReferenceFrame.ICRS
 
@@ -0,0 +1,175 @@
+"""
+The configure.sexagesimal module parses and formats the RA and Dec of legacy
+Targets without astropy, for the common case of coordinates given in ICRS
+as sexagesimal or decimal hours and degrees.
+
+The results are exactly those of astropy, i.e., of
+
+    SkyCoord(ra=ra, dec=dec, unit=unit, frame="icrs")
+        .transform_to("icrs")
+        .to_string("hmsdms", sep=":")
+
+for the inputs handled. Any other input, e.g., other units, unusual string
+forms or values astropy would warn about or reject, is not handled, and
+callers should fall back to astropy.
+"""
+import math
+import re
+from typing import Optional, Union
+
+__all__ = [
+    "format_dms",
+    "format_hms",
+    "icrs_hmsdms",
+    "parse_angle",
+    "parse_ra_dec",
+]
+
+# astropy's conversion factor from degrees to hours, and 360 degrees in
+# hours, which differ from 1 / 15 and 24 in the last place
+_HOURS_PER_DEGREE = (math.pi / 180.0) / (15.0 * (math.pi / 180.0))
+_HOURS_PER_CIRCLE = 360.0 * _HOURS_PER_DEGREE
+
+# astropy rounds seconds to at most 8 decimal places
+_ROUNDING_THRESHOLD = 60.0 - (10.0**-8)
+
+_DECIMAL = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)")
+_SEXAGESIMAL = re.compile(r"([+-]?)(\d+):(\d+)(?::(\d+(?:\.\d*)?))?")
+
+_HOURANGLE = "hourangle"
+_DEGREE_NAMES = frozenset({"deg", "degree"})
+
+
+def parse_angle(value: Union[str, float], hours: bool) -> Optional[float]:
+    """
+    Return an angle given as a number or string, as astropy parses it, or
+    None if not handled. The angle is not wrapped or range checked.
+
+    :param value: the angle
+    :param hours: True if the angle is in hours, False if in degrees
+    """
+    kind = type(value)
+    if kind is float or kind is int:
+        result = float(value)
+        return result if math.isfinite(result) else None
+    if kind is not str:
+        return None
+    if _DECIMAL.fullmatch(value):  # type: ignore
+        return float(value)
+    if (match := _SEXAGESIMAL.fullmatch(value)) is None:  # type: ignore
+        return None
+    sign, whole, minutes, seconds = match.groups()
+    first = -float(whole) if sign == "-" else float(whole)
+    if hours and not -24.0 < first < 24.0:
+        return None
+    angle = abs(first) + float(minutes) / 60.0
+    if not float(minutes) < 60.0:
+        return None
+    if seconds is not None:
+        if not float(seconds) < 60.0:
+            return None
+        angle += float(seconds) / 3600.0
+    return math.copysign(angle, first)
+
+
+def parse_ra_dec(
+    ra: Union[str, float], dec: Union[str, float], unit: object
+) -> Optional[tuple[float, float]]:
+    """
+    Return an RA, in hours from 0 up to 24, and a Dec, in degrees, as
+    astropy would hold them, or None if not handled.
+
+    :param ra: the RA, as a number or string
+    :param dec: the Dec, as a number or string
+    :param unit: the unit of both, or a (RA unit, Dec unit) tuple, where
+        only "hourangle" and "deg" are handled
+    :return: the (RA, Dec) tuple, or None
+    """
+    if type(unit) is tuple and len(unit) == 2:  # type: ignore
+        ra_unit, dec_unit = unit  # type: ignore
+    else:
+        ra_unit = dec_unit = unit
+    if type(ra_unit) is not str or dec_unit not in _DEGREE_NAMES:
+        return None
+    if ra_unit == _HOURANGLE:
+        ra_hours = parse_angle(ra, hours=True)
+        circle = _HOURS_PER_CIRCLE
+    elif ra_unit in _DEGREE_NAMES:
+        ra_hours = parse_angle(ra, hours=False)
+        circle = 360.0
+    else:
+        return None
+    dec_degrees = parse_angle(dec, hours=False)
+    if ra_hours is None or dec_degrees is None or abs(dec_degrees) > 90.0:
+        return None
+
+    # wrapped as by astropy Longitude, in the unit given
+    if not 0.0 <= ra_hours < circle:
+        ra_hours -= ((ra_hours - 0.0) // circle) * circle
+        if ra_hours >= circle:
+            ra_hours -= circle
+        if ra_hours < 0.0:
+            ra_hours += circle
+    if circle == 360.0:
+        ra_hours *= _HOURS_PER_DEGREE
+    return ra_hours, dec_degrees
+
+
+def _sexagesimal(value: float, pad: bool, alwayssign: bool) -> str:
+    # as astropy.coordinates.angles.formats._decimal_to_sexagesimal_string,
+    # with sep=":" and default precision
+    sign = math.copysign(1.0, value)
+    fraction, whole = math.modf(abs(value))
+    minute_fraction, minutes = math.modf(fraction * 60.0)
+    seconds = minute_fraction * 60.0
+    whole = sign * whole
+    if seconds >= _ROUNDING_THRESHOLD:
+        seconds = 0.0
+        minutes += 1.0
+    if minutes >= 60.0:
+        minutes = 0.0
+        whole = math.copysign(abs(whole) + 1.0, sign)
+    width = (3 if sign == -1 else 2) if pad else 0
+    last = f"{seconds:.8f}".rstrip("0").rstrip(".")
+    if len(last) == 1 or last[1] == ".":
+        last = "0" + last
+    result = f"{whole:0{width}.0f}:{int(minutes):02d}:{last}"
+    if alwayssign and not result.startswith("-"):
+        result = "+" + result
+    return result
+
+
+def format_hms(hours: float) -> str:
+    """
+    Return an RA in hours as astropy formats it, e.g., "21:08:47.92".
+
+    :param hours: the RA, in hours
+    """
+    return _sexagesimal(hours, pad=True, alwayssign=False)
+
+
+def format_dms(degrees: float) -> str:
+    """
+    Return a Dec in degrees as astropy formats it, e.g., "-88:57:22.9".
+
+    :param degrees: the Dec, in degrees
+    """
+    return _sexagesimal(degrees, pad=True, alwayssign=True)
+
+
+def icrs_hmsdms(
+    ra: Union[str, float], dec: Union[str, float], unit: object
+) -> Optional[tuple[str, str]]:
+    """
+    Return the RA and Dec of an ICRS coordinate as serialised, or None if
+    not handled.
+
+    :param ra: the RA, as a number or string
+    :param dec: the Dec, as a number or string
+    :param unit: the unit of both, or a (RA unit, Dec unit) tuple
+    :return: the formatted (RA, Dec) tuple, or None
+    """
+    if (parsed := parse_ra_dec(ra, dec, unit)) is None:
+        return None
+    ra_hours, dec_degrees = parsed
+    return format_hms(ra_hours), format_dms(dec_degrees)
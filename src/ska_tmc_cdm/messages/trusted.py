@@ -0,0 +1,146 @@
+"""
+The trusted module contains a construction path for CDM objects from JSON
+that has already been validated, e.g., messages read back from an archive
+written by this pipeline, that skips the checks a fresh message needs.
+
+The JSON is still parsed and converted by pydantic-core, so nested objects,
+unions such as SkyDirection and discriminated unions such as Trajectory are
+built exactly as by normal validation. What is skipped:
+
+* after-mode model and field validators, e.g.,
+  ConfigureRequest.partial_configuration_validation and
+  CSPConfiguration.validate_interface. Validators that fill in values, such
+  as those setting a default interface, are skipped too, so the JSON must be
+  complete, e.g., as written by Codec.dumps. Before-mode validators, which
+  convert the input, still run.
+* validation of default values (validate_default).
+
+To stop this path being used on untrusted input by mistake, the JSON must
+carry a seal: a keyed BLAKE2b digest of the exact JSON bytes, made with
+seal() by the producer. Both producer and consumer read the key from the
+CDM_TRUSTED_INPUT_KEY environment variable. The trusted path is unavailable
+unless it is set.
+"""
+import hashlib
+import hmac
+from functools import lru_cache
+from os import environ
+from typing import Any, TypeVar, Union
+
+from pydantic_core import SchemaValidator
+
+from ska_tmc_cdm.exceptions import UntrustedInput
+from ska_tmc_cdm.messages.base import CdmObject
+
+__all__ = ["load_trusted", "seal"]
+
+T = TypeVar("T", bound=CdmObject)
+
+KEY_ENV_VAR = "CDM_TRUSTED_INPUT_KEY"
+
+
+def _key() -> bytes:
+    if not (key := environ.get(KEY_ENV_VAR)):
+        raise UntrustedInput(f"{KEY_ENV_VAR} is not set")
+    # BLAKE2b keys are at most 64 bytes
+    return hashlib.blake2b(key.encode("utf-8")).digest()
+
+
+def _as_bytes(json_data: Union[str, bytes, bytearray]) -> bytes:
+    if isinstance(json_data, str):
+        return json_data.encode("utf-8")
+    return bytes(json_data)
+
+
+def seal(json_data: Union[str, bytes, bytearray]) -> str:
+    """
+    Return the seal that marks JSON as trusted.
+
+    :param json_data: JSON text, as str or UTF-8 bytes
+    :return: hex digest to store or send alongside the JSON
+    :raises: UntrustedInput if CDM_TRUSTED_INPUT_KEY is not set
+    """
+    return hashlib.blake2b(_as_bytes(json_data), key=_key()).hexdigest()
+
+
+def _validator_functions(schema: Any, found: set) -> set:
+    """
+    Collect the model and field validator functions of every model in a
+    core schema.
+    """
+    if isinstance(schema, dict):
+        if schema.get("type") == "model":
+            decorators = schema["cls"].__pydantic_decorators__
+            for validators in (
+                decorators.model_validators,
+                decorators.field_validators,
+            ):
+                found.update(
+                    decorator.func for decorator in validators.values()
+                )
+        for value in schema.values():
+            _validator_functions(value, found)
+    elif isinstance(schema, list):
+        for value in schema:
+            _validator_functions(value, found)
+    return found
+
+
+def _strip_validators(schema: Any, functions: set) -> Any:
+    """
+    Return a copy of a core schema without the given after-mode validator
+    functions, and with default validation disabled.
+    """
+    if isinstance(schema, list):
+        return [_strip_validators(value, functions) for value in schema]
+    if not isinstance(schema, dict):
+        return schema
+
+    function = schema.get("function")
+    if (
+        schema.get("type") == "function-after"
+        and isinstance(function, dict)
+        and function.get("function") in functions
+    ):
+        inner = _strip_validators(schema["schema"], functions)
+        if "ref" in schema:
+            inner = {**inner, "ref": schema["ref"]}
+        return inner
+
+    stripped = {
+        key: _strip_validators(value, functions)
+        for key, value in schema.items()
+    }
+    if stripped.get("type") == "model":
+        stripped["config"] = {
+            **stripped.get("config", {}),
+            "validate_default": False,
+        }
+    return stripped
+
+
+@lru_cache(maxsize=None)
+def _trusted_validator(cls: type[CdmObject]) -> SchemaValidator:
+    schema = cls.__pydantic_core_schema__
+    functions = _validator_functions(schema, set())
+    return SchemaValidator(_strip_validators(schema, functions))
+
+
+def load_trusted(
+    cdm_class: type[T],
+    json_data: Union[str, bytes, bytearray],
+    json_seal: str,
+) -> T:
+    """
+    Create an instance of a CDM class from trusted JSON without running
+    validators.
+
+    :param cdm_class: the class to create from the JSON
+    :param json_data: the JSON to unmarshall, exactly as sealed
+    :param json_seal: the seal made by seal() for this JSON
+    :return: an instance of cdm_class
+    :raises: UntrustedInput if the seal does not match the JSON
+    """
+    if not hmac.compare_digest(seal(json_data), json_seal):
+        raise UntrustedInput("seal does not match")
+    return _trusted_validator(cdm_class).validate_json(json_data)
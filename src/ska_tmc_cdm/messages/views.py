@@ -0,0 +1,240 @@
+"""
+The views module contains compact, read-only views of CDM objects, for
+monitoring and other read-mostly consumers that hold many objects, e.g.,
+long lists of ProcessingRegionConfigurations or PSTBeamConfigurations.
+
+view_class() generates, on first use, a view class for a CDM class. A view
+keeps its field values in __slots__ rather than a __dict__, with none of the
+bookkeeping of a pydantic model, so takes a fraction of the memory. Fields
+are read as attributes of the same names as on the CDM class, and hold the
+same values in their frozen form (see ska_tmc_cdm.messages.frozen): list
+fields hold tuples, set fields frozensets, dict fields FrozenDicts and
+fields holding CDM objects hold views.
+
+Views are made from validated objects or JSON with view() or load_view(),
+and converted back with to_model(), which gives an object equal to the one
+viewed, with the same fields set.
+"""
+from threading import RLock
+from typing import Any, ClassVar, Iterator, Optional, Union
+
+from ska_tmc_cdm.messages.base import CdmObject
+from ska_tmc_cdm.messages.frozen import (
+    _IMMUTABLE,
+    FrozenDict,
+    _thaw_value,
+    frozen_class,
+    thaw,
+)
+
+__all__ = ["CdmView", "load_view", "view", "view_class"]
+
+
+class CdmView:
+    """
+    Base class of the read-only views of CDM objects.
+    """
+
+    __slots__ = ("_fields_set", "_extra")
+
+    # The CDM class viewed, and the names of its fields, which are the
+    # slots of the view class
+    model_class: ClassVar[type[CdmObject]]
+    field_names: ClassVar[tuple[str, ...]] = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def _values(self) -> Iterator[Any]:
+        return (getattr(self, name) for name in self.field_names)
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return (
+            tuple(self._values()) == tuple(other._values())
+            and self._extra == other._extra
+        )
+
+    def __hash__(self) -> int:
+        return hash((type(self), tuple(self._values())))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={value!r}"
+            for name, value in zip(self.field_names, self._values())
+        )
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self):
+        return _restore, (
+            self.model_class,
+            tuple(self._values()),
+            self._fields_set,
+            self._extra,
+        )
+
+    @property
+    def model_fields_set(self) -> set[str]:
+        """
+        The names of the fields set on the object viewed.
+        """
+        return set(self._fields_set)
+
+    def to_model(self) -> CdmObject:
+        """
+        Return the CDM object this view was made from, or one equal to it,
+        without validation.
+
+        :return: an instance of model_class
+        """
+        return thaw(_frozen(self))
+
+
+_VIEWS: dict[type, type[CdmView]] = {}
+_LOCK = RLock()
+
+# One instance of each distinct set of field names, shared by the views
+_FIELDS_SETS: dict[frozenset[str], frozenset[str]] = {}
+
+
+def view_class(cls: type[CdmObject]) -> type[CdmView]:
+    """
+    Return the view class of a CDM class, generating it on first use.
+
+    :param cls: the CDM class, or its frozen mirror
+    :return: a subclass of CdmView with a slot for each field of cls
+    """
+    if (view_cls := _VIEWS.get(cls)) is not None:
+        return view_cls
+    model_class = getattr(cls, "mutable_class", cls)
+    with _LOCK:
+        if model_class not in _VIEWS:
+            field_names = tuple(model_class.model_fields)
+            _VIEWS[model_class] = type(
+                f"{model_class.__name__}View",
+                (CdmView,),
+                {
+                    "__slots__": field_names,
+                    "__module__": model_class.__module__,
+                    "__qualname__": f"{model_class.__qualname__}View",
+                    "model_class": model_class,
+                    "field_names": field_names,
+                },
+            )
+        _VIEWS[cls] = _VIEWS[model_class]
+        return _VIEWS[cls]
+
+
+def view(obj: CdmObject) -> CdmView:
+    """
+    Return a read-only view of a CDM object, without validation.
+
+    :param obj: the object to view, mutable or frozen
+    :return: an instance of view_class(type(obj))
+    """
+    cls = _VIEWS.get(type(obj)) or view_class(type(obj))
+    result = object.__new__(cls)
+    set_slot = object.__setattr__
+    for name, value in obj.__dict__.items():
+        set_slot(result, name, _view_value(value))
+    fields_set = frozenset(obj.__pydantic_fields_set__)
+    set_slot(
+        result, "_fields_set", _FIELDS_SETS.setdefault(fields_set, fields_set)
+    )
+    extra = obj.__pydantic_extra__
+    set_slot(result, "_extra", _view_value(extra) if extra else None)
+    return result
+
+
+def load_view(cls: type[CdmObject], json_data: Union[str, bytes]) -> CdmView:
+    """
+    Return a read-only view of a CDM object validated from JSON.
+
+    :param cls: the CDM class to validate the JSON as
+    :param json_data: the JSON
+    :return: an instance of view_class(cls)
+    :raises: a pydantic ValidationError if the JSON is not valid
+    """
+    return view(cls.model_validate_json(json_data))
+
+
+def _view_value(value: Any) -> Any:
+    """
+    Return the form of a field value held by a view.
+    """
+    kind = type(value)
+    if kind in _IMMUTABLE:
+        return value
+    if kind is list or kind is tuple:
+        return tuple([_view_value(item) for item in value])
+    if kind in _VIEWS or isinstance(value, CdmObject):
+        return view(value)
+    if isinstance(value, (list, tuple)):
+        return tuple([_view_value(item) for item in value])
+    if isinstance(value, set):
+        # set items are hashable, so immutable already
+        return frozenset(value)
+    if isinstance(value, dict):
+        return FrozenDict(
+            (key, _view_value(item)) for key, item in value.items()
+        )
+    return value
+
+
+def _frozen_value(value: Any) -> Any:
+    """
+    Return the form of a value held by a view that a frozen object holds.
+    """
+    if isinstance(value, CdmView):
+        return _frozen(value)
+    if type(value) is tuple:
+        return tuple([_frozen_value(item) for item in value])
+    if type(value) is FrozenDict:
+        return FrozenDict(
+            (key, _frozen_value(item)) for key, item in value.items()
+        )
+    return value
+
+
+def _frozen(obj: CdmView) -> CdmObject:
+    """
+    Return the frozen CDM object equal to the object obj views.
+    """
+    cls = frozen_class(obj.model_class)
+    result = cls.__new__(cls)
+    values = {
+        name: _frozen_value(value)
+        for name, value in zip(obj.field_names, obj._values())
+    }
+    extra: Optional[dict[str, Any]] = None
+    if obj._extra is not None:
+        extra = {
+            key: _thaw_value(_frozen_value(value))
+            for key, value in obj._extra.items()
+        }
+    object.__setattr__(result, "__dict__", values)
+    object.__setattr__(result, "__pydantic_fields_set__", set(obj._fields_set))
+    object.__setattr__(result, "__pydantic_extra__", extra)
+    object.__setattr__(result, "__pydantic_private__", None)
+    return result
+
+
+def _restore(
+    model_class: type[CdmObject],
+    values: tuple[Any, ...],
+    fields_set: frozenset[str],
+    extra: Optional[FrozenDict],
+) -> CdmView:
+    cls = view_class(model_class)
+    result = object.__new__(cls)
+    for name, value in zip(cls.field_names, values):
+        object.__setattr__(result, name, value)
+    object.__setattr__(
+        result, "_fields_set", _FIELDS_SETS.setdefault(fields_set, fields_set)
+    )
+    object.__setattr__(result, "_extra", extra)
+    return result
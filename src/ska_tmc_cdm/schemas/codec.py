@@ -3,19 +3,108 @@ This module contains a Codec class that provides a public interface for clients
 to de/serialise CDM classes from/to JSON. Basically this spares clients having to
 remember to pass all the arguments to `model_dump()`
 """
-__all__ = ["Codec"]
+__all__ = ["BatchResult", "Codec"]
 
+import functools
+import itertools
 import json
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
 from os import PathLike, environ
-from typing import Optional, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from pydantic_core import from_json
 
 from ska_tmc_cdm.messages.base import CdmObject
+from ska_tmc_cdm.messages.interning import INTERN_TABLE
+from ska_tmc_cdm.messages.lazy import LazyMessage, field_adapter, input_names
+from ska_tmc_cdm.messages.serialization import dump_json
+from ska_tmc_cdm.messages.subarray_node.configure.core import convert_targets
+from ska_tmc_cdm.messages.trusted import load_trusted
 
+from .ndjson import Source, StreamResult, iter_lines, open_sink
+from .peek import _scan, peek
+from .registry import INTERFACE_REGISTRY, InterfaceRegistry
+from .splitter import SubsystemPart, split_subsystems
 from .telmodel_validation import semantic_validate_json, validate_json
+from .validation_cache import VALIDATION_CACHE
 
 DEFAULT_STRICTNESS = None
 
 T = TypeVar("T", bound=CdmObject)
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class BatchResult(Generic[R]):
+    """
+    The outcome of processing one item of a batch.
+
+    :param index: position of the item in the batch input
+    :param value: the result, if processing succeeded
+    :param error: the exception raised, if processing failed
+    """
+
+    index: int
+    value: Optional[R] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _apply_chunk(
+    fn: Callable[[Any], R], start: int, chunk: list
+) -> list[BatchResult[R]]:
+    """
+    Apply fn to each item of a chunk, capturing per-item errors.
+
+    Defined at module level so that chunks can be sent to process pools.
+    """
+    results: list[BatchResult[R]] = []
+    for index, item in enumerate(chunk, start):
+        try:
+            results.append(BatchResult(index, value=fn(item)))
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            results.append(BatchResult(index, error=exc))
+    return results
+
+
+def _run_batch(
+    fn: Callable[[Any], R],
+    items: Iterable,
+    executor: Optional[Executor],
+    chunksize: int,
+) -> list[BatchResult[R]]:
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be >= 1, got {chunksize}")
+
+    iterator = iter(items)
+    chunks = iter(lambda: list(itertools.islice(iterator, chunksize)), [])
+    starts = itertools.count(0, chunksize)
+
+    if executor is None:
+        per_chunk = [
+            _apply_chunk(fn, start, chunk)
+            for start, chunk in zip(starts, chunks)
+        ]
+    else:
+        futures = [
+            executor.submit(_apply_chunk, fn, start, chunk)
+            for start, chunk in zip(starts, chunks)
+        ]
+        per_chunk = [future.result() for future in futures]
+    return [result for chunk in per_chunk for result in chunk]
 
 
 class Codec:
@@ -29,10 +118,16 @@ class Codec:
             strictness = int(env_strictness)
         if not enforced:
             return
-        validate_json(jsonable_data, strictness=strictness)
-        # TODO: Revisit this / unify the validation rules.
-        if strictness and strictness >= 2:
-            semantic_validate_json(jsonable_data)
+
+        def validate():
+            validate_json(jsonable_data, strictness=strictness)
+            # TODO: Revisit this / unify the validation rules.
+            if strictness and strictness >= 2:
+                semantic_validate_json(jsonable_data)
+
+        # Identical messages are only validated once if the verdict cache
+        # is enabled, see VALIDATION_CACHE_SIZE.
+        VALIDATION_CACHE.validate(jsonable_data, strictness, validate)
 
     @staticmethod
     def loads(
@@ -40,6 +135,9 @@ class Codec:
         json_data: str,
         validate: bool = True,
         strictness: Optional[int] = DEFAULT_STRICTNESS,
+        single_parse: bool = False,
+        trusted: Optional[str] = None,
+        intern: bool = False,
     ) -> T:
         """
         Create an instance of a CDM class from a JSON string.
@@ -47,27 +145,185 @@ class Codec:
         The default strictness of the Telescope Model schema validator can be
         overridden by supplying the validate argument.
 
+        By default, the Telescope Model validates a re-serialised copy of the
+        new object. With single_parse=True the JSON is parsed once, by
+        Pydantic's JSON parser, and the parsed data is both validated by
+        Pydantic, in lax mode, which converts JSON values as validating the
+        JSON text would, and passed to the Telescope Model, so the object is
+        neither parsed twice nor dumped. The Telescope Model then validates
+        the raw input rather than the normalised dump of the new object: it
+        sees keys as received and no defaults applied. JSON that declares no
+        interface is validated as by default, against the dump of the new
+        object, with the interface it defaults to.
+
+        JSON that was validated before, e.g., read back from an archive, can
+        be loaded without validation by passing the seal made for it by
+        ska_tmc_cdm.messages.trusted.seal() as trusted. Neither the Telescope
+        Model nor the Pydantic validators are then run.
+
+        With intern=True, strings and frozen sub-objects equal to ones
+        already in use are replaced by them, see
+        ska_tmc_cdm.messages.interning. Sub-objects are only shared when
+        cdm_class is frozen, e.g., frozen_class(AssignResourcesRequest).
+
         :param cdm_class: the class to create from the JSON
         :param json_data: the JSON to unmarshall
         :param validate: True to enable schema validation
         :param strictness: optional validation strictness level (0=min, 2=max)
+        :param single_parse: True to parse the input once, and validate the
+            raw input rather than a re-serialised copy of the object
+        :param trusted: seal of trusted JSON, to skip validation
+        :param intern: True to share values equal to ones already in use
         :return: an instance of CdmObject
+        :raises: UntrustedInput if trusted is given but does not match
         """
+        obj = Codec._loads(
+            cdm_class, json_data, validate, strictness, single_parse, trusted
+        )
+        if intern:
+            return INTERN_TABLE.intern(obj)
+        return obj
+
+    @staticmethod
+    def _loads(
+        cdm_class: type[T],
+        json_data: str,
+        validate: bool,
+        strictness: Optional[int],
+        single_parse: bool,
+        trusted: Optional[str],
+    ) -> T:
+        if trusted is not None:
+            return load_trusted(cdm_class, json_data, trusted)
+
         # Making Pydantic the first line of validation gives us
         # basic checks up front, and also yields performance benefits
         # because it uses a fast Rust JSON parser internally.
-        obj = cdm_class.model_validate_json(json_data)
+        if validate and single_parse:
+            # Data parsed from JSON only holds JSON types, which lax
+            # validation converts as it would the JSON text.
+            parsed = from_json(json_data)
+            obj = cdm_class.model_validate(parsed, strict=False)
+            # Without an interface the Telescope Model would skip the
+            # input, so validate the object, with its default interface.
+            if isinstance(parsed, dict) and parsed.get("interface"):
+                Codec._telmodel_validation(validate, parsed, strictness)
+                return obj
+        else:
+            obj = cdm_class.model_validate_json(json_data)
         jsonable_dict = obj.model_dump(
             mode="json", exclude_none=True, by_alias=True
         )
         Codec._telmodel_validation(validate, jsonable_dict, strictness)
         return obj
 
+    @staticmethod
+    def loads_any(
+        json_data: str,
+        validate: bool = True,
+        strictness: Optional[int] = DEFAULT_STRICTNESS,
+        registry: InterfaceRegistry = INTERFACE_REGISTRY,
+    ) -> CdmObject:
+        """
+        Create an instance of whichever CDM class models the interface
+        declared in a JSON string.
+
+        :param json_data: the JSON to unmarshall
+        :param validate: True to enable schema validation
+        :param strictness: optional validation strictness level (0=min, 2=max)
+        :param registry: registry used to look up the class for an interface
+        :return: an instance of CdmObject
+        :raises: UnknownInterface if the JSON declares no registered interface
+        """
+        interface = peek(json_data, ["interface"]).get("interface")
+        return Codec.loads(
+            registry[interface], json_data, validate, strictness
+        )
+
+    @staticmethod
+    def loads_lazy(
+        cdm_class: type[T],
+        json_data: str,
+        validate: bool = False,
+        strictness: Optional[int] = DEFAULT_STRICTNESS,
+    ) -> LazyMessage[T]:
+        """
+        Create a lazy view of a CDM object from a JSON string.
+
+        Top-level fields are validated immediately. Each subsystem block
+        (see CdmObject.subsystem_fields) is held as the JSON text sliced
+        from the input and only validated by Pydantic when first accessed.
+        Fields are validated from their JSON, as by Codec.loads. Call
+        to_model() on the result to get the complete object.
+
+        Unlike Codec.loads, validation against the Telescope Model is off by
+        default, as it would check every block up front. With validate=True
+        the Telescope Model validates the JSON as received, as for
+        Codec.loads with single_parse=True.
+
+        :param cdm_class: the class to create from the JSON
+        :param json_data: the JSON to unmarshall
+        :param validate: True to enable schema validation
+        :param strictness: optional validation strictness level (0=min, 2=max)
+        :return: a LazyMessage wrapping the decoded fields
+        """
+        data = {
+            key: json_data[start:end]
+            for key, _, start, end in _scan(
+                json_data, input_names(cdm_class), last=True
+            )
+        }
+        lazy = LazyMessage(cdm_class, data, from_json=True)
+        if validate:
+            Codec._telmodel_validation(
+                validate, json.loads(json_data), strictness
+            )
+        return lazy
+
+    @staticmethod
+    def split(
+        json_data: Union[str, bytes],
+        cdm_class: Optional[type[CdmObject]] = None,
+        validate: bool = True,
+        strictness: Optional[int] = DEFAULT_STRICTNESS,
+        registry: InterfaceRegistry = INTERFACE_REGISTRY,
+    ) -> dict[str, SubsystemPart]:
+        """
+        Split a ConfigureRequest or AssignResourcesRequest into the JSON of
+        its subsystem blocks, e.g., for TMC to forward the "csp" block to
+        CSP, without decoding and re-serialising the whole request.
+
+        With validate=True each block is validated on its own: by Pydantic
+        as its CDM class, and by the Telescope Model against the interface
+        the block declares, e.g., MID_CSP_SCHEMA or SDP_SCHEMA. Blocks that
+        declare no interface, such as "dish", are only checked by Pydantic.
+
+        :param json_data: JSON text of the request, as str or UTF-8 bytes
+        :param cdm_class: class of the request. If not given, it is looked
+            up in the registry by the interface the request declares.
+        :param validate: True to enable validation of each block
+        :param strictness: optional validation strictness level (0=min, 2=max)
+        :param registry: registry used to look up the class for an interface
+        :return: dict of serialised block name, e.g., "csp", to SubsystemPart
+        """
+        if cdm_class is None:
+            cdm_class = registry[
+                peek(json_data, ["interface"]).get("interface")
+            ]
+        parts = split_subsystems(json_data, cdm_class)
+        if validate:
+            for part in parts.values():
+                # from the JSON, to validate as a full loads() would
+                field_adapter(cdm_class, part.field).validate_json(part.json)
+                Codec._telmodel_validation(validate, part.value, strictness)
+        return parts
+
     @staticmethod
     def dumps(
         obj: CdmObject,
         validate: bool = True,
         strictness: Optional[int] = DEFAULT_STRICTNESS,
+        native: bool = False,
     ) -> str:
         """
         Return a string JSON representation of a CDM instance.
@@ -75,23 +331,194 @@ class Codec:
         The default strictness of the Telescope Model schema validator can be
         overridden by supplying the validate argument.
 
+        With native=True the JSON is written by pydantic-core in one pass,
+        see ska_tmc_cdm.messages.serialization. The content is the same but
+        the formatting is that of model_dump_json(): no whitespace between
+        tokens, and floats written as by Rust rather than by Python.
+
         :param obj: the instance to marshall to JSON
         :param validate: True to enable schema validation
         :param strictness: optional validation strictness level (0=min, 2=max)
+        :param native: True to use the pydantic-core serialisation fast path
         :return: JSON representation of obj
         """
+        if native:
+            json_bytes = dump_json(obj)
+            if validate:
+                Codec._telmodel_validation(
+                    validate, json.loads(json_bytes), strictness
+                )
+            return json_bytes.decode("utf-8")
+
         jsonable_dict = obj.model_dump(
             mode="json", exclude_none=True, by_alias=True
         )
         Codec._telmodel_validation(validate, jsonable_dict, strictness)
         return json.dumps(jsonable_dict)
 
+    @staticmethod
+    def loads_many(
+        cdm_class: type[T],
+        json_items: Iterable[str],
+        validate: bool = True,
+        strictness: Optional[int] = DEFAULT_STRICTNESS,
+        executor: Optional[Executor] = None,
+        chunksize: int = 1,
+    ) -> list[BatchResult[T]]:
+        """
+        Create instances of a CDM class from many JSON strings.
+
+        Items are processed serially unless an executor is given. With a
+        ThreadPoolExecutor or ProcessPoolExecutor, items are submitted in
+        chunks of chunksize; larger chunks reduce scheduling overhead,
+        especially for process pools.
+
+        Results are returned in input order. A failure to load one item is
+        reported in its BatchResult and does not stop the batch.
+
+        :param cdm_class: the class to create from the JSON
+        :param json_items: the JSON strings to unmarshall
+        :param validate: True to enable schema validation
+        :param strictness: optional validation strictness level (0=min, 2=max)
+        :param executor: optional executor to process chunks with
+        :param chunksize: number of items per executor task
+        :return: a BatchResult for each item
+        """
+        fn = functools.partial(
+            Codec.loads,
+            cdm_class,
+            validate=validate,
+            strictness=strictness,
+        )
+        return _run_batch(fn, json_items, executor, chunksize)
+
+    @staticmethod
+    def dumps_many(
+        objs: Iterable[CdmObject],
+        validate: bool = True,
+        strictness: Optional[int] = DEFAULT_STRICTNESS,
+        executor: Optional[Executor] = None,
+        chunksize: int = 1,
+        native: bool = False,
+    ) -> list[BatchResult[str]]:
+        """
+        Return JSON representations of many CDM instances.
+
+        See loads_many for how executor and chunksize are used and how
+        errors are reported.
+
+        :param objs: the instances to marshall to JSON
+        :param validate: True to enable schema validation
+        :param strictness: optional validation strictness level (0=min, 2=max)
+        :param executor: optional executor to process chunks with
+        :param chunksize: number of items per executor task
+        :param native: see Codec.dumps
+        :return: a BatchResult for each instance
+        """
+        objs = list(objs)
+        if not isinstance(executor, ProcessPoolExecutor):
+            # Converted here, so only of use in this process
+            convert_targets(objs)
+        fn = functools.partial(
+            Codec.dumps,
+            validate=validate,
+            strictness=strictness,
+            native=native,
+        )
+        return _run_batch(fn, objs, executor, chunksize)
+
+    @staticmethod
+    def iter_load(
+        cdm_class: type[T] | InterfaceRegistry,
+        source: Source,
+        validate: bool = True,
+        strictness: Optional[int] = DEFAULT_STRICTNESS,
+        offset: int = 0,
+    ) -> Iterator[StreamResult[CdmObject]]:
+        """
+        Lazily create CDM instances from a newline-delimited JSON stream.
+
+        Lines are read and converted one at a time, so memory use does not
+        grow with the size of the stream. Blank lines are skipped. A line
+        that cannot be loaded is reported in its StreamResult and does not
+        stop iteration.
+
+        To resume an interrupted read, pass the end_offset of the last
+        processed StreamResult as offset.
+
+        If an InterfaceRegistry is given rather than a class, each line is
+        decoded as the class registered for its interface (see loads_any),
+        so a log may mix message types.
+
+        :param cdm_class: the class to create from each line, or a registry
+        :param source: path to an NDJSON file, or a binary stream
+        :param validate: True to enable schema validation
+        :param strictness: optional validation strictness level (0=min, 2=max)
+        :param offset: byte offset to start reading from
+        :return: iterator of StreamResults, one per non-blank line
+        """
+        for line, start, end, json_data in iter_lines(source, offset):
+            try:
+                if isinstance(cdm_class, InterfaceRegistry):
+                    obj = Codec.loads_any(
+                        json_data.decode("utf-8"),
+                        validate,
+                        strictness,
+                        cdm_class,
+                    )
+                else:
+                    obj = Codec.loads(
+                        cdm_class,
+                        json_data.decode("utf-8"),
+                        validate,
+                        strictness,
+                    )
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                yield StreamResult(line, start, end, error=exc)
+            else:
+                yield StreamResult(line, start, end, value=obj)
+
+    @staticmethod
+    def dump_ndjson(
+        objs: Iterable[CdmObject],
+        sink: Source,
+        validate: bool = True,
+        strictness: Optional[int] = DEFAULT_STRICTNESS,
+        append: bool = False,
+    ) -> list[BatchResult[str]]:
+        """
+        Write CDM instances to a newline-delimited JSON stream, one line per
+        instance.
+
+        Instances are serialised and written one at a time. Instances that
+        fail to serialise are skipped and reported in the return value.
+
+        :param objs: the instances to marshall to JSON
+        :param sink: path to an NDJSON file, or a binary stream
+        :param validate: True to enable schema validation
+        :param strictness: optional validation strictness level (0=min, 2=max)
+        :param append: True to append to an existing file rather than
+            overwrite it
+        :return: a BatchResult for each instance that could not be written
+        """
+        failures: list[BatchResult[str]] = []
+        with open_sink(sink, append) as stream:
+            for index, obj in enumerate(objs):
+                try:
+                    json_data = Codec.dumps(obj, validate, strictness)
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    failures.append(BatchResult(index, error=exc))
+                else:
+                    stream.write(json_data.encode("utf-8") + b"\n")
+        return failures
+
     @staticmethod
     def load_from_file(
         cdm_class: type[T],
         path: PathLike[str],
         validate: bool = True,
         strictness: Optional[int] = DEFAULT_STRICTNESS,
+        single_parse: bool = False,
     ) -> T:
         """
         Load an instance of a CDM class from disk.
@@ -100,8 +527,11 @@ class Codec:
         :param path: the path to the file
         :param validate: True to enable schema validation
         :param strictness: optional validation strictness level (0=min, 2=max)
+        :param single_parse: see Codec.loads
         :return: an instance of cls
         """
         with open(path, "r", encoding="utf-8") as json_file:
             json_data = json_file.read()
-            return Codec.loads(cdm_class, json_data, validate, strictness)
+            return Codec.loads(
+                cdm_class, json_data, validate, strictness, single_parse
+            )
@@ -0,0 +1,85 @@
+"""
+This module contains helpers for reading and writing newline-delimited JSON
+(NDJSON) streams of CDM messages, one message per line.
+
+Streams are handled as bytes so that callers can record the byte offset of
+any line and resume reading from it later.
+"""
+__all__ = ["StreamResult", "iter_lines", "open_sink"]
+
+import contextlib
+from dataclasses import dataclass
+from os import PathLike
+from typing import IO, Generic, Iterator, Optional, TypeVar, Union
+
+R = TypeVar("R")
+
+Source = Union[str, PathLike[str], IO[bytes]]
+
+
+@dataclass(frozen=True)
+class StreamResult(Generic[R]):
+    """
+    The outcome of processing one line of an NDJSON stream.
+
+    :param line: line number in the stream, counting from 1 at the offset
+        reading started from
+    :param offset: byte offset of the start of the line
+    :param end_offset: byte offset just past the end of the line. Pass this
+        as the offset to resume reading after this line.
+    :param value: the result, if processing succeeded
+    :param error: the exception raised, if processing failed
+    """
+
+    line: int
+    offset: int
+    end_offset: int
+    value: Optional[R] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@contextlib.contextmanager
+def _open(source: Source, mode: str) -> Iterator[IO[bytes]]:
+    if isinstance(source, (str, PathLike)):
+        with open(source, mode) as stream:
+            yield stream
+    else:
+        # caller owns the stream, so leave it open
+        yield source
+
+
+def iter_lines(
+    source: Source, offset: int = 0
+) -> Iterator[tuple[int, int, int, bytes]]:
+    """
+    Yield the non-blank lines of an NDJSON source one at a time.
+
+    :param source: path to a file, or a binary stream
+    :param offset: byte offset to start reading from
+    :return: iterator of (line number, start offset, end offset, line)
+    """
+    with _open(source, "rb") as stream:
+        if offset:
+            stream.seek(offset)
+        position = offset
+        for line_number, line in enumerate(stream, 1):
+            start, position = position, position + len(line)
+            if line.strip():
+                yield line_number, start, position, line
+
+
+@contextlib.contextmanager
+def open_sink(sink: Source, append: bool = False) -> Iterator[IO[bytes]]:
+    """
+    Open an NDJSON sink for writing.
+
+    :param sink: path to a file, or a binary stream
+    :param append: True to append to an existing file rather than truncate
+    :return: context manager giving a binary stream
+    """
+    with _open(sink, "ab" if append else "wb") as stream:
+        yield stream
@@ -0,0 +1,163 @@
+"""
+This module contains functions that extract top-level header fields, such as
+the interface URI and transaction ID, from raw JSON without decoding the whole
+message.
+
+Only the requested values are decoded. The rest of the document is skipped
+using regular expression and string operations, without building any Python
+objects for it, and scanning stops as soon as all requested keys have been
+found. Keys are matched literally, so keys written with JSON escape sequences
+are not recognised. The JSON is not validated beyond what is needed to find
+the keys, so malformed input is only detected if it affects the keys read.
+
+Because scanning stops early, a key that appears more than once at the top
+level gives its first value, whereas json.loads keeps the last.
+"""
+__all__ = ["HEADER_KEYS", "MessageHeader", "peek", "peek_header"]
+
+import json
+import re
+from typing import Any, Iterable, Iterator, NamedTuple, Optional, Union
+
+HEADER_KEYS = ("interface", "transaction_id", "subarray_id", "scan_id")
+
+# A JSON string, written to avoid backtracking on long strings
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+_DECODER = json.JSONDecoder()
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+class MessageHeader(NamedTuple):
+    """
+    Top-level header fields of a CDM message. Fields absent from the message
+    are None.
+    """
+
+    interface: Optional[str] = None
+    transaction_id: Optional[str] = None
+    subarray_id: Optional[int] = None
+    scan_id: Optional[int] = None
+
+
+def _depth_change(span: str) -> Optional[int]:
+    """
+    Return the change in nesting depth over a span of JSON that starts
+    outside a string, or None if the span ends inside a string.
+    """
+    # Blank out strings so brackets and quotes inside them are not counted
+    structure = _STRING.sub("", span)
+    if '"' in structure:
+        return None
+    return (
+        structure.count("{")
+        + structure.count("[")
+        - structure.count("}")
+        - structure.count("]")
+    )
+
+
+def _as_text(json_data: Union[str, bytes, bytearray]) -> str:
+    """
+    Return JSON text to scan. UTF-8 bytes are read as Latin-1, one character
+    per byte, so that offsets in the text are offsets in the bytes. UTF-8
+    writes non-ASCII characters with non-ASCII bytes only, so the structure
+    of the JSON is unchanged.
+    """
+    text = (
+        json_data.decode("latin-1")
+        if isinstance(json_data, (bytes, bytearray))
+        else json_data
+    )
+    if not text.lstrip().startswith("{"):
+        raise ValueError("JSON document is not an object")
+    return text
+
+
+def _scan(
+    json_data: Union[str, bytes, bytearray],
+    keys: Iterable[str],
+    last: bool = False,
+) -> Iterator[tuple[str, Any, int, int]]:
+    """
+    Yield (key, value, start, end) for each of the given top-level keys of
+    a JSON object, where json_data[start:end] is the JSON text of the value.
+    For bytes, start and end are byte offsets.
+
+    By default only the first occurrence of each key is yielded, and
+    scanning stops once every key has been found. With last=True the whole
+    object is scanned and every occurrence is yielded in order, so that a
+    dict built from them keeps the last, as json.loads does.
+    """
+    text = _as_text(json_data)
+    # bytes read as Latin-1 with non-ASCII characters in them
+    latin1 = text is not json_data and not text.isascii()
+    wanted = set(keys)
+    if not wanted:
+        return
+
+    # Every occurrence of a wanted key, at any depth. For each, the depth is
+    # worked out from the text since the last occurrence outside a string,
+    # or since the end of the last value decoded.
+    candidates = re.finditer(
+        r'"(%s)"\s*:\s*' % "|".join(map(re.escape, wanted)), text
+    )
+    depth = 0
+    position = 0
+    for candidate in candidates:
+        start = candidate.start()
+        if start < position:
+            # the candidate is inside a value already decoded
+            continue
+        change = _depth_change(text[position:start])
+        if change is None:
+            # the candidate is inside a string value
+            continue
+        depth += change
+        position = start
+        if depth < 1:
+            # past the end of the top-level object
+            break
+        key = candidate.group(1)
+        if depth == 1 and key in wanted:
+            start = candidate.end()
+            value, end = _DECODER.raw_decode(text, start)
+            if latin1 and _NON_ASCII.search(text, start, end):
+                # decode the value again, as UTF-8
+                value = json.loads(json_data[start:end])
+            yield key, value, start, end
+            # the value ends back at the top level
+            position = end
+            if last:
+                continue
+            wanted.discard(key)
+            if not wanted:
+                break
+
+
+def peek(
+    json_data: Union[str, bytes, bytearray], keys: Iterable[str]
+) -> dict[str, Any]:
+    """
+    Return the values of the given top-level keys of a JSON object.
+
+    If a key is repeated, its first value is returned; json.loads would
+    return the last.
+
+    :param json_data: JSON text, as str or UTF-8 bytes
+    :param keys: top-level keys to extract
+    :return: dict of the keys found and their decoded values
+    :raises: ValueError if the JSON is not an object or a requested value
+        is malformed
+    """
+    return {key: value for key, value, _, _ in _scan(json_data, keys)}
+
+
+def peek_header(json_data: Union[str, bytes, bytearray]) -> MessageHeader:
+    """
+    Return the interface, transaction_id, subarray_id and scan_id of a
+    message without decoding it.
+
+    :param json_data: JSON text, as str or UTF-8 bytes
+    :return: the message header
+    """
+    return MessageHeader(**peek(json_data, HEADER_KEYS))
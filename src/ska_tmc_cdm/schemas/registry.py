@@ -0,0 +1,134 @@
+"""
+This module contains a registry that maps interface URIs to the CDM classes
+that model them, so that messages can be decoded without the caller knowing
+their class in advance.
+
+Interface URIs have the form ``https://<host>/<family>/<version>``, e.g.,
+``https://schema.skao.int/ska-tmc-configure/4.2``. Classes are registered for
+an interface family, covering every version, and can be overridden for a
+specific version by registering the full URI.
+"""
+__all__ = ["InterfaceRegistry", "INTERFACE_REGISTRY", "split_interface"]
+
+from typing import Iterator, Optional
+
+from ska_tmc_cdm.exceptions import UnknownInterface
+from ska_tmc_cdm.messages.base import CdmObject
+from ska_tmc_cdm.messages.central_node import (
+    assign_resources,
+    mccs,
+    release_resources,
+    sdp,
+)
+from ska_tmc_cdm.messages.mccscontroller import allocate, releaseresources
+from ska_tmc_cdm.messages.mccssubarray import assigned_resources
+from ska_tmc_cdm.messages.mccssubarray import configure as mccs_configure
+from ska_tmc_cdm.messages.mccssubarray import scan as mccs_scan
+from ska_tmc_cdm.messages.subarray_node import (
+    assigned_resources as subarray_assigned_resources,
+)
+from ska_tmc_cdm.messages.subarray_node import configure, scan
+from ska_tmc_cdm.messages.subarray_node.configure import csp as configure_csp
+from ska_tmc_cdm.messages.subarray_node.configure import sdp as configure_sdp
+
+
+def split_interface(uri: str) -> tuple[str, str]:
+    """
+    Split an interface URI into its family and version.
+
+    :param uri: interface URI
+    :return: (family, version) tuple, e.g., ("ska-tmc-configure", "4.2")
+    """
+    family, _, version = uri.rstrip("/").rpartition("/")
+    return family.rpartition("/")[2], version
+
+
+class InterfaceRegistry:
+    """
+    Registry of CDM classes by interface family and version.
+    """
+
+    def __init__(self):
+        self._by_family: dict[str, type[CdmObject]] = {}
+        self._by_uri: dict[str, type[CdmObject]] = {}
+
+    def register(self, interface: str, cdm_class: type[CdmObject]) -> None:
+        """
+        Register the class that models an interface.
+
+        :param interface: either an interface family, e.g.,
+            "ska-tmc-configure", or a full interface URI to register the
+            class for that version only
+        :param cdm_class: the CDM class for the interface
+        """
+        if "/" in interface:
+            self._by_uri[interface] = cdm_class
+        else:
+            self._by_family[interface] = cdm_class
+
+    def get(self, uri: Optional[str]) -> Optional[type[CdmObject]]:
+        """
+        Return the class registered for an interface URI, or None.
+
+        :param uri: interface URI
+        :return: the CDM class, if any
+        """
+        if not uri:
+            return None
+        if cdm_class := self._by_uri.get(uri):
+            return cdm_class
+        return self._by_family.get(split_interface(uri)[0])
+
+    def __getitem__(self, uri: Optional[str]) -> type[CdmObject]:
+        if cdm_class := self.get(uri):
+            return cdm_class
+        raise UnknownInterface(uri)
+
+    def __contains__(self, uri: Optional[str]) -> bool:
+        return self.get(uri) is not None
+
+    def families(self) -> Iterator[str]:
+        """
+        Return the registered interface families.
+        """
+        return iter(self._by_family)
+
+
+INTERFACE_REGISTRY = InterfaceRegistry()
+
+for _family, _cdm_class in (
+    # TMC CentralNode
+    ("ska-tmc-assignresources", assign_resources.AssignResourcesRequest),
+    ("ska-low-tmc-assignresources", assign_resources.AssignResourcesRequest),
+    ("ska-tmc-releaseresources", release_resources.ReleaseResourcesRequest),
+    (
+        "ska-low-tmc-releaseresources",
+        release_resources.ReleaseResourcesRequest,
+    ),
+    # TMC SubArrayNode
+    ("ska-tmc-configure", configure.ConfigureRequest),
+    ("ska-low-tmc-configure", configure.ConfigureRequest),
+    ("ska-tmc-scan", scan.ScanRequest),
+    ("ska-low-tmc-scan", scan.ScanRequest),
+    (
+        "ska-low-tmc-assignedresources",
+        subarray_assigned_resources.AssignedResources,
+    ),
+    # MCCS
+    ("ska-low-mccs-assignresources", allocate.AllocateRequest),
+    (
+        "ska-low-mccs-releaseresources",
+        releaseresources.ReleaseResourcesRequest,
+    ),
+    ("ska-low-mccs-assignedresources", assigned_resources.AssignedResources),
+    ("ska-low-mccs-configure", mccs_configure.ConfigureRequest),
+    ("ska-low-mccs-scan", mccs_scan.ScanRequest),
+    ("ska-low-mccs-controller-allocate", mccs.MCCSAllocate),
+    # Subsystem blocks embedded in TMC requests
+    ("ska-sdp-assignres", sdp.SDPConfiguration),
+    ("ska-sdp-configure", configure_sdp.SDPConfiguration),
+    ("ska-csp-configure", configure_csp.CSPConfiguration),
+    ("ska-csp-configurescan", configure_csp.CSPConfiguration),
+    ("ska-low-csp-configure", configure_csp.CSPConfiguration),
+):
+    INTERFACE_REGISTRY.register(_family, _cdm_class)
@@ -0,0 +1,88 @@
+"""
+This module contains a function that splits a TMC request into the JSON of
+its per-subsystem blocks, so that each block can be forwarded to its
+subsystem without decoding and re-serialising the whole request.
+
+The JSON of each block is sliced out of the original text, so it is passed on
+exactly as received. Bytes are not decoded to str and re-encoded: each block
+of a bytes request is a memoryview of it rather than a copy.
+"""
+__all__ = ["SubsystemPart", "split_subsystems"]
+
+from typing import Any, NamedTuple, Optional, Union
+
+from ska_tmc_cdm.messages.base import CdmObject
+from ska_tmc_cdm.messages.lazy import input_names
+
+from .peek import _scan, peek
+from .registry import INTERFACE_REGISTRY, InterfaceRegistry
+
+
+class SubsystemPart(NamedTuple):
+    """
+    One subsystem block of a request.
+
+    :param field: name of the CDM field holding the block, e.g., "csp_config"
+    :param json: JSON text of the block: a str for a str request, or a
+        memoryview of the UTF-8 bytes of a bytes request
+    :param value: the parsed, not yet validated block
+    """
+
+    field: str
+    json: Union[str, memoryview]
+    value: Any
+
+    @property
+    def interface(self) -> Optional[str]:
+        """
+        The interface URI declared by the block, if any.
+        """
+        if isinstance(self.value, dict):
+            return self.value.get("interface")
+        return None
+
+
+def split_subsystems(
+    json_data: Union[str, bytes, bytearray],
+    cdm_class: Optional[type[CdmObject]] = None,
+    registry: InterfaceRegistry = INTERFACE_REGISTRY,
+) -> dict[str, SubsystemPart]:
+    """
+    Return the subsystem blocks of a request, keyed by their serialised
+    name, e.g., "csp", "sdp", "mccs" or "dish".
+
+    The blocks returned are those named by the class' subsystem_fields.
+    Blocks that are absent or null are omitted. As with json.loads, a block
+    given more than once is taken from its last occurrence.
+
+    :param json_data: JSON text of the request, as str or UTF-8 bytes
+    :param cdm_class: class of the request. If not given, it is looked up
+        in the registry by the interface the request declares.
+    :param registry: registry used to look up the class for an interface
+    :return: dict of serialised name to SubsystemPart
+    :raises: UnknownInterface if no class is given and the request declares
+        no registered interface
+    """
+    if cdm_class is None:
+        cdm_class = registry[peek(json_data, ["interface"]).get("interface")]
+
+    names = input_names(cdm_class)
+    keys = [
+        key
+        for key, name in names.items()
+        if name in cdm_class.subsystem_fields
+    ]
+    # slices of a memoryview share the memory of the bytes
+    view = json_data if isinstance(json_data, str) else memoryview(json_data)
+    parts = {}
+    for key, value, start, end in _scan(json_data, keys, last=True):
+        name = names[key]
+        serialised = cdm_class.model_fields[name].serialization_alias or name
+        if value is None:
+            # a later null replaces an earlier block
+            parts.pop(serialised, None)
+            continue
+        parts[serialised] = SubsystemPart(
+            field=name, json=view[start:end], value=value
+        )
+    return parts
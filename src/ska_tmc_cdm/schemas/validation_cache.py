@@ -0,0 +1,183 @@
+"""
+This module contains a bounded cache of Telescope Model validation verdicts,
+used by the Codec to avoid re-validating byte-identical messages.
+
+Verdicts are keyed by a hash of the canonical JSON content together with the
+interface URI, the strictness level and the version of the schemas and data
+used to reach the verdict.
+"""
+__all__ = ["ValidationCache", "ValidationCacheInfo", "VALIDATION_CACHE"]
+
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+from importlib.metadata import version
+from os import environ
+from typing import Callable, Hashable, NamedTuple, Optional
+
+from ska_tmc_cdm.exceptions import JsonValidationError, SchemaNotFound
+from ska_tmc_cdm.jsonschema.json_schema import get_data_sources
+from ska_tmc_cdm.jsonschema.lazy_import import lazy_getattr
+from ska_tmc_cdm.jsonschema.tmdata_cache import TMDATA_CACHE
+
+# Maximum number of verdicts to hold. The default of 0 disables the cache.
+VALIDATION_CACHE_SIZE = int(environ.get("VALIDATION_CACHE_SIZE", 0))
+
+TELMODEL_LIB_VERSION = version("ska_telmodel")
+
+# ska_ost_osd is imported on first validation, see lazy_import
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "SchematicValidationError": (
+            "ska_ost_osd.telvalidation.semantic_validator"
+            ":SchematicValidationError"
+        ),
+    },
+)
+_MODULE = sys.modules[__name__]
+
+# Validation failures that are a property of the message content, and so are
+# safe to cache, together with ska_ost_osd's SchematicValidationError (see
+# _cacheable_errors()). Anything else, e.g., failure to load telescope model
+# data, may be transient and is never cached.
+CACHEABLE_ERRORS: tuple[type[Exception], ...] = (
+    JsonValidationError,
+    SchemaNotFound,
+)
+
+
+def _cacheable_errors() -> tuple[type[Exception], ...]:
+    return CACHEABLE_ERRORS + (_MODULE.SchematicValidationError,)
+
+
+class ValidationCacheInfo(NamedTuple):
+    """
+    Validation cache statistics.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def _replay(exc: Exception) -> Exception:
+    """
+    Return a new exception equivalent to a cached validation failure.
+    """
+    if isinstance(exc, JsonValidationError):
+        return JsonValidationError(exc.exc, exc.uri, exc.json_dict)
+    if isinstance(exc, SchemaNotFound):
+        return SchemaNotFound(exc.uri)
+    return type(exc)(*exc.args)
+
+
+class ValidationCache:
+    """
+    Thread-safe LRU cache of validation verdicts.
+    """
+
+    def __init__(self, maxsize: int = VALIDATION_CACHE_SIZE):
+        """
+        :param maxsize: maximum number of verdicts to hold. 0 disables the
+            cache.
+        """
+        self.maxsize = maxsize
+        self._verdicts: OrderedDict[
+            Hashable, Optional[Exception]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    @staticmethod
+    def key(data: dict, strictness: Optional[int]) -> Hashable:
+        """
+        Return the cache key for validating data at a strictness level.
+
+        :param data: JSON-able dict to be validated
+        :param strictness: validation strictness level
+        :return: hashable cache key
+        """
+        canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+        digest = hashlib.blake2b(canonical.encode("utf-8")).digest()
+        data_version = (
+            TELMODEL_LIB_VERSION,
+            get_data_sources(),
+            TMDATA_CACHE.generation,
+        )
+        return digest, data.get("interface"), strictness, data_version
+
+    def validate(
+        self,
+        data: dict,
+        strictness: Optional[int],
+        validate_fn: Callable[[], None],
+    ) -> None:
+        """
+        Validate data with validate_fn, unless a verdict for the same data,
+        interface, strictness and data version is already cached.
+
+        A cached failure is raised again as an equivalent exception.
+
+        :param data: JSON-able dict to be validated
+        :param strictness: validation strictness level
+        :param validate_fn: function performing the validation
+        """
+        if self.maxsize <= 0:
+            validate_fn()
+            return
+
+        key = self.key(data, strictness)
+        with self._lock:
+            if key in self._verdicts:
+                self._hits += 1
+                self._verdicts.move_to_end(key)
+                cached = self._verdicts[key]
+                if cached is None:
+                    return
+                raise _replay(cached)
+            self._misses += 1
+
+        try:
+            validate_fn()
+        except _cacheable_errors() as exc:
+            # store a copy so the cache does not keep the traceback alive
+            self._store(key, _replay(exc))
+            raise
+        self._store(key, None)
+
+    def _store(self, key: Hashable, verdict: Optional[Exception]) -> None:
+        with self._lock:
+            self._verdicts[key] = verdict
+            self._verdicts.move_to_end(key)
+            while len(self._verdicts) > self.maxsize:
+                self._verdicts.popitem(last=False)
+                self._evictions += 1
+
+    def cache_info(self) -> ValidationCacheInfo:
+        """
+        Return hit, miss and eviction counts and the size of the cache.
+        """
+        with self._lock:
+            return ValidationCacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._verdicts),
+            )
+
+    def cache_clear(self) -> None:
+        """
+        Discard all cached verdicts and reset the statistics.
+        """
+        with self._lock:
+            self._verdicts.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+VALIDATION_CACHE = ValidationCache()
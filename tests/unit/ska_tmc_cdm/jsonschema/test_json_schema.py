@@ -3,6 +3,7 @@ Unit tests for the ska_tmc_cdm.jsonschema.json_schema module.
 """
 import copy
 import json
+from unittest.mock import Mock, patch
 
 import pytest
 from ska_ost_osd.telvalidation.semantic_validator import (
@@ -67,6 +68,94 @@ def test_schema_with_invalid_schema_uri():
         json_schema_obj.get_schema_by_uri(uri="https://foo.com/badschema/1.0")
 
 
+@pytest.fixture
+def empty_schema_cache():
+    JsonSchema.clear_cache()
+    yield
+    JsonSchema.clear_cache()
+
+
+@pytest.mark.usefixtures("empty_schema_cache")
+def test_schema_validation_reuses_resolved_schema():
+    """
+    Verify that valid JSON is validated against a cached schema, without
+    resolving the schema again.
+    """
+    with patch("ska_tmc_cdm.jsonschema.json_schema.schema") as fake_schema:
+        for _ in range(3):
+            JsonSchema.validate_schema(VALID_JSON["interface"], VALID_JSON)
+        JsonSchema.validate_schema(
+            VALID_JSON["interface"], VALID_JSON, strictness=2
+        )
+
+    assert fake_schema.schema_by_uri.call_count == 2
+    fake_schema.validate.assert_not_called()
+    # the default strictness checks the strict schema too
+    assert fake_schema.schema_by_uri.return_value.validate.call_count == 7
+
+
+@pytest.mark.usefixtures("empty_schema_cache")
+@pytest.mark.parametrize("strictness", [None, 1])
+def test_schema_validation_reports_strict_warnings(strictness):
+    """
+    Verify that JSON valid under the permissive schema but not the strict
+    schema is passed to the Telescope Model, which warns about it.
+    """
+    permissive, strict = Mock(), Mock()
+    strict.validate.side_effect = ValueError("not strictly valid")
+    with patch("ska_tmc_cdm.jsonschema.json_schema.schema") as fake_schema:
+        fake_schema.schema_by_uri.side_effect = lambda uri, strictness=None: (
+            strict if strictness == 2 else permissive
+        )
+        for _ in range(2):
+            JsonSchema.validate_schema(
+                VALID_JSON["interface"], VALID_JSON, strictness=strictness
+            )
+
+    assert fake_schema.validate.call_count == 2
+    assert fake_schema.schema_by_uri.call_count == 2
+
+
+@pytest.mark.usefixtures("empty_schema_cache")
+def test_schema_validation_without_strict_schema_uses_telescope_model():
+    """
+    Verify that JSON valid under the permissive schema is passed to the
+    Telescope Model when there is no strict schema to check it against.
+    """
+
+    def schema_by_uri(uri, strictness=None):
+        if strictness == 2:
+            raise ValueError(uri)
+        return Mock()
+
+    with patch("ska_tmc_cdm.jsonschema.json_schema.schema") as fake_schema:
+        fake_schema.schema_by_uri.side_effect = schema_by_uri
+        JsonSchema.validate_schema(
+            VALID_JSON["interface"], VALID_JSON, strictness=1
+        )
+
+    fake_schema.validate.assert_called_once()
+
+
+@pytest.mark.usefixtures("empty_schema_cache")
+def test_schema_validation_caches_unknown_uri():
+    """
+    Verify that a URI without a schema is only looked up once, and still
+    raises SchemaNotFound when strictness=2.
+    """
+    uri = "https://foo.com/badschema/1.0"
+    with patch("ska_tmc_cdm.jsonschema.json_schema.schema") as fake_schema:
+        fake_schema.schema_by_uri.side_effect = ValueError(uri)
+        for _ in range(2):
+            JsonSchema.validate_schema(uri, VALID_JSON, strictness=1)
+        for _ in range(2):
+            with pytest.raises(SchemaNotFound):
+                JsonSchema.validate_schema(uri, VALID_JSON, strictness=2)
+
+    assert fake_schema.schema_by_uri.call_count == 2
+    fake_schema.validate.assert_not_called()
+
+
 def test_semantic_validation_with_valid_json():
     """
     Verify semantic validation with test valid json
@@ -0,0 +1,33 @@
+"""
+Unit tests for the ska_tmc_cdm.jsonschema.lazy_import module.
+"""
+import json
+import sys
+import types
+
+import pytest
+
+from ska_tmc_cdm.jsonschema.lazy_import import lazy_getattr
+
+
+@pytest.fixture(name="module")
+def fixture_module():
+    module = types.ModuleType("lazy_import_test_module")
+    module.__getattr__ = lazy_getattr(
+        module.__name__, {"json": "json", "dumps": "json:dumps"}
+    )
+    sys.modules[module.__name__] = module
+    yield module
+    del sys.modules[module.__name__]
+
+
+def test_names_are_imported_on_first_access_and_kept(module):
+    assert "dumps" not in vars(module)
+    assert module.dumps is json.dumps
+    assert vars(module)["dumps"] is json.dumps
+    assert module.json is json
+
+
+def test_unknown_names_raise_attribute_error(module):
+    with pytest.raises(AttributeError, match="loads"):
+        _ = module.loads
@@ -0,0 +1,100 @@
+"""
+Unit tests for the ska_tmc_cdm.jsonschema.tmdata_cache module.
+"""
+import threading
+from unittest.mock import Mock, patch
+
+from ska_tmc_cdm.jsonschema.json_schema import JsonSchema
+from ska_tmc_cdm.jsonschema.tmdata_cache import TMDATA_CACHE, TMDataCache
+
+SOURCES = ("file:///tmdata",)
+OTHER_SOURCES = ("file:///other",)
+
+
+def test_cache_reuses_tmdata_for_same_sources():
+    """
+    Verify that TMData is loaded once per source list.
+    """
+    loader = Mock(side_effect=lambda sources: object())
+    cache = TMDataCache(loader=loader)
+
+    first = cache.get(SOURCES)
+    assert cache.get(list(SOURCES)) is first
+    assert cache.get(OTHER_SOURCES) is not first
+    assert loader.call_count == 2
+
+
+def test_cache_reloads_expired_entries():
+    """
+    Verify that entries older than the TTL are reloaded.
+    """
+    loader = Mock(side_effect=lambda sources: object())
+    cache = TMDataCache(ttl=0, loader=loader)
+
+    first = cache.get(SOURCES)
+    assert cache.get(SOURCES) is not first
+    assert loader.call_count == 2
+
+
+def test_cache_invalidate_and_refresh():
+    """
+    Verify the explicit invalidate and refresh API.
+    """
+    loader = Mock(side_effect=lambda sources: object())
+    cache = TMDataCache(loader=loader)
+
+    first = cache.get(SOURCES)
+    refreshed = cache.refresh(SOURCES)
+    assert refreshed is not first
+    assert cache.get(SOURCES) is refreshed
+
+    cache.invalidate(SOURCES)
+    assert cache.get(SOURCES) is not refreshed
+
+    cache.get(OTHER_SOURCES)
+    cache.invalidate()
+    assert loader.call_count == 4
+    cache.get(OTHER_SOURCES)
+    assert loader.call_count == 5
+
+
+def test_background_refresh_swaps_in_new_data():
+    """
+    Verify that the background refresher replaces cached entries.
+    """
+    refreshed = threading.Event()
+    calls = []
+
+    def loader(sources):
+        calls.append(sources)
+        if len(calls) > 1:
+            refreshed.set()
+        return object()
+
+    cache = TMDataCache(loader=loader)
+    first = cache.get(SOURCES)
+    cache.start_background_refresh(interval=0.01)
+    try:
+        assert refreshed.wait(timeout=5)
+    finally:
+        cache.stop_background_refresh()
+    assert cache.get(SOURCES) is not first
+
+
+@patch("ska_tmc_cdm.jsonschema.json_schema.televalidation_schema")
+def test_semantic_validation_uses_cached_tmdata(fake_televalidation):
+    """
+    Verify that repeated semantic validations share one TMData instance.
+    """
+    TMDATA_CACHE.invalidate()
+    with patch("ska_tmc_cdm.jsonschema.tmdata_cache.TMData") as fake_tmdata:
+        JsonSchema.semantic_validate_schema({}, "uri")
+        JsonSchema.semantic_validate_schema({}, "uri")
+    TMDATA_CACHE.invalidate()
+
+    fake_tmdata.assert_called_once()
+    tm_data = {
+        c.kwargs["tm_data"]
+        for c in fake_televalidation.semantic_validate.call_args_list
+    }
+    assert tm_data == {fake_tmdata.return_value}
@@ -13,6 +13,7 @@ from ska_tmc_cdm.messages.subarray_node.configure.core import (
     PointingConfiguration,
     ReceiverBand,
     Target,
+    convert_targets,
 )
 from tests.unit.ska_tmc_cdm.builder.subarray_node.configure.core import (
     PointingConfigurationBuilder,
@@ -183,6 +184,14 @@ TARGET_VALIDATION_CASES = (
         args={"ra": None, "dec": 0},
         expected_error=ValueError,
     ),
+    ValidationCase(
+        args={"ra": "garbage", "dec": 0},
+        expected_error=ValueError,
+    ),
+    ValidationCase(
+        args={"ra": 0, "dec": "100:00:00"},
+        expected_error=ValueError,
+    ),
 )
 
 
@@ -225,6 +234,73 @@ def test_target_str():
     assert expected == str(target)
 
 
+def test_target_coord_is_cached_and_shared():
+    """
+    Verify a Target builds its coordinate once, shares it with equal
+    Targets, and rebuilds it when the coordinate fields change.
+    """
+    target = Target(ra="12:00:00", dec="-30:00:00")
+    coord = target.coord
+
+    assert target.coord is coord
+    assert Target(ra="12:00:00", dec="-30:00:00").coord is coord
+
+    target.ra = "13:00:00"
+    assert target.coord is not coord
+    assert target.coord.ra.hourangle == pytest.approx(13.0)
+
+    target.unit = ("deg", "deg")
+    assert target.coord.ra.deg == pytest.approx(13.0)
+
+
+def test_target_coord_not_stale_after_batch_update_rollback():
+    """
+    Verify the cached coordinate follows the fields when a batch update is
+    rolled back.
+    """
+    target = FK5Target(ra="12:00:00", dec="-30:00:00")
+    with pytest.raises(RuntimeError):
+        with target.batch_update():
+            target.dec = "-40:00:00"
+            assert target.coord.dec.deg == pytest.approx(-40.0)
+            raise RuntimeError
+
+    assert target.coord.dec.deg == pytest.approx(-30.0)
+    assert (
+        target.model_dump()["dec"]
+        != FK5Target(ra="12:00:00", dec="-40:00:00").model_dump()["dec"]
+    )
+
+
+def test_convert_targets_matches_per_target_conversion():
+    """
+    Verify targets converted together serialise as when converted one at a
+    time.
+    """
+    targets = [
+        FK5Target(ra=f"{hour}:{hour * 2}:{hour * 0.37:.2f}", dec=-hour * 3.7)
+        for hour in range(24)
+    ] + [
+        Target(ra=hour * 15.1, dec=hour * 100.0, unit=("deg", "arcsec"))
+        for hour in range(24)
+    ]
+    expected = [
+        (copy.model_dump(), repr(copy))
+        for copy in (target.model_copy(deep=True) for target in targets)
+    ]
+
+    convert_targets([PointingConfiguration(target=t) for t in targets])
+
+    assert [
+        (target.model_dump(), repr(target)) for target in targets
+    ] == expected
+    assert all(target._derived.coord is None for target in targets)
+
+    # conversions are forgotten when the target changes
+    targets[0].ra = "1:00:00"
+    assert targets[0].model_dump()["ra"] != expected[0][0]["ra"]
+
+
 def test_pointing_configuration_eq():
     """
     Verify that PointingConfiguration objects are considered equal when:
@@ -0,0 +1,114 @@
+"""
+Unit tests for the ska_tmc_cdm.messages.subarray_node.configure.sexagesimal
+module, checking its output is that of astropy.
+"""
+import random
+
+import pytest
+from astropy import units as u
+from astropy.coordinates import SkyCoord
+
+from ska_tmc_cdm import CdmObject
+from ska_tmc_cdm.messages.subarray_node.configure import sexagesimal
+from ska_tmc_cdm.messages.subarray_node.configure.core import _TargetBase
+from tests.unit.ska_tmc_cdm.messages.test_serialization import FIXTURE_OBJECTS
+
+
+def _astropy_hmsdms(ra, dec, unit):
+    coord = SkyCoord(ra=ra, dec=dec, unit=unit, frame="icrs")
+    return tuple(
+        coord.transform_to("icrs").to_string("hmsdms", sep=":").split(" ")
+    )
+
+
+def _targets(value):
+    if isinstance(value, _TargetBase):
+        yield value
+    elif isinstance(value, CdmObject):
+        for item in value.__dict__.values():
+            yield from _targets(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _targets(item)
+
+
+def test_conversion_factors_match_astropy():
+    assert sexagesimal._HOURS_PER_DEGREE == u.deg.to(u.hourangle)
+    assert sexagesimal._HOURS_PER_CIRCLE == u.deg.to(u.hourangle, 360.0)
+
+
+def test_fixture_targets_match_astropy():
+    """
+    Verify every ICRS target in the serialisation fixtures is formatted
+    without astropy, exactly as by astropy.
+    """
+    targets = [
+        target
+        for param in FIXTURE_OBJECTS
+        for target in _targets(param.values[0])
+        if target.ra is not None and target.reference_frame.lower() == "icrs"
+    ]
+    assert targets
+    for target in targets:
+        args = (target.ra, target.dec, target.unit)
+        assert sexagesimal.icrs_hmsdms(*args) == _astropy_hmsdms(*args)
+
+
+@pytest.mark.parametrize(
+    "ra, dec, unit",
+    [
+        ("21:08:47.92", "-88:57:22.9", ("hourangle", "deg")),
+        ("12:30", "-12:30", ("hourangle", "deg")),
+        ("-0:30:00", "-0:0:0.5", ("hourangle", "deg")),
+        ("+1:00:00", "+1:00:00", ("hourangle", "deg")),
+        ("23:59:59.99999999999", "0", ("hourangle", "deg")),
+        ("12.", ".5", "deg"),
+        (1, 0.5, ("hourangle", "deg")),
+        (24.0, 90, ("hourangle", "deg")),
+        (359.99999999999, 89.99999999999, "deg"),
+        (-1e-15, -0.0, ("deg", "deg")),
+        (720.0, -90.0, "degree"),
+    ],
+)
+def test_edge_cases_match_astropy(ra, dec, unit):
+    assert sexagesimal.icrs_hmsdms(ra, dec, unit) == _astropy_hmsdms(
+        ra, dec, unit
+    )
+
+
+def test_random_coordinates_match_astropy():
+    rng = random.Random(20261016)
+    for _ in range(500):
+        unit = rng.choice([("hourangle", "deg"), "deg"])
+        hours = unit[0] == "hourangle"
+        if rng.random() < 0.5:
+            ra, dec = (
+                f"{rng.randint(low, high)}:{rng.randint(0, 59)}:"
+                f"{rng.uniform(0, 60):.{rng.randint(0, 9)}f}"
+                for low, high in ((0, 23 if hours else 359), (-89, 89))
+            )
+        else:
+            ra = rng.uniform(-1000.0, 1000.0)
+            dec = rng.uniform(-90.0, 90.0)
+        fast = sexagesimal.icrs_hmsdms(ra, dec, unit)
+        if fast is not None:
+            assert fast == _astropy_hmsdms(ra, dec, unit), (ra, dec, unit)
+
+
+@pytest.mark.parametrize(
+    "ra, dec, unit",
+    [
+        ("24:00:00", "0", ("hourangle", "deg")),
+        ("12:60:00", "0", ("hourangle", "deg")),
+        ("12:00:00", "100", ("hourangle", "deg")),
+        ("12h00m00s", "0", ("hourangle", "deg")),
+        ("1e3", "0", "deg"),
+        (" 12:00:00", "0", ("hourangle", "deg")),
+        (float("nan"), 0.0, "deg"),
+        (1.0, 0.0, ("rad", "deg")),
+        (1.0, 0.0, ("hourangle", "arcsec")),
+        (1.0, 0.0, u.deg),
+    ],
+)
+def test_unhandled_input_falls_back(ra, dec, unit):
+    assert sexagesimal.icrs_hmsdms(ra, dec, unit) is None
@@ -1,11 +1,35 @@
 # flake8: noqa
-from datetime import datetime, timezone
+import pickle
+from datetime import datetime, timedelta, timezone
 from typing import Any, Callable, Optional
+from unittest.mock import Mock, patch
 
 import pytest
-from pydantic import AwareDatetime, Field
+from pydantic import AwareDatetime, BaseModel, Field, ValidationError
 
 from ska_tmc_cdm import CdmObject
+from ska_tmc_cdm.messages.central_node.sdp import (
+    EBScanType,
+    EBScanTypeBeam,
+    PhaseDir,
+)
+from ska_tmc_cdm.messages.frozen import FrozenCdmObject, freeze
+from ska_tmc_cdm.messages.skydirection import ReferenceFrame
+from ska_tmc_cdm.messages.subarray_node.configure.core import (
+    ICRSTarget,
+    ReceiverBand,
+)
+from ska_tmc_cdm.messages.subarray_node.configure.csp import (
+    CommonConfiguration,
+)
+from tests.unit.ska_tmc_cdm.serialisation.central_node.test_assign_resources import (
+    VALID_LOW_ASSIGNRESOURCESREQUEST_OBJECT_4_0,
+    VALID_MID_ASSIGNRESOURCESREQUEST_OBJECT_PI16,
+)
+from tests.unit.ska_tmc_cdm.serialisation.subarray_node.test_configure import (
+    VALID_LOW_CONFIGURE_OBJECT_4_0,
+    VALID_MID_CONFIGURE_OBJECT_4_2,
+)
 
 FIELD_NAME = "field"
 
@@ -175,3 +199,327 @@ def test_exclude_default_nulls_and_empty(obj, expect_field):
         assert FIELD_NAME in serialised
     else:
         assert FIELD_NAME not in serialised
+
+
+def test_default_factory_is_called_once_per_class():
+    """
+    Verify that default factories are evaluated once per class for
+    serialisation, not on every dump.
+    """
+    factory = Mock(return_value=[])
+    obj = object_factory(list[str], default_factory=factory)
+    calls_on_construction = factory.call_count
+
+    for _ in range(3):
+        assert obj.model_dump() == {}
+    type(obj)().model_dump()
+
+    # once for the plan, once for the second instance
+    assert factory.call_count == calls_on_construction + 2
+
+
+def test_serialization_alias_is_resolved():
+    """
+    Verify that fields dumped under their serialization alias are filtered
+    as the field they belong to.
+    """
+
+    class Aliased(CdmObject):
+        field: Optional[list[str]] = Field(
+            default=None, serialization_alias="alias"
+        )
+
+    assert Aliased().model_dump(by_alias=True) == {}
+    assert Aliased(field=[]).model_dump(by_alias=True) == {"alias": []}
+
+
+FINGERPRINT_OBJECTS = [
+    VALID_MID_ASSIGNRESOURCESREQUEST_OBJECT_PI16,
+    VALID_LOW_ASSIGNRESOURCESREQUEST_OBJECT_4_0,
+    VALID_MID_CONFIGURE_OBJECT_4_2,
+    VALID_LOW_CONFIGURE_OBJECT_4_0,
+]
+
+
+@pytest.mark.parametrize("obj", FINGERPRINT_OBJECTS)
+def test_fingerprint_depends_on_content_only(obj):
+    """
+    Verify that equal objects, however they were made, have the same
+    fingerprint.
+    """
+    fingerprint = obj.fingerprint()
+    json_str = obj.model_dump_json(exclude_none=True, by_alias=True)
+
+    assert len(fingerprint) == 32
+    assert obj.model_copy(deep=True).fingerprint() == fingerprint
+    assert pickle.loads(pickle.dumps(obj)).fingerprint() == fingerprint
+    assert type(obj).model_validate_json(json_str) == obj
+    assert type(obj).model_validate_json(json_str).fingerprint() == fingerprint
+
+
+def test_fingerprint_is_forgotten_when_a_descendant_is_assigned():
+    obj = VALID_MID_CONFIGURE_OBJECT_4_2.model_copy(deep=True)
+    fingerprint = obj.fingerprint()
+    region = obj.csp.midcbf.correlation.processing_regions[0]
+
+    region.channel_count += 20
+    assert obj.fingerprint() != fingerprint
+    region.channel_count -= 20
+    assert obj.fingerprint() == fingerprint
+
+    obj.csp.common.config_id = "changed"
+    assert obj.fingerprint() != fingerprint
+
+
+class Leaf(CdmObject):
+    value: Any = None
+
+
+class Branch(CdmObject):
+    leaf: Optional[Leaf] = None
+    leaves: list[Leaf] = Field(default_factory=list)
+
+
+def test_fingerprint_of_shared_object():
+    """
+    Verify that assigning to an object held by several others updates the
+    fingerprints of all of them.
+    """
+    leaf = Leaf(value=1)
+    branch_a = Branch(leaf=leaf)
+    branch_b = Branch(leaves=[Leaf(), leaf])
+    before = branch_a.fingerprint(), branch_b.fingerprint()
+
+    leaf.value = 2
+
+    assert branch_a.fingerprint() != before[0]
+    assert branch_b.fingerprint() != before[1]
+    assert branch_a.fingerprint() == Branch(leaf=Leaf(value=2)).fingerprint()
+
+
+@pytest.mark.parametrize(
+    "value_a,value_b",
+    [
+        (1, 1.0),
+        ("icrs", ReferenceFrame.ICRS),
+        ({"a": 1, "b": 2}, {"b": 2, "a": 1}),
+        ({1, 2}, frozenset({2, 1})),
+        (DT, DT.astimezone(timezone(timedelta(hours=2)))),
+    ],
+)
+def test_equal_values_have_equal_fingerprints(value_a, value_b):
+    assert Leaf(value=value_a) == Leaf(value=value_b)
+    assert (
+        Leaf(value=value_a).fingerprint() == Leaf(value=value_b).fingerprint()
+    )
+
+
+@pytest.mark.parametrize(
+    "value_a,value_b",
+    [(1, 2), (1, "1"), (None, ""), ([1, 2], [2, 1]), (["a", "b"], ["ab"])],
+)
+def test_unequal_values_have_different_fingerprints(value_a, value_b):
+    assert (
+        Leaf(value=value_a).fingerprint() != Leaf(value=value_b).fingerprint()
+    )
+
+
+def test_fingerprint_respects_tolerant_equality():
+    target_a = ICRSTarget(ra="12:00:00", dec="-30:00:00")
+    target_b = ICRSTarget(ra=12.0, dec=-30.0)
+    phase_a = PhaseDir(ra=[1.0], dec=[0.5], reference_frame="icrs")
+    phase_b = PhaseDir(ra=[1.0 + 1e-16], dec=[0.5], reference_frame="icrs")
+
+    assert target_a == target_b
+    assert target_a.fingerprint() == target_b.fingerprint()
+    assert phase_a == phase_b
+    assert phase_a.fingerprint() == phase_b.fingerprint()
+    assert (
+        ICRSTarget(ra=12.0, dec=-30.0, target_name="other").fingerprint()
+        != target_a.fingerprint()
+    )
+
+
+def test_eq_short_circuits_on_cached_fingerprints():
+    """
+    Verify that frozen objects with differing cached fingerprints are not
+    compared field by field.
+    """
+    branch_a = freeze(Branch(leaves=[Leaf(value=1)]))
+    branch_b = freeze(Branch(leaves=[Leaf(value=2)]))
+
+    with patch.object(BaseModel, "__eq__", return_value=False) as fake_eq:
+        branch_a.fingerprint()
+        assert branch_a != branch_b
+        assert fake_eq.call_count == 1
+        branch_b.fingerprint()
+        assert branch_a != branch_b
+        assert fake_eq.call_count == 1
+
+
+def test_eq_sees_changes_made_in_place_after_fingerprint():
+    """
+    Verify that a stale cached fingerprint of a mutable object does not
+    change whether it compares equal.
+    """
+    branch_a = Branch(leaves=[Leaf(value=1)])
+    branch_b = Branch(leaves=[Leaf(value=1), Leaf(value=2)])
+    branch_a.fingerprint()
+    branch_b.fingerprint()
+
+    branch_a.leaves.append(Leaf(value=2))
+
+    assert branch_a == branch_b
+
+
+def test_with_path_copies_only_the_path():
+    request = VALID_MID_CONFIGURE_OBJECT_4_2
+    original_json = request.model_dump_json()
+
+    changed = request.with_path("pointing.groups[0].field.target_name", "X")
+
+    assert changed.pointing.groups[0].field.target_name == "X"
+    assert request.model_dump_json() == original_json
+    assert changed.csp is request.csp
+    assert changed.sdp is request.sdp
+    assert changed.pointing is not request.pointing
+    assert changed.pointing.groups is not request.pointing.groups
+    assert (
+        changed.pointing.groups[0].trajectory
+        is request.pointing.groups[0].trajectory
+    )
+    assert changed == request.model_copy(deep=True).with_path(
+        "pointing.groups[0].field.target_name", "X"
+    )
+    assert changed.fingerprint() != request.fingerprint()
+
+
+def test_with_path_validates_changed_objects():
+    request = VALID_MID_CONFIGURE_OBJECT_4_2
+
+    changed = request.with_path("csp.common.frequency_band", "2")
+
+    assert changed.csp.common.frequency_band.value == "2"
+    with pytest.raises(ValidationError):
+        request.with_path("csp.common.subarray_id", "one")
+    with pytest.raises(ValidationError):
+        # fails TMCConfiguration's model validator
+        request.with_path("tmc.scan_duration", None)
+    assert request.tmc.scan_duration is not None
+
+
+def test_with_path_of_frozen_object():
+    frozen = freeze(VALID_MID_CONFIGURE_OBJECT_4_2)
+
+    changed = frozen.with_path("sdp.scan_type", "science")
+
+    assert isinstance(changed, FrozenCdmObject)
+    assert changed.sdp.scan_type == "science"
+    assert frozen.sdp.scan_type == "science_A"
+    assert hash(changed) == hash(
+        freeze(
+            VALID_MID_CONFIGURE_OBJECT_4_2.with_path(
+                "sdp.scan_type", "science"
+            )
+        )
+    )
+
+
+def test_with_path_takes_digits_as_dict_keys():
+    scan_type = EBScanType(
+        scan_type_id="science",
+        beams={"1": EBScanTypeBeam(field_id="field_a")},
+    )
+
+    changed = scan_type.with_path("beams[1].field_id", "field_b")
+
+    assert changed.beams == {"1": EBScanTypeBeam(field_id="field_b")}
+    with pytest.raises(ValueError):
+        scan_type.with_path("beams[0].field_id", "field_b")
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["", ".csp", "csp..common", "csp.missing", "csp[0]", "pointing.groups[9]"],
+)
+def test_with_path_rejects_bad_paths(path):
+    with pytest.raises(ValueError):
+        VALID_MID_CONFIGURE_OBJECT_4_2.with_path(path, None)
+
+
+def test_batch_update_validates_once_on_exit():
+    """
+    Verify that fields validated against each other can be changed
+    together, and that validators run once for the batch.
+    """
+    common = CommonConfiguration(
+        config_id="config", frequency_band=ReceiverBand.BAND_1
+    )
+
+    with patch.object(
+        CommonConfiguration,
+        "model_validate",
+        wraps=CommonConfiguration.model_validate,
+    ) as model_validate:
+        with common.batch_update():
+            common.frequency_band = "5a"
+            common.band_5_tuning = [5.85, 7.25]
+            assert common.frequency_band == "5a"
+
+    assert model_validate.call_count == 1
+    assert common.frequency_band == ReceiverBand.BAND_5A
+    assert common.band_5_tuning == [5.85, 7.25]
+    assert {"frequency_band", "band_5_tuning"} <= common.model_fields_set
+    with pytest.raises(ValidationError):
+        common.frequency_band = ReceiverBand.BAND_1
+
+
+def test_batch_update_rolls_back_on_failure():
+    common = CommonConfiguration(
+        config_id="config", frequency_band=ReceiverBand.BAND_1
+    )
+    fingerprint = common.fingerprint()
+
+    with pytest.raises(ValidationError):
+        with common.batch_update():
+            common.config_id = "changed"
+            common.frequency_band = ReceiverBand.BAND_5A
+    with pytest.raises(KeyError):
+        with common.batch_update():
+            common.config_id = "changed"
+            raise KeyError
+
+    assert common.config_id == "config"
+    assert common.frequency_band == ReceiverBand.BAND_1
+    assert common.model_fields_set == {"config_id", "frequency_band"}
+    assert common.fingerprint() == fingerprint
+
+
+def test_batch_update_nests():
+    common = CommonConfiguration(
+        config_id="config", frequency_band=ReceiverBand.BAND_1
+    )
+
+    with common.batch_update():
+        common.frequency_band = ReceiverBand.BAND_5B
+        with common.batch_update():
+            common.config_id = "changed"
+        common.band_5_tuning = [5.85, 7.25]
+
+    assert common.config_id == "changed"
+    with pytest.raises(TypeError):
+        with freeze(common).batch_update():
+            pass
+
+
+def test_batch_update_without_model_validators():
+    obj = Obj(n=1)
+
+    with obj.batch_update():
+        obj.n = "2"
+    assert obj.n == 2
+    with pytest.raises(ValidationError):
+        with obj.batch_update():
+            obj.n = 3
+            obj.n = "three"
+    assert obj.n == 2
@@ -0,0 +1,191 @@
+"""
+Unit tests for the ska_tmc_cdm.messages.frozen module.
+"""
+import copy
+import pickle
+from typing import Optional
+
+import pytest
+from pydantic import Field, ValidationError
+
+from ska_tmc_cdm import CdmObject
+from ska_tmc_cdm.messages.central_node.common import DishAllocation
+from ska_tmc_cdm.messages.central_node.release_resources import (
+    ReleaseResourcesRequest,
+)
+from ska_tmc_cdm.messages.central_node.sdp import PhaseDir
+from ska_tmc_cdm.messages.frozen import (
+    FrozenCdmObject,
+    FrozenDict,
+    freeze,
+    frozen_class,
+    thaw,
+)
+from ska_tmc_cdm.messages.serialization import dump_json
+from ska_tmc_cdm.messages.skydirection import ICRSField
+from ska_tmc_cdm.messages.subarray_node.configure import ConfigureRequest
+from ska_tmc_cdm.messages.subarray_node.configure.core import ICRSTarget
+from ska_tmc_cdm.messages.subarray_node.configure.csp import CSPConfiguration
+from tests.unit.ska_tmc_cdm.messages.test_serialization import FIXTURE_OBJECTS
+from tests.unit.ska_tmc_cdm.serialisation.subarray_node.test_configure import (
+    VALID_MID_CONFIGURE_OBJECT_4_2,
+)
+
+
+@pytest.mark.parametrize("obj", FIXTURE_OBJECTS)
+def test_freeze_and_thaw_round_trip(obj):
+    """
+    Verify that a frozen object serialises exactly as its mutable form, and
+    thaws back to an equal object with the same fields set.
+    """
+    frozen = freeze(obj)
+    thawed = thaw(frozen)
+
+    assert isinstance(frozen, FrozenCdmObject)
+    assert isinstance(frozen, type(obj))
+    assert hash(frozen) == hash(freeze(obj))
+    assert frozen.model_dump_json(
+        exclude_none=True, by_alias=True
+    ) == obj.model_dump_json(exclude_none=True, by_alias=True)
+    assert frozen.model_dump(by_alias=True) == obj.model_dump(by_alias=True)
+    assert dump_json(frozen) == dump_json(obj)
+    assert type(thawed) is type(obj)
+    assert thawed == obj
+    assert thawed.model_fields_set == obj.model_fields_set
+
+
+@pytest.mark.parametrize("obj", FIXTURE_OBJECTS)
+def test_frozen_class_validates_json(obj):
+    """
+    Verify that a frozen class validates JSON to the same object that
+    freeze() gives.
+    """
+    json_str = obj.model_dump_json(exclude_none=True, by_alias=True)
+    try:
+        type(obj).model_validate_json(json_str)
+    except ValidationError:
+        pytest.skip("fixture does not round trip")
+
+    validated = frozen_class(type(obj)).model_validate_json(json_str)
+
+    assert validated == freeze(type(obj).model_validate_json(json_str))
+    assert hash(validated) == hash(freeze(obj))
+
+
+def test_frozen_objects_cannot_be_changed():
+    frozen = freeze(VALID_MID_CONFIGURE_OBJECT_4_2)
+
+    with pytest.raises(ValidationError):
+        frozen.csp = None
+    with pytest.raises(ValidationError):
+        frozen.csp.common.config_id = "changed"
+    assert isinstance(frozen.csp.midcbf.correlation.processing_regions, tuple)
+    with pytest.raises(AttributeError):
+        frozen.csp.midcbf.correlation.processing_regions.append(None)
+
+
+def test_freeze_shares_frozen_values():
+    """
+    Verify that frozen values are shared rather than copied, both ways.
+    """
+    csp = freeze(VALID_MID_CONFIGURE_OBJECT_4_2.csp)
+    request = VALID_MID_CONFIGURE_OBJECT_4_2.model_copy()
+
+    request.csp = csp
+
+    assert request.csp is csp
+    assert freeze(request).csp is csp
+    assert freeze(csp) is csp
+    assert thaw(request) is request
+    assert type(thaw(freeze(request)).csp) is CSPConfiguration
+
+
+def test_frozen_mirror_is_generated_once():
+    frozen_request = frozen_class(ConfigureRequest)
+
+    assert frozen_class(ConfigureRequest) is frozen_request
+    assert frozen_class(frozen_request) is frozen_request
+    assert frozen_request.mutable_class is ConfigureRequest
+    assert frozen_request.__name__ == "FrozenConfigureRequest"
+
+
+def test_frozen_objects_are_usable_as_keys():
+    field = ICRSField(
+        target_name="Polaris",
+        attrs=ICRSField.Attrs(c1=37.95, c2=89.26),
+    )
+    cache = {freeze(field): "cached"}
+
+    assert cache[freeze(field.model_copy(deep=True))] == "cached"
+    assert freeze(field.model_copy(update={"target_name": "x"})) not in cache
+
+
+def test_hash_agrees_with_tolerant_equality():
+    """
+    Verify that objects whose __eq__ allows for tolerance hash equal when
+    they compare equal.
+    """
+    target_a = freeze(ICRSTarget(ra="12:00:00", dec="-30:00:00"))
+    target_b = freeze(ICRSTarget(ra=12.0, dec=-30.0))
+    phase_a = freeze(PhaseDir(ra=[1.0], dec=[0.5], reference_frame="icrs"))
+    phase_b = freeze(
+        PhaseDir(ra=[1.0 + 1e-16], dec=[0.5], reference_frame="icrs")
+    )
+
+    assert target_a == target_b
+    assert hash(target_a) == hash(target_b)
+    assert phase_a == phase_b
+    assert hash(phase_a) == hash(phase_b)
+
+
+def test_frozen_class_accepts_converted_input():
+    """
+    Verify that fields converted by validators of the mutable class hold
+    frozen objects.
+    """
+    request = frozen_class(ReleaseResourcesRequest).model_validate(
+        {"subarray_id": 1, "receptor_ids": ["SKA001"]}
+    )
+
+    assert isinstance(request.dish, FrozenCdmObject)
+    assert request.dish.receptor_ids == frozenset({"SKA001"})
+
+
+def test_frozen_mirror_leaves_mutable_fields_unchanged():
+    """
+    Verify that generating a frozen mirror does not change the fields of
+    the class it mirrors.
+    """
+    frozen_class(ReleaseResourcesRequest)
+
+    field_info = ReleaseResourcesRequest.model_fields["dish"]
+    assert not field_info.metadata
+    assert field_info.annotation == Optional[DishAllocation]
+
+
+def test_frozen_mirror_freezes_defaults_made_from_data():
+    class Scans(CdmObject):
+        first: int = 1
+        ids: list[int] = Field(default_factory=lambda data: [data["first"]])
+
+    assert frozen_class(Scans)(first=2).ids == (2,)
+
+
+def test_frozen_objects_pickle_and_copy():
+    frozen = freeze(VALID_MID_CONFIGURE_OBJECT_4_2)
+
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    assert copy.deepcopy(frozen) == frozen
+    assert copy.copy(frozen) == frozen
+
+
+def test_frozen_dict():
+    frozen = FrozenDict({"a": (1, 2)})
+
+    with pytest.raises(TypeError):
+        frozen["b"] = 3
+    with pytest.raises(TypeError):
+        frozen.update(b=3)
+    assert frozen == {"a": (1, 2)}
+    assert hash(frozen) == hash(FrozenDict({"a": (1, 2)}))
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
@@ -0,0 +1,83 @@
+"""
+Unit tests for the ska_tmc_cdm.messages.interning module.
+"""
+import gc
+import json
+
+from ska_tmc_cdm.messages.central_node.sdp import Channel
+from ska_tmc_cdm.messages.frozen import freeze, frozen_class
+from ska_tmc_cdm.messages.interning import InternTable
+from ska_tmc_cdm.messages.subarray_node.configure import ConfigureRequest
+from ska_tmc_cdm.messages.subarray_node.configure.core import ICRSTarget
+from tests.unit.ska_tmc_cdm.serialisation.subarray_node.test_configure import (
+    VALID_MID_CONFIGURE_JSON_4_2,
+)
+
+
+def _decode(cls=ConfigureRequest):
+    return cls.model_validate_json(json.dumps(VALID_MID_CONFIGURE_JSON_4_2))
+
+
+def _channel(count: int) -> Channel:
+    return Channel(count=count, start=0, freq_min=0.0, freq_max=1.0)
+
+
+def test_strings_are_shared():
+    table = InternTable()
+    request_a = table.intern(_decode())
+    request_b = table.intern(_decode())
+
+    regions_a = request_a.csp.midcbf.correlation.processing_regions
+    regions_b = request_b.csp.midcbf.correlation.processing_regions
+    assert regions_a[0].receptors[0] is regions_b[1].receptors[0]
+    assert request_a.csp.interface is request_b.csp.interface
+    assert request_a == _decode()
+
+
+def test_only_frozen_objects_are_shared():
+    table = InternTable()
+    mutable_a = table.intern(_decode())
+    mutable_b = table.intern(_decode())
+    frozen_a = table.intern(_decode(frozen_class(ConfigureRequest)))
+    frozen_b = table.intern(_decode(frozen_class(ConfigureRequest)))
+
+    assert mutable_a.csp is not mutable_b.csp
+    assert frozen_a.csp is frozen_b.csp
+    assert frozen_a == freeze(_decode())
+    assert frozen_a.model_dump_json() == _decode().model_dump_json()
+    assert table.info().hits > 0
+
+
+def test_objects_with_tolerant_equality_are_not_shared():
+    table = InternTable()
+    target_a = table.intern(freeze(ICRSTarget(ra="12:00:00", dec="-30:0:0")))
+    target_b = table.intern(freeze(ICRSTarget(ra=12.0, dec=-30.0)))
+
+    assert target_a == target_b
+    assert target_a is not target_b
+    assert target_b.ra == 12.0
+
+
+def test_table_is_bounded_and_weak():
+    table = InternTable(maxsize=2)
+    channels = [table.intern(freeze(_channel(count))) for count in range(5)]
+
+    assert table.info().currsize == 2
+    assert table.intern(freeze(_channel(0))) is channels[0]
+    del channels
+    gc.collect()
+    assert table.info().currsize == 0
+
+
+def test_equal_values_of_different_types_are_not_shared():
+    table = InternTable()
+    as_float = table.intern(freeze(_channel(0)))
+    as_int = table.intern(
+        freeze(
+            Channel.model_construct(count=0, start=0, freq_min=0, freq_max=1.0)
+        )
+    )
+
+    assert as_int == as_float
+    assert as_int is not as_float
+    assert type(as_int.freq_min) is int
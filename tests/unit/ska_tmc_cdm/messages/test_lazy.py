@@ -0,0 +1,184 @@
+"""
+Unit tests for the ska_tmc_cdm.messages.lazy module.
+"""
+import json
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from ska_tmc_cdm.messages.central_node.assign_resources import (
+    AssignResourcesRequest,
+)
+from ska_tmc_cdm.messages.lazy import FieldAdapter, LazyMessage
+from ska_tmc_cdm.messages.subarray_node.configure import ConfigureRequest
+from ska_tmc_cdm.schemas import CODEC
+from ska_tmc_cdm.schemas.registry import INTERFACE_REGISTRY
+from tests.unit.ska_tmc_cdm.messages.test_serialization import FIXTURE_OBJECTS
+from tests.unit.ska_tmc_cdm.serialisation.test_codec import TEST_PARAMETERS
+
+LAZY_PARAMETERS = [
+    (cls, json_str, obj)
+    for cls, json_str, obj, _ in TEST_PARAMETERS
+    if cls in (AssignResourcesRequest, ConfigureRequest)
+]
+
+REGISTERED_CLASSES = {
+    INTERFACE_REGISTRY[f"https://schema.skao.int/{family}/1.0"]
+    for family in INTERFACE_REGISTRY.families()
+}
+
+# The JSON of every fixture object of a registered class
+REGISTERED_PARAMETERS = [
+    pytest.param(
+        type(param.values[0]),
+        CODEC.dumps(param.values[0], validate=False),
+        id=param.id,
+    )
+    for param in FIXTURE_OBJECTS
+    if type(param.values[0]) in REGISTERED_CLASSES
+]
+
+
+@pytest.mark.parametrize("cls,json_str,expected", LAZY_PARAMETERS)
+def test_lazy_fields_match_eager_decode(cls, json_str, expected):
+    """
+    Verify that every field of a lazy message, and the model built from it,
+    equals that of the eagerly decoded object.
+    """
+    lazy = LazyMessage(cls, json.loads(json_str))
+
+    for name in cls.model_fields:
+        assert getattr(lazy, name) == getattr(expected, name)
+    assert lazy.to_model() == expected
+
+
+@pytest.mark.parametrize("cls,json_str", REGISTERED_PARAMETERS)
+def test_lazy_decode_matches_eager_decode_of_registered_classes(cls, json_str):
+    """
+    Verify that a lazy message of every registered class decodes as
+    Codec.loads does, including fields with field validators, e.g., the
+    receptor_ids of a ReleaseResourcesRequest.
+    """
+    expected = CODEC.loads(cls, json_str, validate=False)
+
+    lazy = CODEC.loads_lazy(cls, json_str, validate=False)
+
+    for name in cls.model_fields:
+        assert getattr(lazy, name) == getattr(expected, name)
+    assert lazy.to_model() == expected
+
+
+def test_subsystem_blocks_are_validated_on_first_access():
+    """
+    Verify that subsystem blocks are only validated when accessed, and that
+    the validated block is cached.
+    """
+    _, json_str, expected = LAZY_PARAMETERS[-1]
+    lazy = LazyMessage(ConfigureRequest, json.loads(json_str))
+    assert not lazy.is_decoded("csp")
+    assert not lazy.is_decoded("sdp")
+
+    csp = lazy.csp
+    assert csp == expected.csp
+    assert lazy.is_decoded("csp")
+    assert lazy.csp is csp
+    assert not lazy.is_decoded("sdp")
+
+
+def test_invalid_block_only_fails_when_accessed():
+    """
+    Verify that an invalid subsystem block does not prevent other blocks
+    from being read.
+    """
+    _, json_str, expected = LAZY_PARAMETERS[-1]
+    data = json.loads(json_str)
+    data["mccs"] = {"subarray_beams": "not a list"}
+    lazy = LazyMessage(ConfigureRequest, data)
+
+    assert lazy.csp == expected.csp
+    with pytest.raises(ValidationError):
+        _ = lazy.mccs
+    with pytest.raises(ValidationError):
+        lazy.to_model()
+
+
+def test_top_level_fields_are_validated_eagerly():
+    """
+    Verify that invalid top-level fields are rejected on construction.
+    """
+    with pytest.raises(ValidationError):
+        LazyMessage(AssignResourcesRequest, {"subarray_id": 99})
+
+
+def test_aliases_and_defaults():
+    """
+    Verify that fields can be read by name when given by alias, and that
+    absent fields return their default.
+    """
+    lazy = LazyMessage(
+        AssignResourcesRequest,
+        {"subarray_id": 1, "sdp": None, "dish_allocation": None},
+    )
+    assert lazy.subarray_id == 1
+    assert lazy.sdp_config is None
+    assert lazy.dish is None
+    assert lazy.mccs is None
+    with pytest.raises(AttributeError):
+        _ = lazy.not_a_field
+
+
+def test_lazy_message_is_read_only():
+    """
+    Verify that fields of a lazy message cannot be assigned.
+    """
+    lazy = LazyMessage(AssignResourcesRequest, {"subarray_id": 1})
+    with pytest.raises(AttributeError):
+        lazy.subarray_id = 2
+
+
+def test_blocks_given_as_json_are_validated_from_json():
+    """
+    Verify that values given as JSON text are validated from JSON, and that
+    an invalid block only fails when accessed.
+    """
+    _, json_str, expected = LAZY_PARAMETERS[-1]
+    data = {
+        key: json.dumps(value) for key, value in json.loads(json_str).items()
+    }
+    data["mccs"] = '{"subarray_beams": "not a list"}'
+
+    with patch.object(
+        FieldAdapter,
+        "validate_json",
+        autospec=True,
+        side_effect=FieldAdapter.validate_json,
+    ) as validate_json:
+        lazy = LazyMessage(ConfigureRequest, data, from_json=True)
+        assert lazy.csp == expected.csp
+
+    # each top-level field, and the csp block
+    top_level = set(data) - set(ConfigureRequest.subsystem_fields)
+    assert validate_json.call_count == len(top_level) + 1
+    with pytest.raises(ValidationError):
+        _ = lazy.mccs
+    with pytest.raises(ValidationError):
+        lazy.to_model()
+
+
+@patch("ska_tmc_cdm.schemas.codec.Codec._telmodel_validation")
+def test_codec_loads_lazy(fake_validation):
+    """
+    Verify that Codec.loads_lazy returns a lazy view of the JSON, only
+    validating it against the Telescope Model when asked to.
+    """
+    cls, json_str, expected = LAZY_PARAMETERS[0]
+
+    lazy = CODEC.loads_lazy(cls, json_str)
+
+    fake_validation.assert_not_called()
+    assert lazy.to_model() == expected
+
+    CODEC.loads_lazy(cls, json_str, validate=True, strictness=2)
+
+    fake_validation.assert_called_once_with(True, json.loads(json_str), 2)
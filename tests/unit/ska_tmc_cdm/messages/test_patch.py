@@ -0,0 +1,270 @@
+"""
+Unit tests for the ska_tmc_cdm.messages.patch module.
+"""
+import json
+from unittest.mock import patch
+
+import pytest
+from pydantic import Field, ValidationError
+
+from ska_tmc_cdm import CdmObject
+from ska_tmc_cdm.messages.central_node.common import DishAllocation
+from ska_tmc_cdm.messages.central_node.release_resources import (
+    ReleaseResourcesRequest,
+)
+from ska_tmc_cdm.messages.central_node.sdp import EBScanType, EBScanTypeBeam
+from ska_tmc_cdm.messages.patch import (
+    PatchOperation,
+    apply,
+    diff,
+    dump_patch,
+    load_patch,
+)
+from ska_tmc_cdm.messages.subarray_node.configure.core import (
+    ICRSTarget,
+    ReceiverBand,
+)
+from tests.unit.ska_tmc_cdm.messages.test_serialization import FIXTURE_OBJECTS
+from tests.unit.ska_tmc_cdm.serialisation.subarray_node.test_configure import (
+    VALID_MID_CONFIGURE_OBJECT_4_2,
+)
+
+
+def _configure_request():
+    return VALID_MID_CONFIGURE_OBJECT_4_2.model_copy(deep=True)
+
+
+@pytest.mark.parametrize("obj", FIXTURE_OBJECTS)
+def test_diff_of_equal_objects_is_empty(obj):
+    assert not diff(obj, obj.model_copy(deep=True))
+
+
+@pytest.mark.parametrize("obj", FIXTURE_OBJECTS)
+def test_patch_replaces_with_other_object(obj):
+    """
+    Verify that a patch against a fixture of the same class changes one into
+    the other, both directly and through JSON.
+    """
+    others = [
+        param.values[0]
+        for param in FIXTURE_OBJECTS
+        if type(param.values[0]) is type(obj) and param.values[0] != obj
+    ]
+    if not others:
+        pytest.skip("no other fixture of this class")
+    other = others[0]
+
+    changes = diff(obj, other)
+
+    assert apply(obj.model_copy(deep=True), changes) == other
+    assert (
+        apply(
+            obj.model_copy(deep=True),
+            load_patch(dump_patch(changes, type(obj))),
+        )
+        == other
+    )
+
+
+def test_diff_gives_paths_to_changed_values():
+    old = _configure_request()
+    new = _configure_request()
+    new.csp.common.config_id = "changed"
+    new.csp.midcbf.correlation.processing_regions[0].channel_count += 20
+    new.pointing = None
+
+    changes = diff(old, new)
+
+    assert changes == [
+        PatchOperation("remove", "/pointing"),
+        PatchOperation("replace", "/csp/common/config_id", "changed"),
+        PatchOperation(
+            "replace",
+            "/csp/midcbf/correlation/processing_regions/0/channel_count",
+            new.csp.midcbf.correlation.processing_regions[0].channel_count,
+        ),
+    ]
+    assert apply(old, changes) == new
+    assert not diff(old, new)
+
+
+def test_diff_skips_subtrees_with_equal_fingerprints():
+    old = _configure_request()
+    new = _configure_request()
+    new.csp.common.config_id = "changed"
+
+    with patch("ska_tmc_cdm.messages.patch._diff_lists") as diff_lists:
+        diff(old, new)
+
+    diff_lists.assert_not_called()
+
+
+def test_diff_reuses_fingerprints_forgotten_on_assignment():
+    """
+    Verify that diff() uses cached fingerprints rather than computing them
+    all afresh, and still sees fields assigned since they were cached.
+    """
+    old = _configure_request()
+    new = _configure_request()
+    old.fingerprint()
+    new.fingerprint()
+    new.csp.midcbf.correlation.processing_regions[0].channel_count += 20
+
+    with patch(
+        "ska_tmc_cdm.messages.patch._forget_fingerprints_within"
+    ) as forget:
+        changes = diff(old, new)
+
+    forget.assert_not_called()
+    assert [change.path for change in changes] == [
+        "/csp/midcbf/correlation/processing_regions/0/channel_count"
+    ]
+    assert apply(old, changes) == new
+
+
+def test_diff_sees_changes_made_in_place_when_told():
+    old = _configure_request()
+    new = _configure_request()
+    old.fingerprint()
+    new.fingerprint()
+    regions = new.csp.midcbf.correlation.processing_regions
+    regions.append(regions[0])
+
+    changes = diff(old, new, changed_in_place=True)
+
+    assert changes
+    assert apply(old, changes) == new
+
+
+def test_diff_replaces_fields_with_a_field_serialiser_whole():
+    old = ReleaseResourcesRequest(subarray_id=1, release_all=True)
+    new = ReleaseResourcesRequest(
+        subarray_id=1, dish=DishAllocation(receptor_ids=["SKA002", "SKA001"])
+    )
+    newer = ReleaseResourcesRequest(
+        subarray_id=1, dish=DishAllocation(receptor_ids=["SKA003"])
+    )
+
+    for before, after in ((old, new), (new, newer)):
+        patch_json = dump_patch(diff(before, after), ReleaseResourcesRequest)
+
+        assert {
+            "op": "add" if before.dish is None else "replace",
+            "path": "/receptor_ids",
+            "value": sorted(after.dish.receptor_ids),
+        } in json.loads(patch_json)
+        assert (
+            apply(before.model_copy(deep=True), load_patch(patch_json))
+            == after
+        )
+
+
+def test_diff_of_list_items():
+    old = _configure_request()
+    new = _configure_request()
+    regions = new.csp.midcbf.correlation.processing_regions
+    path = "/csp/midcbf/correlation/processing_regions"
+
+    new.csp.midcbf.correlation.processing_regions = regions + [regions[0]]
+    assert diff(old, new) == [PatchOperation("add", f"{path}/-", regions[0])]
+    assert apply(_configure_request(), diff(old, new)) == new
+
+    new.csp.midcbf.correlation.processing_regions = []
+    assert diff(old, new) == [PatchOperation("replace", path, [])]
+    assert apply(_configure_request(), diff(old, new)) == new
+
+
+def test_diff_of_dict_entries():
+    beam = EBScanTypeBeam(field_id="field_a")
+    old = EBScanType(scan_type_id="science", beams={"vis0": beam})
+    new = EBScanType(
+        scan_type_id="science",
+        beams={
+            "vis0": EBScanTypeBeam(field_id="field_b"),
+            "pss~1/a": beam,
+        },
+    )
+
+    changes = diff(old, new)
+
+    assert changes == [
+        PatchOperation("replace", "/beams/vis0/field_id", "field_b"),
+        PatchOperation("add", "/beams/pss~01~1a", beam),
+    ]
+    assert apply(old.model_copy(deep=True), changes) == new
+    assert apply(new, [PatchOperation("remove", "/beams/pss~01~1a")]) == (
+        EBScanType(
+            scan_type_id="science",
+            beams={"vis0": EBScanTypeBeam(field_id="field_b")},
+        )
+    )
+
+
+class _Channels(CdmObject):
+    widths: dict[int, int] = Field(default_factory=dict)
+
+
+def test_patch_of_dict_with_int_keys():
+    """
+    Verify that entries of a dict whose keys are ints are found by the
+    string form of their key, both directly and through JSON.
+    """
+    old = _Channels(widths={1: 10, 2: 20})
+    new = _Channels(widths={1: 10, 2: 25})
+
+    changes = diff(old, new)
+
+    assert changes == [PatchOperation("replace", "/widths/2", 25)]
+    assert apply(old.model_copy(deep=True), changes) == new
+    assert (
+        apply(old, load_patch(dump_patch(changes, _Channels))).widths
+        == new.widths
+    )
+    assert apply(new, [PatchOperation("remove", "/widths/1")]) == _Channels(
+        widths={2: 25}
+    )
+
+
+def test_diff_allows_for_tolerant_equality():
+    old = ICRSTarget(ra="12:00:00", dec="-30:00:00")
+
+    assert not diff(old, ICRSTarget(ra=12.0, dec=-30.0))
+    assert diff(old, ICRSTarget(ra=12.5, dec=-30.0))
+
+
+def test_apply_validates_values():
+    request = _configure_request()
+
+    apply(
+        request,
+        load_patch(
+            '[{"op": "replace", "path": "/csp/common/frequency_band",'
+            ' "value": "2"}]'
+        ),
+    )
+    assert request.csp.common.frequency_band == ReceiverBand.BAND_2
+    with pytest.raises(ValidationError):
+        apply(
+            request,
+            [PatchOperation("replace", "/csp/common/subarray_id", "one")],
+        )
+
+
+def test_patch_errors():
+    request = _configure_request()
+
+    with pytest.raises(TypeError):
+        diff(request, request.csp)
+    with pytest.raises(ValueError):
+        apply(request, [PatchOperation("replace", "/csp/missing", 1)])
+    with pytest.raises(ValueError):
+        apply(
+            request,
+            [
+                PatchOperation(
+                    "remove", "/csp/midcbf/correlation/processing_regions/9"
+                )
+            ],
+        )
+    with pytest.raises(ValueError):
+        load_patch('[{"op": "move", "from": "/a", "path": "/b"}]')
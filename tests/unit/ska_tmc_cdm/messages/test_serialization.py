@@ -0,0 +1,111 @@
+"""
+Unit tests for the ska_tmc_cdm.messages.serialization module.
+"""
+import importlib
+import json
+import pkgutil
+from datetime import datetime, timezone
+from typing import Optional
+
+import pytest
+from pydantic import Field
+
+from ska_tmc_cdm import CdmObject
+from ska_tmc_cdm.messages.serialization import dump_json, dump_jsonable
+from ska_tmc_cdm.schemas import CODEC
+from tests.unit.ska_tmc_cdm import serialisation
+from tests.unit.ska_tmc_cdm.messages.test_base import FIELD_CASES
+
+
+def fixture_objects() -> list:
+    """
+    Return a pytest param for every CDM object defined at the top level of
+    the serialisation test modules.
+    """
+    params = []
+    for module_info in pkgutil.walk_packages(
+        serialisation.__path__, serialisation.__name__ + "."
+    ):
+        module = importlib.import_module(module_info.name)
+        for name, value in vars(module).items():
+            if isinstance(value, CdmObject):
+                params.append(
+                    pytest.param(value, id=f"{module_info.name}.{name}")
+                )
+    return params
+
+
+FIXTURE_OBJECTS = fixture_objects()
+
+
+@pytest.mark.parametrize("obj", FIXTURE_OBJECTS)
+def test_dump_json_matches_model_dump_json(obj):
+    """
+    Verify that the fast path gives byte-for-byte the same JSON as the wrap
+    serializer for every fixture object.
+    """
+    expected = obj.model_dump_json(exclude_none=True, by_alias=True)
+    assert dump_json(obj) == expected.encode("utf-8")
+    assert dump_json(obj, indent=2) == obj.model_dump_json(
+        indent=2, exclude_none=True, by_alias=True
+    ).encode("utf-8")
+
+
+@pytest.mark.parametrize("obj", FIXTURE_OBJECTS)
+def test_dump_jsonable_matches_model_dump(obj):
+    assert dump_jsonable(obj) == obj.model_dump(
+        mode="json", exclude_none=True, by_alias=True
+    )
+
+
+@pytest.mark.parametrize(("obj", "_"), FIELD_CASES)
+def test_dump_json_omits_default_empty_values(obj, _):
+    """
+    Verify that the fast path applies the same omission rules as
+    CdmObject._exclude_default_nulls_and_empty.
+    """
+    assert dump_jsonable(obj) == obj.model_dump(mode="json", exclude_none=True)
+
+
+class Leaf(CdmObject):
+    values: list[int] = Field(default_factory=list)
+    when: Optional[datetime] = None
+
+
+class Branch(CdmObject):
+    leaf: Leaf = Field(default_factory=Leaf)
+    leaves: list[Leaf] = Field(default_factory=list)
+    by_name: dict[str, Leaf] = Field(default_factory=dict)
+    children: list["Branch"] = Field(default_factory=list)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        Branch(),
+        Branch(leaf=Leaf(values=[1])),
+        Branch(leaves=[Leaf(), Leaf(values=[1])]),
+        Branch(
+            by_name={"a": Leaf(), "b": Leaf(when=datetime.now(timezone.utc))}
+        ),
+        Branch(children=[Branch(leaves=[Leaf()]), Branch(leaf=Leaf())]),
+    ],
+)
+def test_nested_default_empty_values(obj):
+    """
+    Verify that default empty values are omitted at every depth, including
+    inside lists, dicts and recursive models.
+    """
+    assert dump_json(obj) == obj.model_dump_json(
+        exclude_none=True, by_alias=True
+    ).encode("utf-8")
+
+
+@pytest.mark.parametrize("obj", FIXTURE_OBJECTS[:20])
+def test_codec_dumps_native(obj):
+    """
+    Verify that Codec.dumps with native=True gives the same content as the
+    default path.
+    """
+    native = CODEC.dumps(obj, validate=False, native=True)
+    assert json.loads(native) == json.loads(CODEC.dumps(obj, validate=False))
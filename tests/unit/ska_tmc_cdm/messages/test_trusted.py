@@ -0,0 +1,103 @@
+"""
+Unit tests for the ska_tmc_cdm.messages.trusted module.
+"""
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from ska_tmc_cdm.exceptions import UntrustedInput
+from ska_tmc_cdm.messages.subarray_node.configure.tmc import TMCConfiguration
+from ska_tmc_cdm.messages.trusted import KEY_ENV_VAR, load_trusted, seal
+from ska_tmc_cdm.schemas import CODEC
+from tests.unit.ska_tmc_cdm.messages.test_serialization import FIXTURE_OBJECTS
+
+
+@pytest.fixture(autouse=True)
+def trusted_input_key(monkeypatch):
+    monkeypatch.setenv(KEY_ENV_VAR, "test key")
+
+
+@pytest.mark.parametrize("obj", FIXTURE_OBJECTS)
+def test_load_trusted_matches_validated_load(obj):
+    """
+    Verify that trusted loading of a dumped object builds the same object,
+    with the same fields set, as normal validation.
+    """
+    json_str = CODEC.dumps(obj, validate=False)
+    try:
+        expected = type(obj).model_validate_json(json_str)
+    except ValidationError:
+        pytest.skip("fixture does not round trip")
+
+    loaded = load_trusted(type(obj), json_str, seal(json_str))
+
+    assert type(loaded) is type(expected)
+    assert loaded == expected
+    assert loaded.model_fields_set == expected.model_fields_set
+
+
+def test_load_trusted_skips_after_validators():
+    """
+    Verify that after-mode validators are not run on trusted input.
+    """
+    json_str = '{"partial_configuration": false}'
+    with pytest.raises(ValidationError):
+        TMCConfiguration.model_validate_json(json_str)
+
+    loaded = load_trusted(TMCConfiguration, json_str, seal(json_str))
+
+    assert loaded.scan_duration is None
+
+
+def test_load_trusted_rejects_bad_seal():
+    """
+    Verify that JSON is only loaded if its seal matches.
+    """
+    json_str = '{"partial_configuration": true}'
+    json_seal = seal(json_str)
+
+    with pytest.raises(UntrustedInput):
+        load_trusted(
+            TMCConfiguration, json_str.replace("true", "false"), json_seal
+        )
+    with pytest.raises(UntrustedInput):
+        load_trusted(TMCConfiguration, json_str, "0" * len(json_seal))
+    assert load_trusted(TMCConfiguration, json_str.encode(), json_seal)
+
+
+def test_load_trusted_requires_key(monkeypatch):
+    """
+    Verify that the trusted path is unavailable without a key.
+    """
+    json_str = '{"partial_configuration": true}'
+    json_seal = seal(json_str)
+    monkeypatch.delenv(KEY_ENV_VAR)
+
+    with pytest.raises(UntrustedInput, match=KEY_ENV_VAR):
+        seal(json_str)
+    with pytest.raises(UntrustedInput):
+        load_trusted(TMCConfiguration, json_str, json_seal)
+
+
+def test_seal_depends_on_key(monkeypatch):
+    json_str = '{"partial_configuration": true}'
+    json_seal = seal(json_str)
+    monkeypatch.setenv(KEY_ENV_VAR, "another key")
+
+    assert seal(json_str) != json_seal
+
+
+@patch("ska_tmc_cdm.schemas.codec.Codec._telmodel_validation")
+def test_codec_loads_trusted(fake_validation):
+    """
+    Verify that Codec.loads with a seal loads without any validation.
+    """
+    obj = FIXTURE_OBJECTS[0].values[0]
+    json_str = CODEC.dumps(obj, validate=False)
+    fake_validation.reset_mock()
+
+    loaded = CODEC.loads(type(obj), json_str, trusted=seal(json_str))
+
+    assert loaded == obj
+    fake_validation.assert_not_called()
@@ -0,0 +1,88 @@
+"""
+Unit tests for the ska_tmc_cdm.messages.views module.
+"""
+import json
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from ska_tmc_cdm.messages.frozen import freeze, frozen_class
+from ska_tmc_cdm.messages.subarray_node.configure import ConfigureRequest
+from ska_tmc_cdm.messages.subarray_node.configure.csp import (
+    ProcessingRegionConfiguration,
+)
+from ska_tmc_cdm.messages.views import CdmView, load_view, view, view_class
+from tests.unit.ska_tmc_cdm.messages.test_serialization import FIXTURE_OBJECTS
+from tests.unit.ska_tmc_cdm.serialisation.subarray_node.test_configure import (
+    VALID_MID_CONFIGURE_JSON_4_2,
+    VALID_MID_CONFIGURE_OBJECT_4_2,
+)
+
+
+@pytest.mark.parametrize("obj", FIXTURE_OBJECTS)
+def test_view_round_trips(obj):
+    restored = view(obj).to_model()
+
+    assert type(restored) is type(obj)
+    assert restored == obj
+    assert restored.model_fields_set == obj.model_fields_set
+    assert restored.model_dump_json() == obj.model_dump_json()
+
+
+def test_view_fields_are_attributes():
+    request = view(VALID_MID_CONFIGURE_OBJECT_4_2)
+    region = request.csp.midcbf.correlation.processing_regions[0]
+    original = VALID_MID_CONFIGURE_OBJECT_4_2.csp.midcbf.correlation
+
+    assert isinstance(region, view_class(ProcessingRegionConfiguration))
+    assert region.receptors == tuple(original.processing_regions[0].receptors)
+    assert request.csp.common.frequency_band == (
+        VALID_MID_CONFIGURE_OBJECT_4_2.csp.common.frequency_band
+    )
+    assert request.model_fields_set == (
+        VALID_MID_CONFIGURE_OBJECT_4_2.model_fields_set
+    )
+    assert not hasattr(region, "__dict__")
+
+
+def test_view_is_read_only():
+    request = view(VALID_MID_CONFIGURE_OBJECT_4_2)
+
+    with pytest.raises(AttributeError):
+        request.interface = "changed"
+    with pytest.raises(AttributeError):
+        request.csp.new_field = 1
+    with pytest.raises(AttributeError):
+        del request.csp
+
+
+def test_frozen_objects_share_view_class():
+    frozen = freeze(VALID_MID_CONFIGURE_OBJECT_4_2)
+
+    assert view_class(frozen_class(ConfigureRequest)) is view_class(
+        ConfigureRequest
+    )
+    assert view(frozen) == view(VALID_MID_CONFIGURE_OBJECT_4_2)
+    assert view(frozen).to_model() == VALID_MID_CONFIGURE_OBJECT_4_2
+
+
+def test_view_pickles():
+    request = view(VALID_MID_CONFIGURE_OBJECT_4_2)
+    restored = pickle.loads(pickle.dumps(request))
+
+    assert restored == request
+    assert hash(restored) == hash(request)
+    assert restored.to_model() == VALID_MID_CONFIGURE_OBJECT_4_2
+
+
+def test_load_view():
+    json_data = json.dumps(VALID_MID_CONFIGURE_JSON_4_2)
+    request = load_view(ConfigureRequest, json_data)
+
+    assert isinstance(request, CdmView)
+    assert request.to_model() == ConfigureRequest.model_validate_json(
+        json_data
+    )
+    with pytest.raises(ValidationError):
+        load_view(ConfigureRequest, '{"tmc": {"scan_duration": "x"}}')
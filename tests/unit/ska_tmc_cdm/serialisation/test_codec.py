@@ -2,7 +2,9 @@
 Unit tests for the ska_tmc_cdm.schemas.codec module.
 """
 import json
+import pickle
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import nullcontext as does_not_raise
 from unittest.mock import patch
 
@@ -12,13 +14,16 @@ from ska_ost_osd.telvalidation.semantic_validator import (
 )
 
 from ska_tmc_cdm.exceptions import JsonValidationError, SchemaNotFound
+from ska_tmc_cdm.messages.base import _is_exact
 from ska_tmc_cdm.messages.central_node.assign_resources import (
     AssignResourcesRequest,
 )
 from ska_tmc_cdm.messages.central_node.release_resources import (
     ReleaseResourcesRequest,
 )
+from ska_tmc_cdm.messages.frozen import FrozenCdmObject, freeze, frozen_class
 from ska_tmc_cdm.messages.subarray_node.configure import ConfigureRequest
+from ska_tmc_cdm.messages.subarray_node.configure.core import FK5Target
 from ska_tmc_cdm.schemas import CODEC
 from tests.unit.ska_tmc_cdm.serialisation.central_node.test_assign_resources import (
     INVALID_LOW_ASSIGNRESOURCESREQUEST_JSON,
@@ -219,6 +224,82 @@ def test_codec_loads(msg_cls, json_str, expected, is_validate):
     assert unmarshalled == expected
 
 
+@pytest.mark.parametrize(
+    "msg_cls,json_str,expected, is_validate", TEST_PARAMETERS
+)
+def test_codec_loads_single_parse(msg_cls, json_str, expected, is_validate):
+    """
+    Verify that the codec unmarshalls objects correctly when the input is
+    parsed once and shared between validators.
+    """
+    unmarshalled = CODEC.loads(
+        msg_cls, json_str, validate=is_validate, single_parse=True
+    )
+    assert unmarshalled == expected
+
+
+@pytest.mark.parametrize(
+    "msg_cls,json_str,expected, is_validate", TEST_PARAMETERS
+)
+def test_codec_loads_intern(msg_cls, json_str, expected, is_validate):
+    """
+    Verify that interning leaves the unmarshalled objects unchanged, and
+    shares frozen sub-objects between them.
+    """
+    unmarshalled = CODEC.loads(
+        msg_cls, json_str, validate=is_validate, intern=True
+    )
+    frozen = CODEC.loads(
+        frozen_class(msg_cls), json_str, validate=is_validate, intern=True
+    )
+    again = CODEC.loads(
+        frozen_class(msg_cls), json_str, validate=is_validate, intern=True
+    )
+
+    assert unmarshalled == expected
+    assert frozen == freeze(expected)
+    assert all(
+        value is not None and getattr(again, name) is value
+        for name, value in vars(frozen).items()
+        # objects whose equality allows a tolerance are never shared
+        if isinstance(value, FrozenCdmObject) and _is_exact(type(value))
+    )
+
+
+@patch("ska_tmc_cdm.schemas.codec.validate_json")
+def test_codec_loads_single_parse_validates_input(fake_validate_json):
+    """
+    Verify that single_parse validates the parsed input without parsing it
+    a second time or dumping the newly created object.
+    """
+    cls, json_str, _, _ = TEST_PARAMETERS[1]
+    with patch.object(cls, "model_dump") as fake_model_dump, patch.object(
+        cls, "model_validate_json"
+    ) as fake_model_validate_json:
+        CODEC.loads(cls, json_str, single_parse=True)
+
+    fake_model_dump.assert_not_called()
+    fake_model_validate_json.assert_not_called()
+    fake_validate_json.assert_called_once()
+    assert fake_validate_json.call_args.args[0] == json.loads(json_str)
+
+
+@patch("ska_tmc_cdm.schemas.codec.validate_json")
+def test_codec_loads_single_parse_without_interface(fake_validate_json):
+    """
+    Verify that single_parse validates JSON that declares no interface
+    against the interface of the new object, as the default path does.
+    """
+    cls, json_str, _, _ = TEST_PARAMETERS[1]
+    parsed = json.loads(json_str)
+    del parsed["interface"]
+
+    obj = CODEC.loads(cls, json.dumps(parsed), single_parse=True)
+
+    fake_validate_json.assert_called_once()
+    assert fake_validate_json.call_args.args[0]["interface"] == obj.interface
+
+
 @pytest.mark.parametrize(
     "msg_cls,expected,instance, is_validate", TEST_PARAMETERS
 )
@@ -364,3 +445,103 @@ def test_loads_invalid_json_with_validation_disabled(strictness):
     )
     marshalled = CODEC.dumps(unmarshalled, validate=False)
     assert_json_is_equal(INVALID_LOW_CONFIGURE_JSON, marshalled)
+
+
+@pytest.mark.parametrize(
+    "executor_cls", [None, ThreadPoolExecutor, ProcessPoolExecutor]
+)
+@pytest.mark.parametrize("chunksize", [1, 3])
+def test_codec_loads_many(executor_cls, chunksize):
+    """
+    Verify that loads_many returns results in input order and reports
+    per-item errors without aborting the batch.
+    """
+    json_items = [VALID_LOW_CONFIGURE_JSON] * 4
+    json_items[2] = "{not json"
+
+    if executor_cls is None:
+        results = CODEC.loads_many(
+            ConfigureRequest, json_items, validate=False, chunksize=chunksize
+        )
+    else:
+        with executor_cls(max_workers=2) as executor:
+            results = CODEC.loads_many(
+                ConfigureRequest,
+                json_items,
+                validate=False,
+                executor=executor,
+                chunksize=chunksize,
+            )
+
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert [r.ok for r in results] == [True, True, False, True]
+    assert results[2].value is None
+    assert isinstance(results[2].error, ValueError)
+    for result in (results[0], results[1], results[3]):
+        assert result.value == VALID_LOW_CONFIGURE_OBJECT
+
+
+@pytest.mark.parametrize("executor_cls", [None, ThreadPoolExecutor])
+def test_codec_dumps_many(executor_cls):
+    """
+    Verify that dumps_many returns JSON for each instance, in order.
+    """
+    objs = [VALID_LOW_CONFIGURE_OBJECT, VALID_MID_FULL_RELEASE_OBJECT] * 2
+    executor = executor_cls(max_workers=2) if executor_cls else None
+    results = CODEC.dumps_many(
+        objs, validate=False, executor=executor, chunksize=3
+    )
+    if executor:
+        executor.shutdown()
+
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    for result, expected in zip(
+        results, [VALID_LOW_CONFIGURE_JSON, VALID_MID_FULL_RELEASE_JSON] * 2
+    ):
+        assert result.ok
+        assert_json_is_equal(result.value, expected)
+
+
+def test_codec_dumps_many_converts_targets_together():
+    """
+    Verify that dumps_many converts legacy targets together, giving the
+    JSON of converting them one at a time.
+    """
+    objs = [
+        ConfigureRequest.model_validate_json(VALID_MID_CONFIGURE_JSON_2_3)
+        for _ in range(3)
+    ]
+    for obj, ra in zip(objs, ("01:00:00", "02:00:00", "03:00:00")):
+        obj.pointing.target = FK5Target(ra=ra, dec="-30:00:00")
+    expected = [CODEC.dumps(obj.model_copy(deep=True)) for obj in objs]
+
+    results = CODEC.dumps_many(objs)
+
+    assert [result.value for result in results] == expected
+    assert all(obj.pointing.target._derived.icrs_hmsdms for obj in objs)
+
+
+def test_codec_loads_many_rejects_invalid_chunksize():
+    """
+    Verify that chunksize must be positive.
+    """
+    with pytest.raises(ValueError):
+        CODEC.loads_many(ConfigureRequest, [], chunksize=0)
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        JsonValidationError(ValueError("bad"), "uri", {"a": 1}),
+        SchemaNotFound("uri"),
+    ],
+)
+def test_validation_errors_can_be_pickled(exc):
+    """
+    Verify that validation errors survive being returned from a worker
+    process.
+    """
+    unpickled = pickle.loads(pickle.dumps(exc))
+    assert type(unpickled) is type(exc)
+    assert str(unpickled) == str(exc)
+    assert unpickled.uri == exc.uri
@@ -0,0 +1,118 @@
+"""
+Unit tests for NDJSON streaming in the ska_tmc_cdm.schemas.codec module.
+"""
+import io
+import json
+
+import pytest
+
+from ska_tmc_cdm.messages.subarray_node.configure import ConfigureRequest
+from ska_tmc_cdm.schemas import CODEC
+from tests.unit.ska_tmc_cdm.serialisation.subarray_node.test_configure import (
+    VALID_LOW_CONFIGURE_JSON,
+    VALID_LOW_CONFIGURE_OBJECT,
+)
+
+COMPACT_JSON = json.dumps(json.loads(VALID_LOW_CONFIGURE_JSON))
+
+
+def ndjson_stream(*lines: str) -> io.BytesIO:
+    return io.BytesIO("".join(f"{line}\n" for line in lines).encode())
+
+
+def test_iter_load_yields_one_result_per_line():
+    """
+    Verify that iter_load yields an object for each non-blank line and
+    reports bad lines without stopping.
+    """
+    stream = ndjson_stream(COMPACT_JSON, "", "{not json", COMPACT_JSON)
+
+    results = list(CODEC.iter_load(ConfigureRequest, stream, validate=False))
+
+    assert [r.line for r in results] == [1, 3, 4]
+    assert [r.ok for r in results] == [True, False, True]
+    assert isinstance(results[1].error, ValueError)
+    assert results[0].value == VALID_LOW_CONFIGURE_OBJECT
+    assert results[2].value == VALID_LOW_CONFIGURE_OBJECT
+
+
+def test_iter_load_is_lazy():
+    """
+    Verify that iter_load only reads as far as the caller consumes.
+    """
+    stream = ndjson_stream(COMPACT_JSON, "{not json")
+    results = CODEC.iter_load(ConfigureRequest, stream, validate=False)
+
+    first = next(results)
+    assert first.ok
+    assert first.offset == 0
+    assert first.end_offset == len(COMPACT_JSON) + 1
+
+
+def test_iter_load_resumes_from_offset(tmp_path):
+    """
+    Verify that reading can be resumed from the end offset of the last
+    processed line.
+    """
+    path = tmp_path / "log.ndjson"
+    path.write_bytes(ndjson_stream("{not json", COMPACT_JSON).getvalue())
+
+    first = next(CODEC.iter_load(ConfigureRequest, path, validate=False))
+    assert not first.ok
+
+    resumed = list(
+        CODEC.iter_load(
+            ConfigureRequest, path, validate=False, offset=first.end_offset
+        )
+    )
+    assert len(resumed) == 1
+    assert resumed[0].offset == first.end_offset
+    assert resumed[0].value == VALID_LOW_CONFIGURE_OBJECT
+
+
+def test_dump_ndjson_round_trip(tmp_path):
+    """
+    Verify that objects written with dump_ndjson are read back by
+    iter_load, and that appending extends the file.
+    """
+    path = tmp_path / "log.ndjson"
+
+    assert not CODEC.dump_ndjson([VALID_LOW_CONFIGURE_OBJECT] * 2, path)
+    assert not CODEC.dump_ndjson(
+        [VALID_LOW_CONFIGURE_OBJECT], path, append=True
+    )
+
+    results = list(CODEC.iter_load(ConfigureRequest, path))
+    assert len(results) == 3
+    assert all(r.value == VALID_LOW_CONFIGURE_OBJECT for r in results)
+
+
+def test_dump_ndjson_reports_failures():
+    """
+    Verify that instances which cannot be serialised are reported and
+    skipped.
+    """
+    stream = io.BytesIO()
+    failures = CODEC.dump_ndjson(
+        [VALID_LOW_CONFIGURE_OBJECT, object(), VALID_LOW_CONFIGURE_OBJECT],
+        stream,
+        validate=False,
+    )
+
+    assert [f.index for f in failures] == [1]
+    assert stream.getvalue().count(b"\n") == 2
+
+
+@pytest.mark.parametrize("offset", [0, len(COMPACT_JSON) + 1])
+def test_iter_load_accepts_stream_with_offset(offset):
+    """
+    Verify that offsets are also honoured for caller-supplied streams.
+    """
+    stream = ndjson_stream(COMPACT_JSON, COMPACT_JSON)
+    results = list(
+        CODEC.iter_load(
+            ConfigureRequest, stream, validate=False, offset=offset
+        )
+    )
+    assert len(results) == 2 - bool(offset)
+    assert results[0].offset == offset
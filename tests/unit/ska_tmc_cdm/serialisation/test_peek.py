@@ -0,0 +1,85 @@
+"""
+Unit tests for the ska_tmc_cdm.schemas.peek module.
+"""
+import json
+
+import pytest
+
+from ska_tmc_cdm.schemas.peek import MessageHeader, _scan, peek, peek_header
+from tests.unit.ska_tmc_cdm.serialisation.test_codec import TEST_PARAMETERS
+
+
+@pytest.mark.parametrize("_,json_str,__,___", TEST_PARAMETERS)
+def test_peek_header_matches_full_decode(_, json_str, __, ___):
+    """
+    Verify that peek_header extracts the same top-level values as a full
+    JSON decode, for str and bytes input.
+    """
+    decoded = json.loads(json_str)
+    expected = MessageHeader(
+        **{k: v for k, v in decoded.items() if k in MessageHeader._fields}
+    )
+    assert peek_header(json_str) == expected
+    assert peek_header(json_str.encode()) == expected
+
+
+def test_peek_ignores_nested_keys_and_string_contents():
+    """
+    Verify that only top-level keys are matched, and that brackets, quotes
+    and key-like text inside strings are not treated as structure.
+    """
+    json_str = json.dumps(
+        {
+            "sdp": {"interface": "nested", "scan_id": 99},
+            "note": 'tricky "}]{[" text, "scan_id": 5',
+            "list": [{"interface": "nested"}, ["scan_id"]],
+            "scan_id": 3,
+            "interface": "top",
+        }
+    )
+    assert peek(json_str, ["interface", "scan_id", "missing"]) == {
+        "interface": "top",
+        "scan_id": 3,
+    }
+
+
+def test_peek_reads_bytes_at_byte_offsets():
+    """
+    Verify that values are found in bytes at byte offsets, and decoded as
+    UTF-8, when the JSON is not ASCII.
+    """
+    data = {
+        "note": 'Ørsted }] \\" ü',
+        "sdp": {"a": ["é", {"b": "[{"}]},
+        "scan_id": 3,
+        "interface": "tÿpe",
+    }
+    json_bytes = json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+    assert peek(json_bytes, ["sdp", "scan_id", "interface"]) == {
+        key: data[key] for key in ("sdp", "scan_id", "interface")
+    }
+    for key, value, start, end in _scan(json_bytes, ["sdp", "note"]):
+        assert json.loads(json_bytes[start:end]) == value == data[key]
+
+
+def test_peek_returns_first_of_repeated_keys():
+    """
+    Verify that peek returns the first value of a repeated key, as it
+    documents, and that _scan with last=True yields every occurrence.
+    """
+    json_str = '{"scan_id": 1, "sdp": {"scan_id": 2}, "scan_id": 3}'
+
+    assert peek(json_str, ["scan_id"]) == {"scan_id": 1}
+    assert [
+        value for _, value, _, _ in _scan(json_str, ["scan_id"], last=True)
+    ] == [1, 3]
+
+
+@pytest.mark.parametrize("json_str", ["[1, 2]", '"interface"', ""])
+def test_peek_rejects_non_objects(json_str):
+    """
+    Verify that JSON that is not an object is rejected.
+    """
+    with pytest.raises(ValueError):
+        peek(json_str, ["interface"])
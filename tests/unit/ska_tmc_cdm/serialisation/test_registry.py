@@ -0,0 +1,103 @@
+"""
+Unit tests for the ska_tmc_cdm.schemas.registry module.
+"""
+import io
+import json
+
+import pytest
+
+from ska_tmc_cdm.exceptions import UnknownInterface
+from ska_tmc_cdm.messages.central_node.release_resources import (
+    ReleaseResourcesRequest,
+)
+from ska_tmc_cdm.messages.subarray_node.configure import ConfigureRequest
+from ska_tmc_cdm.schemas import CODEC
+from ska_tmc_cdm.schemas.registry import (
+    INTERFACE_REGISTRY,
+    InterfaceRegistry,
+    split_interface,
+)
+from tests.unit.ska_tmc_cdm.serialisation.central_node.test_release_resources import (
+    VALID_MID_FULL_RELEASE_JSON,
+    VALID_MID_FULL_RELEASE_OBJECT,
+)
+from tests.unit.ska_tmc_cdm.serialisation.subarray_node.test_configure import (
+    VALID_LOW_CONFIGURE_JSON,
+    VALID_LOW_CONFIGURE_OBJECT,
+)
+from tests.unit.ska_tmc_cdm.serialisation.test_codec import TEST_PARAMETERS
+
+
+def test_split_interface():
+    """
+    Verify that interface URIs are split into family and version.
+    """
+    assert split_interface(
+        "https://schema.skao.int/ska-tmc-configure/4.2"
+    ) == ("ska-tmc-configure", "4.2")
+    assert split_interface(
+        "https://schema.skatelescope.org/ska-low-mccs-scan/1.0/"
+    ) == ("ska-low-mccs-scan", "1.0")
+
+
+@pytest.mark.parametrize("msg_cls,json_str,expected,_", TEST_PARAMETERS)
+def test_registry_covers_codec_fixtures(msg_cls, json_str, expected, _):
+    """
+    Verify that loads_any decodes each fixture as the expected class.
+    """
+    assert INTERFACE_REGISTRY[json.loads(json_str)["interface"]] is msg_cls
+    assert CODEC.loads_any(json_str, validate=False) == expected
+
+
+def test_registry_prefers_version_specific_registration():
+    """
+    Verify that a class registered for a full URI overrides the class
+    registered for its family.
+    """
+    registry = InterfaceRegistry()
+    registry.register("ska-tmc-configure", ConfigureRequest)
+    registry.register(
+        "https://schema.skao.int/ska-tmc-configure/1.0",
+        ReleaseResourcesRequest,
+    )
+
+    assert (
+        registry["https://schema.skao.int/ska-tmc-configure/1.0"]
+        is ReleaseResourcesRequest
+    )
+    assert (
+        registry["https://schema.skao.int/ska-tmc-configure/4.2"]
+        is ConfigureRequest
+    )
+    assert list(registry.families()) == ["ska-tmc-configure"]
+
+
+@pytest.mark.parametrize(
+    "json_str", ['{"interface": "https://foo.com/badschema/1.0"}', "{}"]
+)
+def test_loads_any_raises_for_unknown_interface(json_str):
+    """
+    Verify that loads_any raises UnknownInterface if the interface is
+    missing or not registered.
+    """
+    with pytest.raises(UnknownInterface):
+        CODEC.loads_any(json_str)
+    assert json.loads(json_str).get("interface") not in INTERFACE_REGISTRY
+
+
+def test_iter_load_dispatches_with_registry():
+    """
+    Verify that iter_load decodes mixed message streams given a registry.
+    """
+    lines = [
+        json.dumps(json.loads(VALID_LOW_CONFIGURE_JSON)),
+        json.dumps(json.loads(VALID_MID_FULL_RELEASE_JSON)),
+    ]
+    stream = io.BytesIO("\n".join(lines).encode())
+
+    results = list(CODEC.iter_load(INTERFACE_REGISTRY, stream, validate=False))
+
+    assert [r.value for r in results] == [
+        VALID_LOW_CONFIGURE_OBJECT,
+        VALID_MID_FULL_RELEASE_OBJECT,
+    ]
@@ -0,0 +1,191 @@
+"""
+Unit tests for the ska_tmc_cdm.schemas.splitter module.
+"""
+import json
+from unittest.mock import call, patch
+
+import pytest
+from pydantic import ValidationError
+
+from ska_tmc_cdm.exceptions import UnknownInterface
+from ska_tmc_cdm.messages.central_node.assign_resources import (
+    AssignResourcesRequest,
+)
+from ska_tmc_cdm.messages.lazy import field_adapter
+from ska_tmc_cdm.messages.subarray_node.configure import ConfigureRequest
+from ska_tmc_cdm.schemas import CODEC
+from ska_tmc_cdm.schemas.splitter import split_subsystems
+from tests.unit.ska_tmc_cdm.serialisation.test_codec import TEST_PARAMETERS
+
+# Requests with subsystem blocks to split
+SPLIT_PARAMETERS = [
+    (cls, json_str, obj)
+    for cls, json_str, obj, _ in TEST_PARAMETERS
+    if cls.subsystem_fields
+]
+
+
+@pytest.mark.parametrize("cls,json_str,expected", SPLIT_PARAMETERS)
+def test_split_returns_each_subsystem_block(cls, json_str, expected):
+    """
+    Verify that each subsystem block is sliced out of the request unchanged
+    and decodes to the same value as the full request.
+    """
+    parsed = json.loads(json_str)
+
+    parts = split_subsystems(json_str, cls)
+
+    assert parts
+    for key, part in parts.items():
+        assert json.loads(part.json) == parsed[key] == part.value
+        assert part.json in json_str
+        assert field_adapter(cls, part.field).validate_json(
+            part.json
+        ) == getattr(expected, part.field)
+    dumped = expected.model_dump(mode="json", by_alias=True)
+    assert set(parts) == {
+        cls.model_fields[name].serialization_alias or name
+        for name in cls.subsystem_fields
+        if dumped.get(cls.model_fields[name].serialization_alias or name)
+        is not None
+    }
+
+
+@pytest.mark.parametrize("cls,json_str,_", SPLIT_PARAMETERS)
+def test_split_parts_validate_as_full_loads(cls, json_str, _):
+    """
+    Verify that each part Codec.split validates gives the value of the
+    matching field of the request decoded by Codec.loads.
+    """
+    expected = CODEC.loads(cls, json_str, validate=False)
+
+    for part in CODEC.split(json_str, cls, validate=False).values():
+        assert field_adapter(cls, part.field).validate_json(
+            part.json
+        ) == getattr(expected, part.field)
+
+
+def test_split_looks_up_class_and_preserves_bytes():
+    """
+    Verify that the request class is found from its interface and that
+    bytes input gives memoryview slices of the input.
+    """
+    cls, json_str, expected = SPLIT_PARAMETERS[0]
+    json_bytes = json_str.encode("utf-8")
+
+    parts = split_subsystems(json_bytes)
+
+    assert parts == split_subsystems(json_bytes, cls)
+    sdp = parts["sdp"]
+    assert isinstance(sdp.json, memoryview)
+    assert sdp.json.obj is json_bytes
+    assert bytes(sdp.json) == split_subsystems(json_str)["sdp"].json.encode()
+    assert sdp.field == "sdp_config"
+    assert sdp.interface == expected.sdp_config.interface
+
+
+def test_split_ignores_nested_and_null_blocks():
+    """
+    Verify that keys nested inside other blocks, and null blocks, are not
+    returned.
+    """
+    json_str = json.dumps(
+        {
+            "interface": "https://schema.skao.int/ska-tmc-configure/4.2",
+            "tmc": {"csp": {"not": "this"}},
+            "sdp": None,
+        }
+    )
+    parts = split_subsystems(json_str)
+
+    assert set(parts) == {"tmc"}
+    assert parts["tmc"].interface is None
+
+
+def test_split_slices_bytes_by_byte_offset():
+    """
+    Verify that blocks of bytes input are sliced at byte offsets when text
+    before and inside them is not ASCII.
+    """
+    data = {
+        "interface": "https://schema.skao.int/ska-tmc-configure/4.2",
+        "pointing": {"target": {"target_name": 'Ørsted }] \\" ü'}},
+        "tmc": {"scan_duration": 1.0, "note": ["é", {"ö": "[{"}]},
+        "sdp": {"scan_type": "\u00e9"},
+    }
+    json_bytes = json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+    parts = split_subsystems(json_bytes)
+
+    assert set(parts) == {"pointing", "tmc", "sdp"}
+    for key, part in parts.items():
+        assert json.loads(bytes(part.json)) == data[key] == part.value
+
+
+def test_split_takes_last_of_repeated_blocks():
+    """
+    Verify that a block given more than once is taken from its last
+    occurrence, as json.loads would, and that a later null removes it.
+    """
+    json_str = (
+        '{"interface": "https://schema.skao.int/ska-tmc-configure/4.2",'
+        ' "tmc": {"scan_duration": 1.0}, "sdp": {"scan_type": "a"},'
+        ' "tmc": {"scan_duration": 2.0}, "sdp": null}'
+    )
+    parts = split_subsystems(json_str)
+
+    assert set(parts) == {"tmc"}
+    assert parts["tmc"].value == json.loads(json_str)["tmc"]
+
+
+def test_split_rejects_unknown_interface():
+    with pytest.raises(UnknownInterface):
+        split_subsystems('{"interface": "https://schema.skao.int/nope/1.0"}')
+
+
+@patch("ska_tmc_cdm.schemas.codec.Codec._telmodel_validation")
+def test_codec_split_validates_each_part(fake_validation):
+    """
+    Verify that Codec.split validates each part against its own interface.
+    """
+    _, json_str, _ = SPLIT_PARAMETERS[-1]
+
+    parts = CODEC.split(json_str, strictness=2)
+
+    assert fake_validation.call_args_list == [
+        call(True, part.value, 2) for part in parts.values()
+    ]
+    assert parts["csp"].value["interface"] in (
+        call_args.args[1].get("interface")
+        for call_args in fake_validation.call_args_list
+    )
+
+
+def test_codec_split_rejects_invalid_part():
+    """
+    Verify that Codec.split raises for an invalid part only when
+    validation is enabled.
+    """
+    _, json_str, _ = SPLIT_PARAMETERS[-1]
+    data = json.loads(json_str)
+    data["csp"]["common"] = "not an object"
+    json_str = json.dumps(data)
+
+    assert CODEC.split(json_str, ConfigureRequest, validate=False)
+    with pytest.raises(ValidationError):
+        CODEC.split(json_str, ConfigureRequest, validate=True)
+
+
+def test_codec_split_assign_resources_aliases():
+    """
+    Verify that blocks given under alternative keys are returned under
+    their serialised name.
+    """
+    json_str = json.dumps(
+        {"subarray_id": 1, "dish_allocation": {"receptor_ids": ["SKA001"]}}
+    )
+
+    parts = CODEC.split(json_str, AssignResourcesRequest, validate=True)
+
+    assert list(parts) == ["dish"]
+    assert parts["dish"].field == "dish"
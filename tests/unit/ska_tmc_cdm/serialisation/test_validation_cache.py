@@ -0,0 +1,143 @@
+"""
+Unit tests for the ska_tmc_cdm.schemas.validation_cache module.
+"""
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ska_tmc_cdm.exceptions import JsonValidationError, SchemaNotFound
+from ska_tmc_cdm.jsonschema.tmdata_cache import TMDATA_CACHE
+from ska_tmc_cdm.schemas import CODEC
+from ska_tmc_cdm.schemas.validation_cache import ValidationCache
+from tests.unit.ska_tmc_cdm.serialisation.test_codec import TEST_PARAMETERS
+
+DATA = {"interface": "https://schema.skao.int/foo/1.0", "a": [1, 2]}
+
+
+def test_cache_reuses_verdict_for_identical_content():
+    """
+    Verify that validation runs once for data with identical content,
+    regardless of key order.
+    """
+    cache = ValidationCache(maxsize=10)
+    validate_fn = Mock()
+
+    cache.validate(DATA, 2, validate_fn)
+    cache.validate(json.loads(json.dumps(DATA)), 2, validate_fn)
+    cache.validate(dict(reversed(DATA.items())), 2, validate_fn)
+
+    validate_fn.assert_called_once()
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+
+def test_cache_key_includes_strictness_and_data_version():
+    """
+    Verify that verdicts are not shared between strictness levels or
+    telescope model data versions.
+    """
+    cache = ValidationCache(maxsize=10)
+    validate_fn = Mock()
+
+    cache.validate(DATA, 1, validate_fn)
+    cache.validate(DATA, 2, validate_fn)
+    TMDATA_CACHE.invalidate()
+    cache.validate(DATA, 2, validate_fn)
+
+    assert validate_fn.call_count == 3
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        JsonValidationError(ValueError("bad"), DATA["interface"], DATA),
+        SchemaNotFound(DATA["interface"]),
+    ],
+)
+def test_cache_replays_failures(exc):
+    """
+    Verify that a cached failure is raised again as an equivalent exception.
+    """
+    cache = ValidationCache(maxsize=10)
+    validate_fn = Mock(side_effect=exc)
+
+    for _ in range(2):
+        with pytest.raises(type(exc)) as exc_info:
+            cache.validate(DATA, 2, validate_fn)
+        assert str(exc_info.value) == str(exc)
+        assert exc_info.value.uri == exc.uri
+
+    validate_fn.assert_called_once()
+
+
+def test_cache_does_not_store_unexpected_errors():
+    """
+    Verify that errors other than validation failures are not cached.
+    """
+    cache = ValidationCache(maxsize=10)
+    validate_fn = Mock(side_effect=[OSError("no data"), None])
+
+    with pytest.raises(OSError):
+        cache.validate(DATA, 2, validate_fn)
+    cache.validate(DATA, 2, validate_fn)
+
+    assert validate_fn.call_count == 2
+
+
+def test_cache_evicts_least_recently_used():
+    """
+    Verify that the cache is bounded and evicts the least recently used
+    verdict.
+    """
+    cache = ValidationCache(maxsize=2)
+    validate_fn = Mock()
+    first, second, third = ({"interface": str(i)} for i in range(3))
+
+    cache.validate(first, 2, validate_fn)
+    cache.validate(second, 2, validate_fn)
+    cache.validate(first, 2, validate_fn)
+    cache.validate(third, 2, validate_fn)
+    cache.validate(second, 2, validate_fn)
+
+    assert validate_fn.call_count == 4
+    info = cache.cache_info()
+    assert (info.evictions, info.currsize) == (2, 2)
+
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 0, 2, 0)
+
+
+def test_disabled_cache_always_validates():
+    """
+    Verify that a cache with maxsize=0 does not store verdicts.
+    """
+    cache = ValidationCache(maxsize=0)
+    validate_fn = Mock()
+
+    cache.validate(DATA, 2, validate_fn)
+    cache.validate(DATA, 2, validate_fn)
+
+    assert validate_fn.call_count == 2
+    assert cache.cache_info().currsize == 0
+
+
+@patch("ska_tmc_cdm.schemas.codec.semantic_validate_json")
+@patch("ska_tmc_cdm.schemas.codec.validate_json")
+def test_codec_consults_validation_cache(
+    fake_validate_json, fake_semantic_validate_json
+):
+    """
+    Verify that the codec only validates a repeated message once when the
+    validation cache is enabled.
+    """
+    cls, json_str, _, _ = TEST_PARAMETERS[1]
+    with patch(
+        "ska_tmc_cdm.schemas.codec.VALIDATION_CACHE",
+        ValidationCache(maxsize=10),
+    ):
+        for _ in range(3):
+            CODEC.loads(cls, json_str, strictness=2)
+
+    fake_validate_json.assert_called_once()
+    fake_semantic_validate_json.assert_called_once()
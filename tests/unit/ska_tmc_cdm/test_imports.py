@@ -0,0 +1,78 @@
+"""
+Import-time tests for the ska_tmc_cdm package, run in a fresh interpreter
+as this one has imported everything already.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def _modules_after_import(statement: str) -> set[str]:
+    """
+    Return the names of the top-level packages imported by a statement.
+    """
+    script = f"import sys; {statement}; print(' '.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", script],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    )
+    return {name.partition(".")[0] for name in result.stdout.split()}
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import ska_tmc_cdm",
+        "from ska_tmc_cdm.messages.subarray_node.configure import "
+        "ConfigureRequest",
+        "from ska_tmc_cdm.messages.subarray_node.configure.core import "
+        "Target; Target(ra='21:08:47.92', dec='-88:57:22.9').model_dump()",
+    ],
+)
+def test_astropy_is_not_imported(statement):
+    """
+    Verify astropy is only imported once a coordinate needs it.
+    """
+    assert "astropy" not in _modules_after_import(statement)
+
+
+def test_astropy_is_imported_for_frame_changes():
+    modules = _modules_after_import(
+        "from ska_tmc_cdm.messages.subarray_node.configure.core import "
+        "FK5Target; FK5Target(ra=1.0, dec=2.0).model_dump()"
+    )
+    assert "astropy" in modules
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import ska_tmc_cdm",
+        "import ska_tmc_cdm.exceptions",
+        "from ska_tmc_cdm.messages.subarray_node.configure import "
+        "ConfigureRequest, TMCConfiguration; "
+        "from ska_tmc_cdm.schemas import CODEC; "
+        "CODEC.dumps(ConfigureRequest(interface='x', "
+        "tmc=TMCConfiguration(partial_configuration=True)), validate=False)",
+    ],
+)
+def test_validation_libraries_are_not_imported(statement):
+    """
+    Verify ska_telmodel and ska_ost_osd are only imported on validation.
+    """
+    modules = _modules_after_import(statement)
+    assert "ska_telmodel" not in modules
+    assert "ska_ost_osd" not in modules
+
+
+def test_validation_libraries_are_imported_on_validation():
+    modules = _modules_after_import(
+        "from ska_tmc_cdm.jsonschema.json_schema import JsonSchema; "
+        "JsonSchema.validate_schema('https://schema.skao.int/unknown/1.0', {})"
+    )
+    assert "ska_telmodel" in modules